@@ -1,5 +1,6 @@
 import string
 from collections import Counter
+from collections.abc import Iterable
 from pathlib import Path
 
 import elf
@@ -10,7 +11,7 @@ from elf.templates.args import args
 
 
 @elf.timer()
-def part1(data: list[str]) -> int | str:
+def part1(data: Iterable[str]) -> int | str:
     """🎅 Solve Part 1 of the puzzle 🎅"""
 
     answer = 0
@@ -39,7 +40,7 @@ def part1(data: list[str]) -> int | str:
 
 
 @elf.timer()
-def part2(data: list[str]) -> int | str:
+def part2(data: Iterable[str]) -> int | str:
     """🎅 Solve Part 2 of the puzzle 🎅"""
 
     letters = list(string.ascii_lowercase)
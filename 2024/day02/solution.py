@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from pathlib import Path
 
 import elf
@@ -7,25 +8,6 @@ from elf.templates.args import args
 # Let's solve today's challenge with a festive coding spirit! 🎅
 
 
-@elf.timer()
-def part1(data: list[str]) -> int | str:
-    """🎅 Solve Part 1 of the puzzle 🎅"""
-    levels = [[int(y) for y in x.split(" ")] for x in data]
-    safe_levels = 0
-    for level in levels:
-        if level != sorted(level) and level != sorted(level, reverse=True):
-            continue
-        safe = True
-        for i, l in enumerate(level):
-            if i + 1 < len(level):
-                if l == level[i + 1] or abs(l - level[i + 1]) > 3:
-                    safe = False
-                    break
-        if safe:
-            safe_levels += 1
-    return safe_levels
-
-
 def safe_level(level: list[int]) -> bool:
     if level != sorted(level) and level != sorted(level, reverse=True):
         return False
@@ -39,19 +21,24 @@ def safe_level(level: list[int]) -> bool:
     return True
 
 
+def safe_with_dampener(level: list[int]) -> bool:
+    """Checks whether the report is safe once at most one level is removed."""
+    return any(
+        safe_level(level[:index] + level[index + 1 :]) for index in range(len(level))
+    )
+
+
+@elf.timer()
+def part1(data: Iterable[str]) -> int | str:
+    """🎅 Solve Part 1 of the puzzle 🎅"""
+    # Each report is checked on its own, so the input is streamed line by line
+    return sum(safe_level([int(x) for x in line.split()]) for line in data)
+
+
 @elf.timer()
-def part2(data: list[str]) -> int | str:
+def part2(data: Iterable[str]) -> int | str:
     """🎅 Solve Part 2 of the puzzle 🎅"""
-    levels = [[int(y) for y in x.split(" ")] for x in data]
-    safe_levels = 0
-    for level in levels:
-        for index, _ in enumerate(levels):
-            level_check = [value for i, value in enumerate(level) if i != index]
-            if safe_level(level_check):
-                safe_levels += 1
-                break
-
-    return safe_levels
+    return sum(safe_with_dampener([int(x) for x in line.split()]) for line in data)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,63 @@
+import random
+import sys
+import time
+from collections.abc import Callable
+
+from solution import (
+    Grid,
+    count_x_mas,
+    count_x_mas_numpy,
+    count_xmas,
+    count_xmas_numpy,
+    load_numpy,
+)
+
+# ⏱️ Scaling benchmark for the day04 scanners on synthetic grids ⏱️ #
+#
+# Run with: python 2024/day04/scaling.py [max_size]
+#
+# Each size doubles the side of the grid, so a linear scanner should show a
+# roughly constant time per cell down each column.
+
+DEFAULT_MAX_SIZE = 5000
+
+
+def make_grid(size: int, seed: int = 2024) -> Grid:
+    """Builds a random size x size grid of the letters XMAS."""
+    table = bytes(b"XMAS"[i & 3] for i in range(256))
+    text = random.Random(seed).randbytes(size * size).translate(table).decode()
+    return Grid.parse([text[row * size : (row + 1) * size] for row in range(size)])
+
+
+def measure(func: Callable[[Grid], int], grid: Grid) -> float:
+    start_time = time.perf_counter()
+    func(grid)
+    return time.perf_counter() - start_time
+
+
+def main(max_size: int = DEFAULT_MAX_SIZE) -> None:
+    scanners = [("part1", count_xmas), ("part2", count_x_mas)]
+    if load_numpy() is not None:
+        scanners += [
+            ("part1 numpy", count_xmas_numpy),
+            ("part2 numpy", count_x_mas_numpy),
+        ]
+
+    sizes = []
+    size = max_size
+    while size >= 500 and len(sizes) < 4:
+        sizes.insert(0, size)
+        size //= 2
+
+    print(f"{'Size':>11}" + "".join(f"{name:>16}" for name, _ in scanners))
+    for size in sizes:
+        grid = make_grid(size)
+        row = f"{size:>5}x{size:<5}"
+        for _, scanner in scanners:
+            seconds = measure(scanner, grid)
+            row += f"{seconds * 1e9 / (size * size):>11.1f}ns/c"
+        print(row)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_MAX_SIZE)
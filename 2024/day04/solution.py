@@ -1,67 +1,138 @@
+from collections.abc import Callable
 from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING
 
 import elf
+from elf.grid import Grid
 from elf.templates.args import args
 
+if TYPE_CHECKING:
+    import numpy as np
+
 # 🎄 Welcome to Advent of Code! 🎄
 # Let's solve today's challenge with a festive coding spirit! 🎅
 
-directions = {
-    "right": (0, 1),
-    "left": (0, -1),
-    "up": (-1, 0),
-    "down": (1, 0),
-    "up-right": (-1, 1),
-    "up-left": (-1, -1),
-    "down-right": (1, 1),
-    "down-left": (1, -1),
-}
+X, M, A, S = b"XMAS"
+
+# Grids smaller than this are faster in plain Python than with NumPy's per-call overhead
+NUMPY_MIN_CELLS = 100_000
+
 
+def count_xmas(grid: Grid) -> int:
+    """Counts XMAS in all eight directions, anchored on each 'X'.
 
-def move_in_grid(grid, direction):
-    d = directions[direction]
+    The first step off the map lands on the grid's sentinel border and fails
+    the comparison, so no bounds checks are needed.
+    """
+    cells = grid.cells
     count = 0
-    word_length = 4
-    for i, row in enumerate(grid):
-        for j, col in enumerate(row):
-            result = []
-            for step in range(word_length):
-                new_i = i + step * d[0]
-                new_j = j + step * d[1]
-
-                if 0 <= new_i < len(grid) and 0 <= new_j < len(grid[0]):
-                    result.append(grid[new_i][new_j])
-                else:
-                    break
-
-            if "".join(result) == "XMAS":
+    for index in grid.find_all("X"):
+        for offset in grid.offsets8:
+            if (
+                cells[index + offset] == M
+                and cells[index + 2 * offset] == A
+                and cells[index + 3 * offset] == S
+            ):
                 count += 1
+    return count
+
 
+def count_x_mas(grid: Grid) -> int:
+    """Counts MAS crosses, anchored on each 'A'."""
+    cells = grid.cells
+    up_left, up_right = -grid.stride - 1, -grid.stride + 1
+    count = 0
+    for index in grid.find_all("A"):
+        a, b = cells[index + up_left], cells[index - up_left]
+        c, d = cells[index + up_right], cells[index - up_right]
+        if (a == M and b == S or a == S and b == M) and (
+            c == M and d == S or c == S and d == M
+        ):
+            count += 1
     return count
 
 
+def load_numpy() -> ModuleType | None:
+    """Imports NumPy on first use, so puzzle-sized grids never pay for loading it."""
+    try:
+        import numpy
+    except ImportError:  # NumPy is optional
+        return None
+    return numpy
+
+
+def _shifted_views(grid: Grid, reach: int) -> "Callable[[int, int], np.ndarray]":
+    np = load_numpy()
+    # Pad the map with `reach` zero cells, so every shift stays inside the array
+    core = np.frombuffer(grid.cells, dtype=np.uint8).reshape(
+        grid.height + 2, grid.stride
+    )[1:-1, 1:-1]
+    padded = np.pad(core, reach)
+
+    def view(dr: int, dc: int) -> np.ndarray:
+        return padded[
+            reach + dr : reach + dr + grid.height, reach + dc : reach + dc + grid.width
+        ]
+
+    return view
+
+
+def count_xmas_numpy(grid: Grid) -> int:
+    """Counts XMAS by comparing shifted views of the whole grid at once."""
+    np = load_numpy()
+    view = _shifted_views(grid, 3)
+    anchors = view(0, 0) == X
+    count = 0
+    for dr in (-1, 0, 1):
+        for dc in (-1, 0, 1):
+            if dr or dc:
+                count += np.count_nonzero(
+                    anchors
+                    & (view(dr, dc) == M)
+                    & (view(2 * dr, 2 * dc) == A)
+                    & (view(3 * dr, 3 * dc) == S)
+                )
+    return int(count)
+
+
+def count_x_mas_numpy(grid: Grid) -> int:
+    """Counts MAS crosses by comparing shifted views of the whole grid at once."""
+    np = load_numpy()
+    view = _shifted_views(grid, 1)
+    up_left, down_right = view(-1, -1), view(1, 1)
+    up_right, down_left = view(-1, 1), view(1, -1)
+    falling = ((up_left == M) & (down_right == S)) | (
+        (up_left == S) & (down_right == M)
+    )
+    rising = ((up_right == M) & (down_left == S)) | ((up_right == S) & (down_left == M))
+    return int(np.count_nonzero((view(0, 0) == A) & falling & rising))
+
+
+def use_numpy(grid: Grid) -> bool:
+    return grid.width * grid.height >= NUMPY_MIN_CELLS and load_numpy() is not None
+
+
 @elf.timer()
-def part1(data: list[str]) -> int | str:
-    """🎅 Solve Part 1 of the puzzle 🎅"""
-    grid = [list(x) for x in data]
+def parse(data: list[str]) -> Grid:
+    """🎁 Parse the word search into a flat, bordered grid 🎁"""
+    return Grid.parse(data)
 
-    answer = 0
-    for direction in directions.keys():
-        ans = move_in_grid(grid, direction=direction)
-        answer += ans
 
-    return answer
+@elf.timer()
+def part1(data: Grid) -> int | str:
+    """🎅 Solve Part 1 of the puzzle 🎅"""
+    return count_xmas_numpy(data) if use_numpy(data) else count_xmas(data)
 
 
 @elf.timer()
-def part2(data: list[str]) -> int | str:
+def part2(data: Grid) -> int | str:
     """🎅 Solve Part 2 of the puzzle 🎅"""
-    # TODO: Implement the solution for Part 2
-    return len(data)
+    return count_x_mas_numpy(data) if use_numpy(data) else count_x_mas(data)
 
 
 if __name__ == "__main__":
     base_dir = Path(__file__).parent
 
     # Run the arguments handler to test, fetch input, and/or submit answers
-    args(part1=part1, part2=part2, base_dir=base_dir)
+    args(part1=part1, part2=part2, base_dir=base_dir, parse=parse)
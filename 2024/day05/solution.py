@@ -1,4 +1,6 @@
-from collections import defaultdict
+from dataclasses import dataclass
+from functools import cmp_to_key
+from itertools import pairwise
 from pathlib import Path
 
 import elf
@@ -8,105 +10,72 @@ from elf.templates.args import args
 # Let's solve today's challenge with a festive coding spirit! 🎅
 
 
+@dataclass(frozen=True, slots=True)
+class Manual:
+    # Every "before|after" rule as a (before, after) pair
+    rules: set[tuple[int, int]]
+    updates: list[list[int]]
+
+
 @elf.timer()
-def part1(data: list[str]) -> int | str:
-    """🎅 Solve Part 1 of the puzzle 🎅"""
+def parse(data: list[str]) -> Manual:
+    """🎁 Parse the ordering rules into a pair set, and the updates into page lists 🎁"""
+    rules = set()
+    updates = []
+    for line in data:
+        if "|" in line:
+            before, after = line.split("|")
+            rules.add((int(before), int(after)))
+        elif line:
+            updates.append([int(page) for page in line.split(",")])
+    return Manual(rules, updates)
 
-    rules_parse, updates_parse = (
-        [x.split(sep="|") for x in data if "|" in x and x],
-        [x.split(sep=",") for x in data if "|" not in x and x],
-    )
-    rules_int = [map(int, x) for x in rules_parse]
 
-    rules = defaultdict(list)
-    for k, v in rules_int:
-        rules[k].append(v)
+def is_ordered(update: list[int], rules: set[tuple[int, int]]) -> bool:
+    """Checks that a rule puts each page before the next one.
 
-    updates = [list(map(int, x)) for x in updates_parse]
+    The rules order every pair of pages within an update, so checking adjacent
+    pages is enough for the whole update to be in order.
+    """
+    return all(pair in rules for pair in pairwise(update))
 
-    right_order_updates = []
 
-    for update in updates:
-        correct_update = True
-        update_copy = update.copy()
-        for page in update:
-            update_copy.remove(page)
-            rule = sorted(rules[page])
-            if update_copy:
-                if not all(item in rule for item in update_copy):
-                    correct_update = False
-                    break
-        if correct_update is True:
-            right_order_updates.append(update)
+def reorder(update: list[int], rules: set[tuple[int, int]]) -> list[int]:
+    """Sorts an update's pages using the rules as the comparison."""
 
-    middle_numbers_sum = sum([lst[len(lst) // 2] for lst in right_order_updates])
+    def compare(a: int, b: int) -> int:
+        if (a, b) in rules:
+            return -1
+        if (b, a) in rules:
+            return 1
+        return 0
 
-    return middle_numbers_sum
+    return sorted(update, key=cmp_to_key(compare))
 
 
 @elf.timer()
-def part2(data: list[str]) -> int | str:
-    """🎅 Solve Part 2 of the puzzle 🎅"""
-    rules_parse, updates_parse = (
-        [x.split(sep="|") for x in data if "|" in x and x],
-        [x.split(sep=",") for x in data if "|" not in x and x],
+def part1(data: Manual) -> int | str:
+    """🎅 Solve Part 1 of the puzzle 🎅"""
+    return sum(
+        update[len(update) // 2]
+        for update in data.updates
+        if is_ordered(update, data.rules)
     )
-    rules_int = [map(int, x) for x in rules_parse]
-
-    rules = defaultdict(list)
-    for k, v in rules_int:
-        rules[k].append(v)
-
-    updates = [list(map(int, x)) for x in updates_parse]
-
-    wrong_order_updates = []
-
-    correct_order_updates = []
-    for update in updates:
-        correct_update = True
-        update_copy = update.copy()
-        for page in update:
-            update_copy.remove(page)
-            rule = sorted(rules[page])
-            if update_copy:
-                if not all(item in rule for item in update_copy):
-                    correct_update = False
-                    break
-        if correct_update is False:
-            wrong_order_updates.append(update)
-
-    for wrong_update in wrong_order_updates:
-        filtered_rules = {
-            key: value
-            for key, value in rules.items()
-            if any(v in wrong_update for v in value)
-        }
-
-        primary_sort = sorted(
-            wrong_update,
-            key=lambda x: 0
-            if any(x in value for value in filtered_rules.values())
-            else 1,
-        )
-
-        sorted_numbers = sorted(
-            primary_sort,
-            key=lambda x: (
-                next((k for k, v in filtered_rules.items() if x in v), float("inf")),
-                x,
-            ),
-            reverse=True,
-        )
-
-        correct_order_updates.append(sorted_numbers)
-
-    middle_numbers_sum = sum([lst[len(lst) // 2] for lst in correct_order_updates])
-
-    return middle_numbers_sum
+
+
+@elf.timer()
+def part2(data: Manual) -> int | str:
+    """🎅 Solve Part 2 of the puzzle 🎅"""
+    total = 0
+    for update in data.updates:
+        if not is_ordered(update, data.rules):
+            repaired = reorder(update, data.rules)
+            total += repaired[len(repaired) // 2]
+    return total
 
 
 if __name__ == "__main__":
     base_dir = Path(__file__).parent
 
     # Run the arguments handler to test, fetch input, and/or submit answers
-    args(part1=part1, part2=part2, base_dir=base_dir)
+    args(part1=part1, part2=part2, base_dir=base_dir, parse=parse)
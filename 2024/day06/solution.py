@@ -1,95 +1,190 @@
+from bisect import bisect_left
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 import elf
+from elf.grid import SENTINEL, Grid
+from elf.parallel import map_in_processes
 from elf.templates.args import args
 
 # 🎄 Welcome to Advent of Code! 🎄
 # Let's solve today's challenge with a festive coding spirit! 🎅
 
+WALL = ord("#")
+UP, RIGHT, DOWN, LEFT = range(4)  # The order of `Grid.offsets4`, so turning right is +1
 
-def display_grid(grid):
-    for row in grid:
-        print("".join(row))
-    print()
-
-
-def move_in_grid(grid) -> bool:
-    bounds = True
-    for i, row in enumerate(grid):
-        # Handle "^" (moving up)
-        if "^" in row:
-            col = row.index("^")
-            grid[i][col] = "X"
-            if i - 1 >= 0:
-                if grid[i - 1][col] == "#":
-                    grid[i][col] = ">"
-                else:
-                    grid[i - 1][col] = "^"
-            else:
-                bounds = False
-
-        # Handle "v" (moving down)
-        elif "v" in row:
-            col = row.index("v")
-            grid[i][col] = "X"
-            if i + 1 < len(grid):
-                if grid[i + 1][col] == "#":
-                    grid[i][col] = "<"
-                else:
-                    grid[i + 1][col] = "v"
-            else:
-                bounds = False
-
-        # Handle ">" (moving right)
-        elif ">" in row:
-            col = row.index(">")
-            grid[i][col] = "X"
-            if col + 1 < len(grid[i]):
-                if grid[i][col + 1] == "#":
-                    grid[i][col] = "v"
-                else:
-                    grid[i][col + 1] = ">"
-            else:
-                bounds = False
-
-        # Handle "<" (moving right)
-        elif "<" in row:
-            col = row.index("<")
-            grid[i][col] = "X"
-            if col - 1 < len(grid[i]):
-                if grid[i][col - 1] == "#":
-                    grid[i][col] = "^"
-                else:
-                    grid[i][col - 1] = "<"
-            else:
-                bounds = False
-
-    return bounds
+# Below this many candidate obstructions, starting a process pool costs more than it saves
+PARALLEL_THRESHOLD = 1000
+
+
+@dataclass(frozen=True, slots=True)
+class Lab:
+    grid: Grid
+    start: int
+    # Sorted obstacle columns of each row and obstacle rows of each column
+    walls_by_row: list[list[int]]
+    walls_by_col: list[list[int]]
 
 
 @elf.timer()
-def part1(data: list[str]) -> int | str:
-    """🎅 Solve Part 1 of the puzzle 🎅"""
-    grid = [list(x) for x in data]
-    continue_move = True
-    while continue_move:
-        continue_move = move_in_grid(grid)
-        # display_grid(grid)
+def parse(data: list[str]) -> Lab:
+    """🎁 Parse the lab map and index its obstacles by row and column 🎁"""
+    grid = Grid.parse(data)
+    walls_by_row: list[list[int]] = [[] for _ in range(grid.height)]
+    walls_by_col: list[list[int]] = [[] for _ in range(grid.width)]
+    # find_all scans in reading order, so both tables come out sorted
+    for index in grid.find_all("#"):
+        row, col = grid.position(index)
+        walls_by_row[row].append(col)
+        walls_by_col[col].append(row)
+    return Lab(grid, grid.find("^"), walls_by_row, walls_by_col)
+
+
+def walk(lab: Lab) -> list[tuple[int, int]]:
+    """Follows the guard off the map.
+
+    Returns every distinct cell in the order it was first reached, with the
+    direction the guard was facing when it got there.
+
+    Raises:
+        ValueError: If the guard loops forever on the map as given.
+    """
+    cells, offsets = lab.grid.cells, lab.grid.offsets4
+    seen = lab.grid.bitmap()
+    position, direction = lab.start, UP
+    seen.add(position)
+    path = [(position, direction)]
+    # Every turn is a (cell, direction) state; seeing one twice means a loop
+    turns = bytearray(len(cells))
+    while True:
+        ahead = position + offsets[direction]
+        cell = cells[ahead]
+        if cell == SENTINEL:
+            return path
+        if cell == WALL:
+            bit = 1 << direction
+            if turns[position] & bit:
+                raise ValueError("❗ The guard never leaves the map.")
+            turns[position] |= bit
+            direction = (direction + 1) & 3
+            continue
+        position = ahead
+        if position not in seen:
+            seen.add(position)
+            path.append((position, direction))
+
+
+def is_loop(
+    lab: Lab, row: int, col: int, direction: int, block_row: int, block_col: int
+) -> bool:
+    """Checks whether the guard loops once an obstruction is put at (block_row, block_col).
+
+    The guard jumps from wall to wall using the sorted obstacle tables, so each
+    move costs one bisect instead of one step per cell. Only the states where
+    it stops against a wall are recorded, as one direction bit per cell.
+    """
+    width, height = lab.grid.width, lab.grid.height
+    walls_by_row, walls_by_col = lab.walls_by_row, lab.walls_by_col
+    seen = bytearray(width * height)
+    while True:
+        if direction == UP:
+            walls = walls_by_col[col]
+            k = bisect_left(walls, row) - 1
+            stop = walls[k] if k >= 0 else -1
+            if block_col == col and stop < block_row < row:
+                stop = block_row
+            if stop < 0:
+                return False
+            row = stop + 1
+        elif direction == RIGHT:
+            walls = walls_by_row[row]
+            k = bisect_left(walls, col)
+            stop = walls[k] if k < len(walls) else width
+            if block_row == row and col < block_col < stop:
+                stop = block_col
+            if stop >= width:
+                return False
+            col = stop - 1
+        elif direction == DOWN:
+            walls = walls_by_col[col]
+            k = bisect_left(walls, row)
+            stop = walls[k] if k < len(walls) else height
+            if block_col == col and row < block_row < stop:
+                stop = block_row
+            if stop >= height:
+                return False
+            row = stop - 1
+        else:
+            walls = walls_by_row[row]
+            k = bisect_left(walls, col) - 1
+            stop = walls[k] if k >= 0 else -1
+            if block_row == row and stop < block_col < col:
+                stop = block_col
+            if stop < 0:
+                return False
+            col = stop + 1
+
+        state = row * width + col
+        bit = 1 << direction
+        if seen[state] & bit:
+            return True
+        seen[state] |= bit
+        direction = (direction + 1) & 3
+
+
+# Set in each worker process by `_init_worker`, so the lab is sent once per worker
+_worker_lab: Lab | None = None
+
+
+def _init_worker(lab: Lab) -> None:
+    global _worker_lab
+    _worker_lab = lab
+
+
+def _is_loop(candidate: tuple[int, int, int, int, int]) -> bool:
+    return is_loop(_worker_lab, *candidate)
+
+
+def count_loops(lab: Lab, candidates: list[tuple[int, int, int, int, int]]) -> int:
+    """Counts the candidates that trap the guard, spread over a process pool."""
+    return sum(
+        map_in_processes(
+            _is_loop,
+            candidates,
+            PARALLEL_THRESHOLD,
+            initializer=_init_worker,
+            initargs=(lab,),
+        )
+    )
 
-    positions = sum([row.count("X") for row in grid if "X" in row])
 
-    return positions
+@elf.timer()
+def part1(data: Lab, context: dict[str, Any]) -> int | str:
+    """🎅 Solve Part 1 of the puzzle 🎅"""
+    context["path"] = walk(data)
+    return len(context["path"])
 
 
 @elf.timer()
-def part2(data: list[str]) -> int | str:
+def part2(data: Lab, context: dict[str, Any]) -> int | str:
     """🎅 Solve Part 2 of the puzzle 🎅"""
-    # TODO: Implement the solution for Part 2
-    return len(data)
+    path = context.get("path") or walk(data)
+    grid, offsets = data.grid, data.grid.offsets4
+
+    # Only cells on the original path can change the guard's route. Each check
+    # starts just before the guard first reaches the new obstruction, since the
+    # walk up to there is unaffected.
+    candidates = []
+    for block, direction in path[1:]:
+        row, col = grid.position(block - offsets[direction])
+        candidates.append((row, col, direction, *grid.position(block)))
+
+    return count_loops(data, candidates)
 
 
 if __name__ == "__main__":
     base_dir = Path(__file__).parent
 
     # Run the arguments handler to test, fetch input, and/or submit answers
-    args(part1=part1, part2=part2, base_dir=base_dir)
+    args(part1=part1, part2=part2, base_dir=base_dir, parse=parse)
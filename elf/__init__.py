@@ -1,15 +1,39 @@
 # 🎄 Elf Package Initialization 🎄 #
+#
+# The public API is loaded lazily: `import elf` stays cheap, and network
+# dependencies such as `requests` are only imported when a helper that needs
+# them is first used.
 
-from .answer import submit_answer
-from .exceptions import InputFetchError, SubmissionError
-from .input import get_input, read_input_file
-from .testing import check_part1_solution, check_part2_solution
-from .utils import parse_input, timer
+import importlib
+from typing import TYPE_CHECKING, Any
+
+__version__ = "0.1.0"
+
+_LAZY_ATTRIBUTES = {
+    "get_input": "elf.input",
+    "read_input_file": "elf.input",
+    "read_input_bytes": "elf.input",
+    "parse_input": "elf.utils",
+    "timer": "elf.utils",
+    "check_part1_solution": "elf.testing",
+    "check_part2_solution": "elf.testing",
+    "InputFetchError": "elf.exceptions",
+    "SubmissionError": "elf.exceptions",
+    "submit_answer": "elf.answer",
+}
+
+if TYPE_CHECKING:
+    from .answer import submit_answer
+    from .exceptions import InputFetchError, SubmissionError
+    from .input import get_input, read_input_bytes, read_input_file
+    from .testing import check_part1_solution, check_part2_solution
+    from .utils import parse_input, timer
 
 # Define the public API of the elf package
 __all__ = [
     "get_input",
     "read_input_file",
+    "read_input_bytes",
     "parse_input",
     "timer",
     "check_part1_solution",
@@ -18,3 +42,25 @@ __all__ = [
     "SubmissionError",
     "submit_answer",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(module_name), name)
+    else:
+        # Allow `elf.testing` and friends without an explicit submodule import
+        try:
+            value = importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -0,0 +1,176 @@
+import asyncio
+from collections.abc import Iterable
+
+import aiohttp
+
+from elf.answer import get_cached_submission_result, handle_submission_response
+from elf.client import AOC_BASE_URL, USER_AGENT
+from elf.config import (
+    get_cache_input_file,
+    get_http_pool_size,
+    get_http_timeout,
+    get_session_token,
+)
+from elf.exceptions import InputFetchError, SubmissionError
+from elf.models import SubmissionResult
+from elf.utils import atomic_write_text
+
+# 🎄 Elf Async Workshop: coroutine versions of the elf network helpers 🎄 #
+
+
+def create_session(session_token: str | None = None) -> aiohttp.ClientSession:
+    """
+    Create an `aiohttp.ClientSession` authenticated against Advent of Code.
+
+    Reuse one session for many calls to share its keep-alive connection pool.
+
+    Args:
+        session_token (Optional[str]): Your Advent of Code session token. If not provided,
+            it will be retrieved from the environment variable 'AOC_SESSION_COOKIE'.
+
+    Returns:
+        aiohttp.ClientSession: The session. Close it with `await session.close()`
+            or use it as an async context manager.
+    """
+    session_token = get_session_token(session_token)
+    return aiohttp.ClientSession(
+        base_url=AOC_BASE_URL,
+        headers={"Cookie": f"session={session_token}", "User-Agent": USER_AGENT},
+        timeout=aiohttp.ClientTimeout(total=get_http_timeout()),
+        connector=aiohttp.TCPConnector(limit=get_http_pool_size()),
+    )
+
+
+async def get_input(
+    year: int,
+    day: int,
+    session_token: str | None = None,
+    session: aiohttp.ClientSession | None = None,
+) -> str:
+    """
+    Fetch the Advent of Code puzzle input for a specific year and day.
+
+    🎄 The same as `elf.get_input`, but the elves don't block the event loop!
+
+    Args:
+        year (int): The year of the Advent of Code challenge.
+        day (int): The day of the Advent of Code challenge.
+        session_token (Optional[str]): Your Advent of Code session token. If not provided,
+            it will be retrieved from the environment variable 'AOC_SESSION_COOKIE'.
+        session (Optional[aiohttp.ClientSession]): A session from `create_session` to
+            reuse. If not provided, a temporary session is used.
+
+    Returns:
+        str: The puzzle input for the specified day.
+
+    Raises:
+        InputFetchError: If there is an issue fetching the puzzle input.
+        ValueError: If the session token is not provided and not found in the environment.
+    """
+    cache_file = get_cache_input_file(year, day)
+
+    if cache_file.exists():
+        return cache_file.read_text(encoding="utf-8").rstrip()
+
+    if session is None:
+        async with create_session(session_token) as new_session:
+            return await get_input(year, day, session=new_session)
+
+    try:
+        async with session.get(f"/{year}/day/{day}/input") as response:
+            response.raise_for_status()
+            input_data = (await response.text()).rstrip()
+    except (TimeoutError, aiohttp.ClientError) as e:
+        raise InputFetchError(
+            f"🛑 Uh-oh! An error occurred while fetching the puzzle input: {e} ❄️"
+        ) from e
+
+    # Save the input data to cache
+    atomic_write_text(cache_file, input_data)
+
+    return input_data
+
+
+async def gather_inputs(
+    puzzles: Iterable[tuple[int, int]],
+    session_token: str | None = None,
+    max_concurrency: int = 4,
+) -> dict[tuple[int, int], str]:
+    """
+    Fetch many puzzle inputs concurrently over one shared session.
+
+    Args:
+        puzzles (Iterable[tuple[int, int]]): The (year, day) pairs to fetch.
+        session_token (Optional[str]): Your Advent of Code session token. If not provided,
+            it will be retrieved from the environment variable 'AOC_SESSION_COOKIE'.
+        max_concurrency (int): Maximum number of requests in flight at once.
+
+    Returns:
+        dict[tuple[int, int], str]: The puzzle inputs keyed by (year, day).
+
+    Raises:
+        InputFetchError: If any of the puzzle inputs could not be fetched.
+    """
+    puzzles = list(puzzles)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async with create_session(session_token) as session:
+
+        async def fetch(year: int, day: int) -> str:
+            async with semaphore:
+                return await get_input(year, day, session=session)
+
+        inputs = await asyncio.gather(*(fetch(year, day) for year, day in puzzles))
+
+    return dict(zip(puzzles, inputs))
+
+
+async def submit_answer(
+    year: int,
+    day: int,
+    level: int,
+    answer: int | str,
+    session_token: str | None = None,
+    session: aiohttp.ClientSession | None = None,
+) -> SubmissionResult:
+    """
+    Submit an answer for a specific year, day, and level (part) to Advent of Code.
+
+    🎁 The same as `elf.submit_answer`, including the guess cache checks.
+
+    Args:
+        year (int): The year of the Advent of Code challenge.
+        day (int): The day of the challenge (1–25).
+        level (int): The level of the challenge (1 for Part 1, 2 for Part 2).
+        answer (int | str): Your answer to submit.
+        session_token (Optional[str]): Your session token. If not provided,
+            it will be retrieved from the environment variable 'AOC_SESSION_COOKIE'.
+        session (Optional[aiohttp.ClientSession]): A session from `create_session` to
+            reuse. If not provided, a temporary session is used.
+
+    Returns:
+        SubmissionResult: An object containing the result, message, guess, status, and cache info.
+
+    Raises:
+        SubmissionError: If there is an issue submitting the answer.
+    """
+    cached_result = get_cached_submission_result(year, day, level, answer)
+    if cached_result is not None:
+        return cached_result
+
+    if session is None:
+        async with create_session(session_token) as new_session:
+            return await submit_answer(year, day, level, answer, session=new_session)
+
+    data = {"level": str(level), "answer": str(answer)}
+
+    try:
+        async with session.post(f"/{year}/day/{day}/answer", data=data) as response:
+            response.raise_for_status()
+            html = await response.text()
+    except (TimeoutError, aiohttp.ClientError) as e:
+        raise SubmissionError(
+            f"🛑 Uh-oh! An error occurred while submitting your answer: {e} 🎁"
+        ) from e
+
+    return handle_submission_response(year, day, level, answer, html)
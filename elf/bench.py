@@ -0,0 +1,333 @@
+import copy
+import gc
+import inspect
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from elf.models import BenchmarkResult, MemoryUsage
+from elf.utils import TIMER_MARKER
+
+try:
+    import resource
+except ImportError:  # resource is Unix-only
+    resource = None
+
+# ⏱️ Elf Stopwatch Workshop: repeatable, statistical timing of solutions ⏱️ #
+
+
+def unwrap_timer(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Strips `@elf.timer()` wrappers so repeated runs don't print on every call.
+
+    Args:
+        func (Callable[..., Any]): A function, possibly decorated with `elf.timer`.
+
+    Returns:
+        Callable[..., Any]: The function underneath any timer wrappers.
+    """
+    return inspect.unwrap(func, stop=lambda f: not hasattr(f, TIMER_MARKER))
+
+
+@contextmanager
+def pinned_cpu(cpu: int | None) -> Iterator[None]:
+    """Pins the current process to one CPU core, restoring the old affinity on exit.
+
+    Does nothing if `cpu` is None or the platform has no `os.sched_setaffinity`.
+    """
+    if cpu is None or not hasattr(os, "sched_setaffinity"):
+        yield
+        return
+
+    previous = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, {cpu})
+    try:
+        yield
+    finally:
+        os.sched_setaffinity(0, previous)
+
+
+@contextmanager
+def gc_paused(enabled: bool = True) -> Iterator[None]:
+    """Collects garbage once, then keeps the collector off until the block exits."""
+    if not enabled:
+        yield
+        return
+
+    was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _max_rss_bytes() -> int | None:
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def measure_memory(
+    func: Callable[..., Any], *args: Any, **kwargs: Any
+) -> tuple[Any, MemoryUsage]:
+    """Runs a function once while tracking the memory it uses.
+
+    🧠 Reports the tracemalloc peak of Python allocations, the net change in
+    allocated blocks, and how much the process max RSS grew. tracemalloc slows
+    allocation-heavy code down, so don't trust timings taken during this run.
+
+    Args:
+        func (Callable[..., Any]): The function to measure.
+        *args (Any): Positional arguments for the function.
+        **kwargs (Any): Keyword arguments for the function.
+
+    Returns:
+        tuple[Any, MemoryUsage]: The function's result and its memory usage.
+            `max_rss_delta_bytes` is None on platforms without `resource`.
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline_traced, _ = tracemalloc.get_traced_memory()
+    rss_before = _max_rss_bytes()
+    blocks_before = sys.getallocatedblocks()
+
+    try:
+        result = func(*args, **kwargs)
+        blocks_after = sys.getallocatedblocks()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+
+    rss_after = _max_rss_bytes()
+    usage = MemoryUsage(
+        peak_bytes=max(0, peak - baseline_traced),
+        allocated_blocks=blocks_after - blocks_before,
+        max_rss_delta_bytes=(
+            rss_after - rss_before
+            if rss_before is not None and rss_after is not None
+            else None
+        ),
+    )
+    return result, usage
+
+
+def benchmark(
+    func: Callable[..., Any],
+    *args: Any,
+    warmup: int = 1,
+    repeat: int = 10,
+    disable_gc: bool = False,
+    cpu: int | None = None,
+    copy_input: bool = True,
+    memory: bool = False,
+    **kwargs: Any,
+) -> BenchmarkResult:
+    """Times a function over several runs and collects the timing distribution.
+
+    🎅 Each run gets a fresh deep copy of the arguments, so parts that sort or
+    pop from their input measure the same work every time. Copying happens
+    outside the timed region.
+
+    Args:
+        func (Callable[..., Any]): The function to time. `@elf.timer()` wrappers are stripped.
+        *args (Any): Positional arguments for the function.
+        warmup (int): Untimed runs before measuring, to warm caches and lazy imports.
+        repeat (int): Number of measured runs.
+        disable_gc (bool): Turn off the garbage collector while measuring.
+        cpu (Optional[int]): Pin the process to this CPU core while measuring (Linux only).
+        copy_input (bool): Deep copy the arguments before every run.
+        memory (bool): Make one extra, untimed run under `measure_memory`.
+        **kwargs (Any): Keyword arguments for the function.
+
+    Returns:
+        BenchmarkResult: The per-run timings in nanoseconds, the memory usage if
+            requested, and the result of the last run.
+
+    Raises:
+        ValueError: If `repeat` is less than 1 or `warmup` is negative.
+    """
+    if repeat < 1:
+        raise ValueError("❗ repeat must be at least 1.")
+    if warmup < 0:
+        raise ValueError("❗ warmup cannot be negative.")
+
+    target = unwrap_timer(func)
+    times_ns: list[int] = []
+    result = None
+
+    def fresh_arguments() -> tuple[tuple[Any, ...], dict[str, Any]]:
+        return copy.deepcopy((args, kwargs)) if copy_input else (args, kwargs)
+
+    with pinned_cpu(cpu):
+        for _ in range(warmup):
+            call_args, call_kwargs = fresh_arguments()
+            target(*call_args, **call_kwargs)
+
+        with gc_paused(disable_gc):
+            for _ in range(repeat):
+                call_args, call_kwargs = fresh_arguments()
+                start = time.perf_counter_ns()
+                result = target(*call_args, **call_kwargs)
+                times_ns.append(time.perf_counter_ns() - start)
+
+        usage = None
+        if memory:
+            call_args, call_kwargs = fresh_arguments()
+            _, usage = measure_memory(target, *call_args, **call_kwargs)
+
+    return BenchmarkResult(
+        name=getattr(func, "__name__", repr(func)),
+        warmup=warmup,
+        times_ns=tuple(times_ns),
+        memory=usage,
+        result=result,
+    )
+
+
+# What a solution's header imports: the package, the shared helpers and args()
+STARTUP_STATEMENT = (
+    "import elf; import elf.grid, elf.operators, elf.parsers; "
+    "from elf.templates.args import args"
+)
+
+
+def parse_import_times(stderr: str) -> list[tuple[str, int, int, int]]:
+    """Parses `python -X importtime` output.
+
+    Args:
+        stderr (str): The interpreter's stderr.
+
+    Returns:
+        list[tuple[str, int, int, int]]: (module, self µs, cumulative µs, nesting depth)
+            for every import, in the order they finished.
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        own, cumulative, name = line.removeprefix("import time:").split("|")
+        if not own.strip().isdigit():
+            continue  # The header line
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((name.strip(), int(own), int(cumulative), depth))
+    return imports
+
+
+def measure_startup(
+    statement: str = STARTUP_STATEMENT,
+    repeat: int = 5,
+    root: str | os.PathLike[str] | None = None,
+    package: str = "elf",
+) -> tuple[BenchmarkResult, list[tuple[str, int, int, int]]]:
+    """Measures how long a fresh interpreter spends importing a package.
+
+    🚀 Each run starts a new `python -X importtime` process and adds up the
+    cumulative import time of the top-level `package` imports made by
+    `statement`. Interpreter start-up and `site` are left out, so the number
+    only moves when our own imports change.
+
+    Args:
+        statement (str): The code to run, e.g. the imports at the top of a solution.
+        repeat (int): Number of fresh interpreters to measure.
+        root (Optional[PathLike]): Directory to put first on `PYTHONPATH`.
+        package (str): Only top-level imports of this package (and its submodules) count.
+
+    Returns:
+        tuple[BenchmarkResult, list[tuple[str, int, int, int]]]: The import times,
+            and every import the package triggered in the slowest run.
+
+    Raises:
+        subprocess.CalledProcessError: If the statement fails.
+    """
+    env = dict(os.environ)
+    if root is not None:
+        env["PYTHONPATH"] = os.pathsep.join(
+            filter(None, [os.fspath(root), env.get("PYTHONPATH")])
+        )
+
+    times_ns = []
+    slowest: list[tuple[str, int, int, int]] = []
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+        # Children are listed before their parent, so collect each top-level
+        # import's subtree and keep it if the root belongs to the package
+        package_imports: list[tuple[str, int, int, int]] = []
+        subtree: list[tuple[str, int, int, int]] = []
+        total_us = 0
+        for entry in parse_import_times(completed.stderr):
+            subtree.append(entry)
+            name, _, cumulative, depth = entry
+            if depth != 0:
+                continue
+            if name == package or name.startswith(f"{package}."):
+                package_imports.extend(subtree)
+                total_us += cumulative
+            subtree = []
+
+        if not times_ns or total_us * 1000 > max(times_ns):
+            slowest = package_imports
+        times_ns.append(total_us * 1000)
+
+    result = BenchmarkResult(
+        name=f"startup: {statement}", warmup=0, times_ns=tuple(times_ns)
+    )
+    return result, slowest
+
+
+def format_duration(nanoseconds: float) -> str:
+    """Formats nanoseconds with a readable unit, e.g. "1.23ms"."""
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("µs", 1e3)):
+        if nanoseconds >= scale:
+            return f"{nanoseconds / scale:.2f}{unit}"
+    return f"{nanoseconds:.0f}ns"
+
+
+def format_benchmark(result: BenchmarkResult) -> str:
+    """Formats a benchmark as a one-line summary of min/median/p95/stddev."""
+    return (
+        f"⏱️ Function '{result.name}' over {result.repeat} runs "
+        f"({result.warmup} warmup): "
+        f"min {format_duration(result.min_ns)}, "
+        f"median {format_duration(result.median_ns)}, "
+        f"p95 {format_duration(result.p95_ns)}, "
+        f"stddev {format_duration(result.stddev_ns)} 🎅."
+    )
+
+
+def format_bytes(size: float) -> str:
+    """Formats a byte count with a readable unit, e.g. "1.5 MiB"."""
+    for unit, scale in (("GiB", 1 << 30), ("MiB", 1 << 20), ("KiB", 1 << 10)):
+        if abs(size) >= scale:
+            return f"{size / scale:.1f} {unit}"
+    return f"{size:.0f} B"
+
+
+def format_memory(name: str, usage: MemoryUsage) -> str:
+    """Formats memory usage as a one-line summary."""
+    rss = (
+        format_bytes(usage.max_rss_delta_bytes)
+        if usage.max_rss_delta_bytes is not None
+        else "n/a"
+    )
+    return (
+        f"🧠 Function '{name}' peaked at {format_bytes(usage.peak_bytes)} "
+        f"(net {usage.allocated_blocks:+d} blocks, max RSS +{rss}) 🎅."
+    )
@@ -0,0 +1 @@
+# ⏱️ Elf Benchmarks: microbenchmarks for the elf helpers ⏱️ #
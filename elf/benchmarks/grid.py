@@ -0,0 +1,97 @@
+import random
+import timeit
+from collections.abc import Callable
+
+from elf.grid import Grid
+
+# ⏱️ Grid microbenchmarks: list-of-lists with bounds checks vs. elf.grid ⏱️ #
+#
+# Run with: python -m elf.benchmarks.grid
+
+GRID_SIZE = 140
+DIRECTIONS = [(-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1)]
+
+
+def make_grid(seed: int = 2024) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice("XMAS.#") for _ in range(GRID_SIZE))
+        for _ in range(GRID_SIZE)
+    ]
+
+
+def nested_neighbors(data: list[str]) -> int:
+    grid = [list(line) for line in data]
+    height, width = len(grid), len(grid[0])
+    total = 0
+    for i in range(height):
+        for j in range(width):
+            for di, dj in DIRECTIONS:
+                ni, nj = i + di, j + dj
+                if 0 <= ni < height and 0 <= nj < width and grid[ni][nj] == "#":
+                    total += 1
+    return total
+
+
+def grid_neighbors(data: list[str]) -> int:
+    grid = Grid.parse(data)
+    cells, offsets, wall = grid.cells, grid.offsets8, ord("#")
+    total = 0
+    for index, value in enumerate(cells):
+        if value:
+            for offset in offsets:
+                total += cells[index + offset] == wall
+    return total
+
+
+def nested_word_search(data: list[str]) -> int:
+    grid = [list(line) for line in data]
+    height, width = len(grid), len(grid[0])
+    count = 0
+    for i in range(height):
+        for j in range(width):
+            for di, dj in DIRECTIONS:
+                result = []
+                for step in range(4):
+                    ni, nj = i + step * di, j + step * dj
+                    if 0 <= ni < height and 0 <= nj < width:
+                        result.append(grid[ni][nj])
+                    else:
+                        break
+                count += "".join(result) == "XMAS"
+    return count
+
+
+def grid_word_search(data: list[str]) -> int:
+    grid = Grid.parse(data)
+    return sum(
+        grid.line(index, offset, 4) == b"XMAS"
+        for index in grid.find_all("X")
+        for offset in grid.offsets8
+    )
+
+
+def measure(func: Callable, data: list[str], number: int, repeat: int) -> float:
+    """Returns the best time per call in milliseconds."""
+    times = timeit.repeat(lambda: func(data), number=number, repeat=repeat)
+    return min(times) / number * 1e3
+
+
+def main(number: int = 5, repeat: int = 5):
+    data = make_grid()
+    cases = [
+        ("8-neighbours", nested_neighbors, grid_neighbors),
+        ("word search", nested_word_search, grid_word_search),
+    ]
+
+    print(f"⏱️ Best of {repeat} x {number} calls on a {GRID_SIZE}x{GRID_SIZE} grid")
+    print(f"{'Task':<16}{'Nested lists':>14}{'elf.grid':>14}{'Speedup':>10}")
+    for name, baseline, candidate in cases:
+        assert baseline(data) == candidate(data), name
+        before = measure(baseline, data, number, repeat)
+        after = measure(candidate, data, number, repeat)
+        print(f"{name:<16}{before:>12.2f}ms{after:>12.2f}ms{before / after:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import random
+import re
+import timeit
+from collections.abc import Callable
+
+from elf.parsers import all_ints, char_grid, int_matrix, ints_per_line
+
+# ⏱️ Parser microbenchmarks: elf.parsers vs. the hand-rolled comprehensions ⏱️ #
+#
+# Run with: python -m elf.benchmarks.parsers
+
+ROWS = 1000
+COLS = 8
+GRID_SIZE = 140
+
+
+def make_inputs(seed: int = 2024) -> dict[str, list[str]]:
+    rng = random.Random(seed)
+    number_lines = [
+        " ".join(str(rng.randint(1, 99_999)) for _ in range(COLS)) for _ in range(ROWS)
+    ]
+    grid_lines = [
+        "".join(rng.choice("XMAS.#") for _ in range(GRID_SIZE))
+        for _ in range(GRID_SIZE)
+    ]
+    text_lines = [
+        f"p={rng.randint(-99, 99)},{rng.randint(-99, 99)} "
+        f"v={rng.randint(-99, 99)},{rng.randint(-99, 99)}"
+        for _ in range(ROWS)
+    ]
+    return {"numbers": number_lines, "grid": grid_lines, "text": text_lines}
+
+
+def hand_rolled_ints(data: list[str]) -> list[list[int]]:
+    return [[int(y) for y in x.split(" ")] for x in data]
+
+
+def hand_rolled_grid(data: list[str]) -> list[list[str]]:
+    return [list(line) for line in data]
+
+
+def hand_rolled_all_ints(data: list[str]) -> list[int]:
+    return [int(x) for line in data for x in re.findall(r"-?\d+", line)]
+
+
+def measure(func: Callable, data: list[str], number: int, repeat: int) -> float:
+    """Returns the best time per call in microseconds."""
+    times = timeit.repeat(lambda: func(data), number=number, repeat=repeat)
+    return min(times) / number * 1e6
+
+
+def main(number: int = 50, repeat: int = 5):
+    inputs = make_inputs()
+    cases = [
+        ("ints per line", "numbers", hand_rolled_ints, ints_per_line),
+        ("int matrix", "numbers", hand_rolled_ints, int_matrix),
+        ("char grid", "grid", hand_rolled_grid, char_grid),
+        ("all ints", "text", hand_rolled_all_ints, all_ints),
+    ]
+
+    print(f"⏱️ Best of {repeat} x {number} calls per parser")
+    print(f"{'Parser':<16}{'Hand-rolled':>14}{'elf.parsers':>14}{'Speedup':>10}")
+    for name, key, baseline, parser in cases:
+        data = inputs[key]
+        before = measure(baseline, data, number, repeat)
+        after = measure(parser, data, number, repeat)
+        print(f"{name:<16}{before:>12.1f}µs{after:>12.1f}µs{before / after:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
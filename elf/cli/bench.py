@@ -0,0 +1,254 @@
+import copy
+import json
+import platform
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import elf
+from elf.bench import (
+    STARTUP_STATEMENT,
+    benchmark,
+    format_bytes,
+    format_duration,
+    format_memory,
+    measure_startup,
+    unwrap_timer,
+)
+from elf.config import get_cache_bench_file
+from elf.discovery import discover_solutions, find_input_file, load_solution
+from elf.models import BenchmarkResult
+from elf.profiling import profile_output_path, profiled
+from elf.runner import call_part, get_solution_functions
+from elf.utils import accepts_bytes, atomic_write_text
+
+
+def result_key(entry: dict[str, Any]) -> str:
+    if "name" in entry:
+        return entry["name"]
+    return f"{entry['year']}/day{entry['day']:02d}/part{entry['part']}"
+
+
+def make_entry(stats: BenchmarkResult, **fields: Any) -> dict[str, Any]:
+    entry = {
+        **fields,
+        "repeat": stats.repeat,
+        "warmup": stats.warmup,
+        "min_ns": stats.min_ns,
+        "median_ns": stats.median_ns,
+        "p95_ns": stats.p95_ns,
+        "mean_ns": stats.mean_ns,
+        "stddev_ns": stats.stddev_ns,
+    }
+    if stats.memory is not None:
+        entry["peak_bytes"] = stats.memory.peak_bytes
+        entry["allocated_blocks"] = stats.memory.allocated_blocks
+        entry["max_rss_delta_bytes"] = stats.memory.max_rss_delta_bytes
+    return entry
+
+
+def run_startup_benchmark(root: Path, repeat: int) -> dict[str, Any]:
+    """Measures the import time of a solution's `import elf` header."""
+    stats, imports = measure_startup(STARTUP_STATEMENT, repeat=repeat, root=root)
+    print(
+        f"🚀 Startup imports: median {format_duration(stats.median_ns)}, "
+        f"min {format_duration(stats.min_ns)}, "
+        f"p95 {format_duration(stats.p95_ns)}"
+    )
+    heaviest = sorted(imports, key=lambda entry: entry[1], reverse=True)[:5]
+    for name, own, _, _ in heaviest:
+        print(f"  📦 {name}: {format_duration(own * 1000)}")
+
+    return make_entry(stats, name="startup/import", statement=STARTUP_STATEMENT)
+
+
+def print_stats(label: str, name: str, stats: BenchmarkResult) -> None:
+    print(
+        f"⏱️ {label}: "
+        f"median {format_duration(stats.median_ns)}, "
+        f"min {format_duration(stats.min_ns)}, "
+        f"p95 {format_duration(stats.p95_ns)}, "
+        f"stddev {format_duration(stats.stddev_ns)}"
+    )
+    if stats.memory is not None:
+        print(f"  {format_memory(name, stats.memory)}")
+
+
+def run_benchmarks(
+    root: Path,
+    year: int | None,
+    day: int | None,
+    repeat: int,
+    warmup: int,
+    disable_gc: bool,
+    memory: bool = False,
+    profile: str | None = None,
+) -> tuple[list[dict[str, Any]], int]:
+    """Benchmarks every discovered part and returns the entries and the failure count."""
+    entries: list[dict[str, Any]] = []
+    failures = 0
+    options = {
+        "warmup": warmup,
+        "repeat": repeat,
+        "disable_gc": disable_gc,
+        "memory": memory,
+    }
+
+    solutions = discover_solutions(root, year, day)
+    if not solutions:
+        print("❌ No solutions found to benchmark.")
+        return entries, 1
+
+    for solution in solutions:
+        input_file = find_input_file(solution)
+        if input_file is None:
+            print(f"⏭️ {solution.label}: no input.txt, skipping.")
+            continue
+
+        try:
+            parse, part1, part2 = get_solution_functions(load_solution(solution))
+        except Exception as e:
+            print(f"❌ {solution.label}: failed to load solution: {e}")
+            failures += 1
+            continue
+
+        if parse is not None and accepts_bytes(parse):
+            data = input_file.read_bytes()
+        else:
+            data = elf.read_input_file(input_file)
+        if parse is not None:
+            try:
+                stats = benchmark(parse, data, **options)
+            except Exception as e:
+                print(f"❌ {solution.label} parse: {type(e).__name__}: {e}")
+                failures += 1
+                continue
+            print_stats(f"{solution.label} parse", parse.__name__, stats)
+            key = f"{solution.year}/day{solution.day:02d}/parse"
+            entries.append(
+                make_entry(stats, name=key, year=solution.year, day=solution.day)
+            )
+            data = stats.result
+
+        # Part 1 fills the shared context first, so part 2 sees what it would in a real run
+        context: dict[str, Any] = {}
+        for part, func in ((1, part1), (2, part2)):
+            target = unwrap_timer(func)
+            try:
+                stats = benchmark(call_part, target, data, context, **options)
+                call_part(target, copy.deepcopy(data), context)
+            except Exception as e:
+                print(f"❌ {solution.label} Part {part}: {type(e).__name__}: {e}")
+                failures += 1
+                continue
+
+            print_stats(f"{solution.label} Part {part}", func.__name__, stats)
+            entries.append(
+                make_entry(stats, year=solution.year, day=solution.day, part=part)
+            )
+
+            if profile is not None:
+                # One extra run, so the profiler's overhead never reaches the timings
+                output = profile_output_path(solution.base_dir, part, profile)
+                call_part(
+                    profiled(target, profile, output),
+                    copy.deepcopy(data),
+                    copy.deepcopy(context),
+                )
+
+    return entries, failures
+
+
+def compare_with_baseline(
+    entries: list[dict[str, Any]], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Compares medians and memory peaks against a baseline and returns the regressed keys."""
+    previous = {result_key(entry): entry for entry in baseline.get("results", [])}
+    regressions = []
+
+    print(f"📊 Comparing against baseline (threshold +{threshold:.0%}):")
+    for entry in entries:
+        key = result_key(entry)
+        old = previous.get(key)
+        if old is None:
+            print(f"  🆕 {key}: no baseline")
+            continue
+
+        ratio = entry["median_ns"] / old["median_ns"] if old["median_ns"] else 1.0
+        change = (
+            f"{format_duration(old['median_ns'])} → "
+            f"{format_duration(entry['median_ns'])} ({ratio:.2f}x)"
+        )
+        if ratio > 1 + threshold:
+            regressions.append(key)
+            print(f"  🐢 {key}: {change} REGRESSION")
+        elif ratio < 1 / (1 + threshold):
+            print(f"  🚀 {key}: {change}")
+        else:
+            print(f"  ✅ {key}: {change}")
+
+        if "peak_bytes" in entry and "peak_bytes" in old:
+            peak_ratio = (
+                entry["peak_bytes"] / old["peak_bytes"] if old["peak_bytes"] else 1.0
+            )
+            peak_change = (
+                f"{format_bytes(old['peak_bytes'])} → "
+                f"{format_bytes(entry['peak_bytes'])} ({peak_ratio:.2f}x)"
+            )
+            if peak_ratio > 1 + threshold:
+                if key not in regressions:
+                    regressions.append(key)
+                print(f"  🐘 {key}: peak memory {peak_change} REGRESSION")
+            else:
+                print(f"  🧠 {key}: peak memory {peak_change}")
+
+    return regressions
+
+
+def main(
+    year: int | None = None,
+    day: int | None = None,
+    repeat: int = 5,
+    warmup: int = 1,
+    disable_gc: bool = False,
+    memory: bool = False,
+    profile: str | None = None,
+    startup: bool = True,
+    output: Path | None = None,
+    baseline: Path | None = None,
+    threshold: float = 0.2,
+    root: Path = Path("."),
+) -> int:
+    entries, failures = run_benchmarks(
+        root, year, day, repeat, warmup, disable_gc, memory, profile
+    )
+    if startup:
+        entries.append(run_startup_benchmark(root, repeat))
+
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": entries,
+    }
+    output = output or get_cache_bench_file()
+    atomic_write_text(output, json.dumps(report, indent=2) + "\n")
+    print(f"💾 Saved {len(entries)} results to {output}")
+
+    regressions: list[str] = []
+    if baseline is not None:
+        if not baseline.exists():
+            print(f"❌ Baseline not found: {baseline}")
+            return 1
+        baseline_report = json.loads(baseline.read_text(encoding="utf-8"))
+        regressions = compare_with_baseline(entries, baseline_report, threshold)
+
+    if regressions:
+        print(f"🛑 {len(regressions)} part(s) regressed beyond the baseline threshold.")
+        return 1
+    if failures:
+        print(f"🛑 {failures} benchmark(s) failed.")
+        return 1
+
+    print("✅ Benchmarks complete. The elves are speedy! 🎉")
+    return 0
@@ -1,4 +1,32 @@
+import argparse
+import time
+
 import elf
+from elf.input import prefetch_inputs
+from elf.models import FetchStatus
+
+
+def parse_range(spec: str) -> list[int]:
+    """Parse a range specification like "1-25" or "1,3,5-7" into a sorted list.
+
+    Used as an argparse `type`, so a bad range becomes a usage error.
+    """
+    numbers: set[int] = set()
+    for chunk in spec.split(","):
+        chunk = chunk.strip()
+        if not chunk:
+            continue
+        start, _, end = chunk.partition("-")
+        try:
+            first, last = int(start), int(end or start)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid range: {chunk!r}") from None
+        if first > last:
+            raise argparse.ArgumentTypeError(f"empty range: {chunk!r}")
+        numbers.update(range(first, last + 1))
+    if not numbers:
+        raise argparse.ArgumentTypeError(f"invalid range: {spec!r}")
+    return sorted(numbers)
 
 
 def main(year: int, day: int):
@@ -7,3 +35,30 @@ def main(year: int, day: int):
         print(f"📥 Input fetched:\n{input_data}")
     except elf.InputFetchError as e:
         print(f"❌ Failed to fetch input: {e}")
+
+
+def main_bulk(years: list[int], days: list[int], max_workers: int, rate: float):
+    puzzles = [(year, day) for year in years for day in days]
+    print(
+        f"🛷 Fetching {len(puzzles)} inputs with {max_workers} elves "
+        f"(at most {rate:g} requests/s)..."
+    )
+
+    start_time = time.perf_counter()
+    results = prefetch_inputs(puzzles, max_workers=max_workers, rate=rate)
+    duration = time.perf_counter() - start_time
+
+    fetched = [r for r in results if r.status == FetchStatus.FETCHED]
+    cached = [r for r in results if r.status == FetchStatus.CACHED]
+    failed = [r for r in results if r.status == FetchStatus.FAILED]
+
+    for result in failed:
+        print(f"❌ {result.year} Day {result.day:02d}: {result.message}")
+
+    fetched_kib = sum(r.size for r in fetched) / 1024
+    throughput = len(fetched) / duration if duration else 0.0
+    print(
+        f"📦 Fetched {len(fetched)}, skipped {len(cached)} cached, "
+        f"{len(failed)} failed in {duration:.2f}s "
+        f"({throughput:.2f} inputs/s, {fetched_kib:.1f} KiB downloaded) 🎄"
+    )
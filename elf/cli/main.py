@@ -1,10 +1,54 @@
 import argparse
+import logging
 import sys
+from pathlib import Path
 
-from elf.cli import create_day, fetch_input, run, submit, test
+from elf.cli import (
+    bench,
+    create_day,
+    fetch_input,
+    run,
+    run_all,
+    submit,
+    test,
+    watch,
+)
+from elf.profiling import PROFILE_MODES
+
+
+def add_limit_arguments(
+    parser: argparse.ArgumentParser, default_timeout: float | None = None
+) -> None:
+    """Adds --timeout and --max-memory, which run each solution in a limited child."""
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=default_timeout,
+        metavar="SECONDS",
+        help="Stop a solution that runs longer than this and report a TIMEOUT"
+        + (" (default: %(default)s)." if default_timeout is not None else "."),
+    )
+    parser.add_argument(
+        "--max-memory",
+        type=int,
+        default=None,
+        metavar="MB",
+        help="Stop a solution that allocates more than this and report a MEMORY LIMIT.",
+    )
+
+
+def add_cache_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rerun solutions even if their answers are cached (the cache is "
+        "still refreshed).",
+    )
 
 
 def main():
+    logging.basicConfig(level=logging.INFO)
+
     parser = argparse.ArgumentParser(
         description="Elf CLI - A Festive Helper for Advent of Code 🎄",
         epilog="🎅 Happy Coding and Merry Christmas! 🎅",
@@ -28,8 +72,34 @@ def main():
     fetch_input_parser = subparsers.add_parser(
         "fetch-input", help="Fetch the input data for a specific day."
     )
-    fetch_input_parser.add_argument("year", type=int, help="Year (e.g., 2024)")
-    fetch_input_parser.add_argument("day", type=int, help="Day number (1-25)")
+    fetch_input_parser.add_argument(
+        "year",
+        type=fetch_input.parse_range,
+        help="Year (e.g., 2024), or a range for bulk fetches",
+    )
+    fetch_input_parser.add_argument(
+        "day", type=int, nargs="?", help="Day number (1-25)"
+    )
+    fetch_input_parser.add_argument(
+        "--all", action="store_true", help="Fetch all 25 days into the cache."
+    )
+    fetch_input_parser.add_argument(
+        "--days",
+        type=fetch_input.parse_range,
+        help="Days to fetch into the cache (e.g., 1-25 or 1,3,5).",
+    )
+    fetch_input_parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of concurrent downloads for bulk fetches (default: 4).",
+    )
+    fetch_input_parser.add_argument(
+        "--rate",
+        type=float,
+        default=2.0,
+        help="Maximum requests per second for bulk fetches (default: 2).",
+    )
 
     # Subcommand: run
     run_parser = subparsers.add_parser(
@@ -43,6 +113,29 @@ def main():
         default="both",
         help="Specify which part to run.",
     )
+    run_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Run both parts at once in up to N worker processes (default: 1).",
+    )
+    add_limit_arguments(run_parser)
+    add_cache_argument(run_parser)
+
+    # Subcommand: run-all
+    run_all_parser = subparsers.add_parser(
+        "run-all", help="Run every solution on its cached input in a worker pool."
+    )
+    run_all_parser.add_argument(
+        "year", type=int, nargs="?", help="Only run this year (e.g., 2024)"
+    )
+    run_all_parser.add_argument(
+        "--max-workers",
+        type=int,
+        help="Maximum number of worker processes (default: number of CPUs).",
+    )
+    add_limit_arguments(run_all_parser)
+    add_cache_argument(run_all_parser)
 
     # Subcommand: submit
     submit_parser = subparsers.add_parser(
@@ -56,9 +149,100 @@ def main():
     submit_parser.add_argument("answer", help="Your answer to submit")
 
     # Subcommand: test
-    test_parser = subparsers.add_parser("test", help="Run tests for a specific day.")
-    test_parser.add_argument("year", type=int, help="Year (e.g., 2024)")
-    test_parser.add_argument("day", type=int, help="Day number (1-25)")
+    test_parser = subparsers.add_parser(
+        "test", help="Run example tests for a day, or every day with --all."
+    )
+    test_parser.add_argument(
+        "year", type=int, nargs="?", help="Year (e.g., 2024); with --all, a filter"
+    )
+    test_parser.add_argument(
+        "day", type=int, nargs="?", help="Day number (1-25); with --all, a filter"
+    )
+    test_parser.add_argument(
+        "--all",
+        action="store_true",
+        dest="all_days",
+        help="Test every discovered solution, each in its own process.",
+    )
+    test_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Maximum number of tests running at once (default: CPU count).",
+    )
+    add_limit_arguments(test_parser, default_timeout=test.DEFAULT_TIMEOUT)
+    test_parser.add_argument(
+        "--junit", type=Path, default=None, help="Write a JUnit XML report here."
+    )
+    test_parser.add_argument(
+        "--json", type=Path, default=None, help="Write a JSON report here."
+    )
+
+    # Subcommand: watch
+    watch_parser = subparsers.add_parser(
+        "watch", help="Rerun tests and the input whenever a day's files change."
+    )
+    watch_parser.add_argument("year", type=int, help="Year (e.g., 2024)")
+    watch_parser.add_argument("day", type=int, help="Day number (1-25)")
+    watch_parser.add_argument(
+        "--interval",
+        type=float,
+        default=watch.DEFAULT_INTERVAL,
+        help="Seconds between checks for changes (default: %(default)s).",
+    )
+
+    # Subcommand: bench
+    bench_parser = subparsers.add_parser(
+        "bench", help="Benchmark solutions and compare against a baseline."
+    )
+    bench_parser.add_argument(
+        "year", type=int, nargs="?", help="Only benchmark this year (e.g., 2024)"
+    )
+    bench_parser.add_argument(
+        "day", type=int, nargs="?", help="Only benchmark this day (1-25)"
+    )
+    bench_parser.add_argument(
+        "--repeat", type=int, default=5, help="Measured runs per part (default: 5)."
+    )
+    bench_parser.add_argument(
+        "--warmup", type=int, default=1, help="Warmup runs per part (default: 1)."
+    )
+    bench_parser.add_argument(
+        "--disable-gc",
+        action="store_true",
+        help="Pause the garbage collector while measuring.",
+    )
+    bench_parser.add_argument(
+        "--mem",
+        action="store_true",
+        help="Also record peak memory per part and gate it against the baseline.",
+    )
+    bench_parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="cprofile",
+        choices=PROFILE_MODES,
+        help="Profile one extra run of each part and save it next to the solution.",
+    )
+    bench_parser.add_argument(
+        "--skip-startup",
+        action="store_true",
+        help="Don't measure the import time of the elf package.",
+    )
+    bench_parser.add_argument(
+        "--output",
+        type=Path,
+        help="Where to write the JSON results (default: the elf cache directory).",
+    )
+    bench_parser.add_argument(
+        "--baseline", type=Path, help="JSON results to compare against."
+    )
+    bench_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed slowdown over the baseline median (default: 0.2 = 20%%).",
+    )
 
     args = parser.parse_args()
 
@@ -66,13 +250,68 @@ def main():
     if args.command == "create-day":
         create_day.main(args.year, args.day, args.output_dir)
     elif args.command == "fetch-input":
-        fetch_input.main(args.year, args.day)
+        if args.all or args.days:
+            days = args.days or list(range(1, 26))
+            fetch_input.main_bulk(args.year, days, args.workers, args.rate)
+        elif args.day is not None and len(args.year) == 1:
+            fetch_input.main(args.year[0], args.day)
+        else:
+            fetch_input_parser.error("provide a single year and day, or --all/--days")
     elif args.command == "run":
-        run.main(args.year, args.day, args.part)
+        sys.exit(
+            run.main(
+                args.year,
+                args.day,
+                args.part,
+                args.jobs,
+                timeout=args.timeout,
+                max_memory_mb=args.max_memory,
+                use_cache=not args.no_cache,
+            )
+        )
+    elif args.command == "run-all":
+        sys.exit(
+            run_all.main(
+                args.year,
+                args.max_workers,
+                timeout=args.timeout,
+                max_memory_mb=args.max_memory,
+                use_cache=not args.no_cache,
+            )
+        )
     elif args.command == "submit":
         submit.main(args.year, args.day, args.part, args.answer)
     elif args.command == "test":
-        test.main(args.year, args.day)
+        sys.exit(
+            test.main(
+                year=args.year,
+                day=args.day,
+                run_all=args.all_days,
+                jobs=args.jobs,
+                timeout=args.timeout,
+                max_memory_mb=args.max_memory,
+                junit=args.junit,
+                json_output=args.json,
+            )
+        )
+    elif args.command == "watch":
+        sys.exit(watch.main(args.year, args.day, args.interval))
+    elif args.command == "bench":
+        sys.exit(
+            bench.main(
+                year=args.year,
+                day=args.day,
+                repeat=args.repeat,
+                warmup=args.warmup,
+                disable_gc=args.disable_gc,
+                memory=args.mem,
+                profile=args.profile,
+                startup=not args.skip_startup,
+                output=args.output,
+                baseline=args.baseline,
+                threshold=args.threshold,
+            )
+        )
     else:
         parser.print_help()
         sys.exit(1)
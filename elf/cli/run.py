@@ -1,23 +1,130 @@
-import importlib.util
+import hashlib
+import time
+from pathlib import Path
+from typing import Any
 
+import elf
+from elf.discovery import find_input_file, load_solution
+from elf.isolation import run_isolated
+from elf.models import CachedResult, RunStatus, SolutionFile
+from elf.result_cache import ResultCache, input_digest, result_keys
+from elf.runner import (
+    apply_parse,
+    call_part,
+    call_part_isolated,
+    can_run_in_parallel,
+    get_solution_functions,
+    run_parts_parallel,
+)
 
-def main(year: int, day: int, part: str):
-    day_dir = Path(f"{year}/day{day:02d}")
-    solution_file = day_dir / f"day{day:02d}.py"
+
+def main(
+    year: int,
+    day: int,
+    part: str,
+    jobs: int = 1,
+    timeout: float | None = None,
+    max_memory_mb: int | None = None,
+    use_cache: bool = True,
+) -> int:
+    solution_file = Path(f"{year}/day{day:02d}") / "solution.py"
     if not solution_file.exists():
         print(f"❌ Solution file not found: {solution_file}")
-        return
-
-    spec = importlib.util.spec_from_file_location("solution", solution_file)
-    solution = importlib.util.module_from_spec(spec)
-    sys.modules["solution"] = solution
-    spec.loader.exec_module(solution)
-
-    # Now you can call functions from the solution module
-    # For example:
-    if part in ("1", "both"):
-        result_part1 = solution.part1()
-        print(f"Part 1 result: {result_part1}")
-    if part in ("2", "both"):
-        result_part2 = solution.part2()
-        print(f"Part 2 result: {result_part2}")
+        return 1
+
+    solution = SolutionFile(year=year, day=day, path=solution_file)
+    try:
+        parse, part1, part2 = get_solution_functions(load_solution(solution))
+    except AttributeError as e:
+        print(e)
+        return 1
+
+    # Only hash the input here; it is read and split after a cache miss
+    input_file = find_input_file(solution)
+    input_text = None
+    try:
+        if input_file is not None:
+            input_hash = input_digest(input_file)
+        else:
+            input_text = elf.get_input(year, day)
+            input_hash = hashlib.sha256(input_text.encode()).digest()
+    except elf.InputFetchError as e:
+        print(f"❌ Failed to fetch input: {e}")
+        return 1
+
+    functions = {1: part1, 2: part2}
+    numbers = [number for number in (1, 2) if part in (str(number), "both")]
+
+    # Answer parts whose solution and input are unchanged straight from the cache
+    cache = ResultCache()
+    cache_keys = result_keys(solution_file, input_hash)
+    if use_cache:
+        for number in list(numbers):
+            cached = cache.get(cache_keys[number])
+            if cached is not None:
+                print(
+                    f"🎄 Part {number} Result: {cached.answer} "
+                    f"(cached, originally took {cached.elapsed:.6f}s)"
+                )
+                numbers.remove(number)
+    if not numbers:
+        return 0
+
+    data = (
+        elf.read_input_file(input_file)
+        if input_text is None
+        else elf.parse_input(input_text)
+    )
+
+    def remember(number: int, result: Any, elapsed: float) -> None:
+        if result is not None:
+            cache.put(
+                cache_keys[number],
+                CachedResult(year, day, number, str(result), elapsed),
+            )
+
+    context: dict[str, Any] = {}
+    if timeout is not None or max_memory_mb is not None:
+        # parse runs in its own child too, so it can't escape the limits
+        if parse is not None:
+            outcome = run_isolated(
+                apply_parse,
+                parse,
+                data,
+                timeout=timeout,
+                max_memory_mb=max_memory_mb,
+            )
+            if outcome.status != RunStatus.OK:
+                print(f"❌ Parse: {outcome.error}")
+                return 1
+            data = outcome.value
+
+        stopped = False
+        for number in numbers:
+            outcome = call_part_isolated(
+                functions[number], data, context, timeout, max_memory_mb
+            )
+            if outcome.status == RunStatus.OK:
+                remember(number, outcome.value, outcome.elapsed)
+                print(f"🎄 Part {number} Result: {outcome.value}")
+            else:
+                print(f"❌ Part {number}: {outcome.error}")
+                stopped = True
+        return 1 if stopped else 0
+
+    parsed = apply_parse(parse, data)
+
+    if jobs > 1 and len(numbers) > 1 and can_run_in_parallel(part1, part2):
+        for number, result, elapsed in run_parts_parallel(
+            solution, numbers, parsed, jobs
+        ):
+            remember(number, result, elapsed)
+            print(f"🎄 Part {number} Result: {result} ({elapsed:.6f}s)")
+        return 0
+
+    for number in numbers:
+        start_time = time.perf_counter()
+        result = call_part(functions[number], parsed, context)
+        remember(number, result, time.perf_counter() - start_time)
+        print(f"🎄 Part {number} Result: {result}")
+    return 0
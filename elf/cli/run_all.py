@@ -0,0 +1,202 @@
+import contextlib
+import io
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+# Imported up front so forked workers inherit them instead of importing per task
+import elf.templates.args  # noqa: F401
+from elf.config import get_cache_bench_file, get_cache_timings_file
+from elf.discovery import discover_solutions, find_input_file, load_solution
+from elf.isolation import run_isolated_many
+from elf.models import (
+    CachedResult,
+    IsolatedOutcome,
+    RunStatus,
+    SolutionFile,
+    SolutionRun,
+)
+from elf.result_cache import ResultCache, input_digest, result_keys
+from elf.runner import call_part, get_solution_functions, parse_input_file
+from elf.utils import atomic_write_text
+
+
+def run_solution(solution: SolutionFile, input_file: Path) -> SolutionRun:
+    """Runs both parts of one solution inside a worker and captures the answers."""
+    start_time = time.perf_counter()
+    # Keep the workers' timer output from interleaving in the summary
+    with contextlib.redirect_stdout(io.StringIO()):
+        parse, part1, part2 = get_solution_functions(load_solution(solution))
+        data = parse_input_file(parse, input_file)
+        context: dict[str, Any] = {}
+        part1_start = time.perf_counter()
+        result1 = call_part(part1, data, context)
+        part2_start = time.perf_counter()
+        result2 = call_part(part2, data, context)
+        end_time = time.perf_counter()
+    return SolutionRun(
+        year=solution.year,
+        day=solution.day,
+        part1=str(result1),
+        part2=str(result2),
+        elapsed=end_time - start_time,
+        part_times=(part2_start - part1_start, end_time - part2_start),
+    )
+
+
+def cached_run(
+    solution: SolutionFile, cache: ResultCache, keys: dict[int, str]
+) -> SolutionRun | None:
+    """Rebuilds a run from the result cache, or returns None unless both parts hit."""
+    cached1 = cache.get(keys[1])
+    cached2 = cache.get(keys[2])
+    if cached1 is None or cached2 is None:
+        return None
+    return SolutionRun(
+        year=solution.year,
+        day=solution.day,
+        part1=cached1.answer,
+        part2=cached2.answer,
+        elapsed=cached1.elapsed + cached2.elapsed,
+        part_times=(cached1.elapsed, cached2.elapsed),
+        cached=True,
+    )
+
+
+def remember_run(run: SolutionRun, cache: ResultCache, keys: dict[int, str]) -> None:
+    for number, answer, elapsed in (
+        (1, run.part1, run.part_times[0]),
+        (2, run.part2, run.part_times[1]),
+    ):
+        cache.put(
+            keys[number], CachedResult(run.year, run.day, number, answer, elapsed)
+        )
+
+
+def load_expected_seconds() -> dict[str, float]:
+    """Reads each day's expected run time from the last run-all, then `elf bench`."""
+    expected: dict[str, float] = {}
+
+    bench_file = get_cache_bench_file()
+    if bench_file.exists():
+        for entry in json.loads(bench_file.read_text(encoding="utf-8"))["results"]:
+            if "day" in entry:
+                key = f"{entry['year']}/day{entry['day']:02d}"
+                expected[key] = expected.get(key, 0.0) + entry["median_ns"] / 1e9
+
+    timings_file = get_cache_timings_file()
+    if timings_file.exists():
+        expected.update(json.loads(timings_file.read_text(encoding="utf-8")))
+
+    return expected
+
+
+def save_timings(runs: list[SolutionRun]) -> None:
+    timings_file = get_cache_timings_file()
+    timings = (
+        json.loads(timings_file.read_text(encoding="utf-8"))
+        if timings_file.exists()
+        else {}
+    )
+    for run in runs:
+        if run.ok:
+            timings[f"{run.year}/day{run.day:02d}"] = run.elapsed
+    atomic_write_text(timings_file, json.dumps(timings, indent=2, sort_keys=True))
+
+
+def to_solution_run(solution: SolutionFile, outcome: IsolatedOutcome) -> SolutionRun:
+    """Unpacks a worker's outcome, turning errors and exceeded limits into a failed run."""
+    if outcome.status == RunStatus.OK:
+        return outcome.value
+    return SolutionRun(
+        year=solution.year,
+        day=solution.day,
+        part1="",
+        part2="",
+        elapsed=outcome.elapsed,
+        error=outcome.error,
+    )
+
+
+def print_summary(runs: list[SolutionRun]) -> None:
+    print(f"{'Puzzle':<14}{'Part 1':>20}{'Part 2':>20}{'Time':>11}  Status")
+    for run in sorted(runs, key=lambda r: (r.year, r.day)):
+        if not run.ok:
+            status = f"❌ {run.error}"
+        else:
+            status = "✅ (cached)" if run.cached else "✅"
+        print(
+            f"{run.year} Day {run.day:02d}  {run.part1:>20}{run.part2:>20}"
+            f"{run.elapsed:>10.3f}s  {status}"
+        )
+
+
+def main(
+    year: int | None = None,
+    max_workers: int | None = None,
+    timeout: float | None = None,
+    max_memory_mb: int | None = None,
+    use_cache: bool = True,
+) -> int:
+    solutions = discover_solutions(Path("."), year)
+    cache = ResultCache()
+    cache_keys = {}
+    runs = []
+    tasks = []
+    for solution in solutions:
+        input_file = find_input_file(solution)
+        if input_file is None:
+            print(f"⏭️ {solution.label}: no input.txt, skipping.")
+            continue
+        keys = result_keys(solution.path, input_digest(input_file))
+        cache_keys[solution] = keys
+        run = cached_run(solution, cache, keys) if use_cache else None
+        if run is not None:
+            runs.append(run)
+        else:
+            tasks.append((solution, input_file))
+
+    if not tasks and not runs:
+        print("❌ No solutions with input found to run.")
+        return 1
+    if runs:
+        print(f"🗃️ {len(runs)} solutions are unchanged, using their cached answers.")
+
+    # Longest expected first, so slow outliers don't start last; unknown days count as slow
+    expected = load_expected_seconds()
+    tasks.sort(
+        key=lambda task: expected.get(
+            f"{task[0].year}/day{task[0].day:02d}", float("inf")
+        ),
+        reverse=True,
+    )
+
+    max_workers = max_workers or os.cpu_count() or 1
+    if tasks:
+        print(f"🛷 Running {len(tasks)} solutions with {max_workers} elves...")
+    start_time = time.perf_counter()
+    for solution, outcome in run_isolated_many(
+        ((task[0], run_solution, task) for task in tasks),
+        max_workers,
+        timeout,
+        max_memory_mb,
+    ):
+        run = to_solution_run(solution, outcome)
+        if run.ok:
+            remember_run(run, cache, cache_keys[solution])
+        runs.append(run)
+        icon = "✅" if run.ok else "❌"
+        print(f"{icon} {run.year} Day {run.day:02d} in {run.elapsed:.3f}s")
+    wall_seconds = time.perf_counter() - start_time
+
+    save_timings(runs)
+    print_summary(runs)
+    failed = sum(not run.ok for run in runs)
+    print(
+        f"⏱️ {len(tasks)} solutions took "
+        f"{sum(r.elapsed for r in runs if not r.cached):.3f}s in total, "
+        f"finished in {wall_seconds:.3f}s wall time, {failed} failed 🎅."
+    )
+    return 1 if failed else 0
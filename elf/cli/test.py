@@ -1,35 +1,201 @@
-import importlib
+import contextlib
+import io
+import json
+import os
+import time
+import xml.etree.ElementTree as ElementTree
 from pathlib import Path
+from typing import Any
 
-import elf
+from elf.discovery import discover_solutions, load_solution
+from elf.isolation import run_isolated_many
+from elf.models import (
+    DayTestResult,
+    IsolatedOutcome,
+    RunStatus,
+    SolutionFile,
+    TestResult,
+)
+from elf.runner import get_solution_functions
+from elf.testing import (
+    check_part1_solution,
+    check_part2_solution,
+    outcome_test_result,
+)
+from elf.utils import atomic_write_text
 
+DEFAULT_TIMEOUT = 60.0
 
-def main(year: int, day: int):
-    day_dir = Path(f"{year}/day{day:02d}")
-    test_input_file = day_dir / "test_input.txt"
-    expected_output_file = day_dir / "expected_output.txt"
 
+def find_test_files(solution: SolutionFile) -> tuple[Path, Path] | None:
+    """Returns the day's test input and expected output, or None if either is missing."""
+    test_input_file = solution.base_dir / "test_input.txt"
+    expected_output_file = solution.base_dir / "expected_output.txt"
     if not test_input_file.exists() or not expected_output_file.exists():
-        print("❌ Test files are missing.")
-        return
-
-    # Import the solution module using importlib.import_module
-    module_name = f"{year}.day{day:02d}.day{day:02d}"
-    try:
-        module = importlib.import_module(module_name)
-        part1_func = getattr(module, "part1", None)
-        part2_func = getattr(module, "part2", None)
-    except ModuleNotFoundError as e:
-        print(f"❌ Solution module not found: {e}")
-        return
-
-    if not part1_func or not part2_func:
-        print("❌ Solution functions part1 or part2 not found.")
-        return
-
-    # Read test input and expected output
-    test_input = test_input_file.read_text().strip()
-    expected_output = expected_output_file.read_text().strip()
-
-    # Run tests using the run_tests function from elf.testing
-    elf.testing.run_tests(part1_func, part2_func, day_dir, test_input, expected_output)
+        return None
+    return test_input_file, expected_output_file
+
+
+def check_solution_part(
+    solution: SolutionFile, number: int, test_input: Path, expected_output: Path
+) -> TestResult:
+    """Loads a solution and checks one part against its example, inside a worker."""
+    # Keep the solutions' timer output from interleaving in the summary
+    with contextlib.redirect_stdout(io.StringIO()):
+        parse, part1, part2 = get_solution_functions(load_solution(solution))
+        check = check_part1_solution if number == 1 else check_part2_solution
+        context: dict[str, Any] = {}
+        return check(
+            part1 if number == 1 else part2,
+            test_input,
+            expected_output,
+            parse=parse,
+            context=context,
+        )
+
+
+def to_day_result(
+    solution: SolutionFile, number: int, outcome: IsolatedOutcome
+) -> DayTestResult:
+    return DayTestResult(
+        year=solution.year,
+        day=solution.day,
+        result=outcome_test_result(number, outcome),
+        status=outcome.status,
+        elapsed=outcome.elapsed,
+    )
+
+
+def write_junit(
+    path: Path, results: list[DayTestResult], skipped: list[SolutionFile]
+) -> None:
+    """Writes the results as a JUnit XML report, one test case per part."""
+    failures = sum(
+        r.status == RunStatus.OK and not (r.passed or r.skipped) for r in results
+    )
+    errors = sum(r.status != RunStatus.OK for r in results)
+    skipped_parts = sum(r.skipped for r in results)
+    suite = ElementTree.Element(
+        "testsuite",
+        name="elf",
+        tests=str(len(results) + len(skipped)),
+        failures=str(failures),
+        errors=str(errors),
+        skipped=str(skipped_parts + len(skipped)),
+        time=f"{sum(r.elapsed for r in results):.3f}",
+    )
+    for r in results:
+        case = ElementTree.SubElement(
+            suite,
+            "testcase",
+            classname=f"{r.year}.day{r.day:02d}",
+            name=f"part{r.result.part}",
+            time=f"{r.elapsed:.3f}",
+        )
+        if r.status != RunStatus.OK:
+            ElementTree.SubElement(
+                case, "error", message=r.result.message, type=str(r.status)
+            )
+        elif r.skipped:
+            ElementTree.SubElement(case, "skipped", message=r.result.message)
+        elif not r.passed:
+            failure = ElementTree.SubElement(case, "failure", message=r.result.message)
+            failure.text = f"expected: {r.result.expected}\nactual: {r.result.actual}"
+    for solution in skipped:
+        case = ElementTree.SubElement(
+            suite,
+            "testcase",
+            classname=f"{solution.year}.day{solution.day:02d}",
+            name="tests",
+        )
+        ElementTree.SubElement(case, "skipped", message="test files are missing")
+
+    ElementTree.indent(suite)
+    atomic_write_text(
+        path, ElementTree.tostring(suite, encoding="unicode", xml_declaration=True)
+    )
+
+
+def write_json(path: Path, results: list[DayTestResult]) -> None:
+    entries = [
+        {
+            "year": r.year,
+            "day": r.day,
+            "part": r.result.part,
+            "status": str(r.status),
+            "passed": r.passed,
+            "skipped": r.skipped,
+            "expected": r.result.expected,
+            "actual": r.result.actual,
+            "message": r.result.message,
+            "elapsed": r.elapsed,
+        }
+        for r in results
+    ]
+    atomic_write_text(path, json.dumps(entries, indent=2))
+
+
+def main(
+    year: int | None = None,
+    day: int | None = None,
+    run_all: bool = False,
+    jobs: int | None = None,
+    timeout: float | None = DEFAULT_TIMEOUT,
+    max_memory_mb: int | None = None,
+    junit: Path | None = None,
+    json_output: Path | None = None,
+) -> int:
+    if not run_all and (year is None or day is None):
+        print("❌ Give a year and day, or use --all to test every solution.")
+        return 1
+
+    solutions = discover_solutions(Path("."), year, day)
+    if not solutions:
+        print("❌ No solutions found to test.")
+        return 1
+
+    tasks = []
+    skipped = []
+    for solution in solutions:
+        files = find_test_files(solution)
+        if files is None:
+            print(f"⏭️ {solution.label}: test files are missing, skipping.")
+            skipped.append(solution)
+            continue
+        for number in (1, 2):
+            tasks.append(
+                ((solution, number), check_solution_part, (solution, number, *files))
+            )
+
+    max_workers = jobs or os.cpu_count() or 1
+    if tasks:
+        print(f"🧪 Running {len(tasks)} tests with {max_workers} elves...")
+    start_time = time.perf_counter()
+    results = []
+    for (solution, number), outcome in run_isolated_many(
+        tasks, max_workers, timeout, max_memory_mb
+    ):
+        result = to_day_result(solution, number, outcome)
+        results.append(result)
+        icon = "⏭️" if result.skipped else "✅" if result.passed else "❌"
+        print(
+            f"{icon} {solution.label} part {number} ({result.elapsed:.3f}s): "
+            f"{result.result.message}"
+        )
+    wall_seconds = time.perf_counter() - start_time
+
+    results.sort(key=lambda r: (r.year, r.day, r.result.part))
+    if junit is not None:
+        write_junit(junit, results, skipped)
+    if json_output is not None:
+        write_json(json_output, results)
+
+    passed = sum(r.passed for r in results)
+    skipped_parts = sum(r.skipped for r in results)
+    failed = len(results) - passed - skipped_parts
+    print(
+        f"🎅 {passed}/{len(results) - skipped_parts} tests passed, "
+        f"{skipped_parts} parts and {len(skipped)} days skipped, "
+        f"in {wall_seconds:.3f}s."
+    )
+    return 1 if failed else 0
@@ -0,0 +1,165 @@
+import time
+import traceback
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import elf
+from elf.bench import format_duration, unwrap_timer
+from elf.discovery import find_input_file, load_solution, reload_solution
+from elf.models import SolutionFile
+from elf.runner import apply_parse, call_part, get_solution_functions
+from elf.testing import check_part1_solution, check_part2_solution
+
+DEFAULT_INTERVAL = 0.5
+
+WATCHED_FILES = ("solution.py", "test_input.txt", "expected_output.txt")
+
+
+def snapshot(paths: list[Path]) -> dict[Path, int | None]:
+    """Records each file's modification time, None for missing files."""
+    mtimes: dict[Path, int | None] = {}
+    for path in paths:
+        try:
+            mtimes[path] = path.stat().st_mtime_ns
+        except OSError:
+            mtimes[path] = None
+    return mtimes
+
+
+def format_delta(seconds: float, previous: float | None) -> str:
+    """Formats a timing with its change against the previous run, e.g. "1.20ms (-35.0%)"."""
+    text = format_duration(seconds * 1e9)
+    if previous:
+        text += f" ({(seconds - previous) / previous:+.1%})"
+    return text
+
+
+def timed(func: Callable[..., Any], *args: Any) -> tuple[Any, float]:
+    start_time = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start_time
+
+
+def run_cycle(
+    module: ModuleType,
+    solution: SolutionFile,
+    data: list[str] | None,
+    previous: dict[str, float],
+) -> dict[str, float]:
+    """Runs the tests and then the real input once, printing timing deltas.
+
+    Args:
+        module (ModuleType): The loaded solution module.
+        solution (SolutionFile): The solution being watched.
+        data (Optional[list[str]]): The puzzle input lines, kept between runs.
+        previous (dict[str, float]): Timings from the previous run, by step.
+
+    Returns:
+        dict[str, float]: This run's timings in seconds, by step.
+    """
+    try:
+        parse, part1, part2 = get_solution_functions(module)
+    except AttributeError as e:
+        print(e)
+        return {}
+    # Timer wrappers would print a second, delta-less timing for every step
+    parse = unwrap_timer(parse) if parse is not None else None
+    parts = {1: unwrap_timer(part1), 2: unwrap_timer(part2)}
+    timings: dict[str, float] = {}
+
+    test_input = solution.base_dir / "test_input.txt"
+    expected_output = solution.base_dir / "expected_output.txt"
+    if test_input.exists() and expected_output.exists():
+        context: dict[str, Any] = {}
+        for number, check in ((1, check_part1_solution), (2, check_part2_solution)):
+            step = f"test part {number}"
+            try:
+                result, timings[step] = timed(
+                    check, parts[number], test_input, expected_output, parse, context
+                )
+            except Exception:
+                traceback.print_exc()
+                continue
+            if result.skipped:
+                print(f"⏭️ {step}: no expected answer yet")
+                continue
+            icon = "✅" if result.passed else "❌"
+            print(f"{icon} {step}: {format_delta(timings[step], previous.get(step))}")
+            if not result.passed:
+                print(f"   {result.message}")
+
+    if data is None:
+        return timings
+
+    try:
+        # A fresh copy per cycle, so a part that sorts or pops its lines can't
+        # corrupt the next run
+        parsed, timings["parse"] = timed(apply_parse, parse, list(data))
+        if parse is not None:
+            print(f"📦 parse: {format_delta(timings['parse'], previous.get('parse'))}")
+        context = {}
+        for number, func in parts.items():
+            step = f"part {number}"
+            result, timings[step] = timed(call_part, func, parsed, context)
+            print(
+                f"🎄 Part {number} Result: {result} "
+                f"in {format_delta(timings[step], previous.get(step))}"
+            )
+    except Exception:
+        traceback.print_exc()
+    return timings
+
+
+def main(year: int, day: int, interval: float = DEFAULT_INTERVAL) -> int:
+    solution_file = Path(f"{year}/day{day:02d}") / "solution.py"
+    if not solution_file.exists():
+        print(f"❌ Solution file not found: {solution_file}")
+        return 1
+    solution = SolutionFile(year=year, day=day, path=solution_file)
+
+    input_file = find_input_file(solution)
+    data = None
+    try:
+        data = (
+            elf.read_input_file(input_file)
+            if input_file is not None
+            else elf.parse_input(elf.get_input(year, day))
+        )
+    except elf.InputFetchError as e:
+        print(f"❌ Failed to fetch input, only running the tests: {e}")
+
+    watched = [solution.base_dir / name for name in WATCHED_FILES]
+    if input_file is not None:
+        watched.append(input_file)
+    mtimes = snapshot(watched)
+
+    module = None
+    previous: dict[str, float] = {}
+    print(f"👀 Watching {solution.base_dir} for changes. Press Ctrl+C to stop.")
+    try:
+        while True:
+            try:
+                if module is None:
+                    module = load_solution(solution)
+                else:
+                    reload_solution(module)
+            except Exception:
+                traceback.print_exc()
+            else:
+                print(f"🔁 {time.strftime('%H:%M:%S')} Running {solution.label}...")
+                previous = run_cycle(module, solution, data, previous) or previous
+
+            # Poll until one of the watched files changes
+            while (current := snapshot(watched)) == mtimes:
+                time.sleep(interval)
+            if input_file is not None and current[input_file] != mtimes[input_file]:
+                try:
+                    data = elf.read_input_file(input_file)
+                except FileNotFoundError as e:
+                    print(f"❌ {e}")
+            mtimes = current
+    except KeyboardInterrupt:
+        print("👋 The elves stopped watching. Happy coding!")
+    return 0
@@ -0,0 +1,194 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from elf.config import (
+    get_http_pool_size,
+    get_http_retries,
+    get_http_timeout,
+    get_session_token,
+)
+
+logger = logging.getLogger(__name__)
+
+# 🛷 Elf Sleigh Service: one pooled connection to Santa's server 🛷 #
+
+AOC_BASE_URL = "https://adventofcode.com"
+USER_AGENT = "cak (+https://github.com/cak)"
+
+
+@dataclass(slots=True)
+class RequestStats:
+    """Running totals for every request sent through an `AocClient`."""
+
+    count: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, elapsed: float, failed: bool) -> None:
+        with self._lock:
+            self.count += 1
+            self.total_seconds += elapsed
+            if failed:
+                self.errors += 1
+
+
+class RateLimiter:
+    """
+    A thread-safe limiter that spaces out requests to stay polite to Santa's server.
+
+    Args:
+        rate (float): Maximum number of requests per second. A rate of 0 or less
+            disables limiting.
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block until the caller may send its next request."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class AocClient:
+    """
+    A keep-alive HTTP client for talking to Advent of Code.
+
+    🎁 All network traffic in the elf package goes through one of these, so the
+    elves only shake hands with Santa's server once per connection.
+
+    Args:
+        pool_size (int | None): Maximum number of pooled connections. Defaults to
+            the 'ELF_HTTP_POOL_SIZE' environment variable or 10.
+        timeout (float | None): Request timeout in seconds. Defaults to the
+            'ELF_HTTP_TIMEOUT' environment variable or 30.
+        retries (int | None): Number of retries for GET requests on connection
+            errors and 5xx responses. Defaults to 'ELF_HTTP_RETRIES' or 3.
+            Answer submissions are never retried, so a guess is only sent once.
+        backoff_factor (float): Backoff factor between retries in seconds.
+    """
+
+    def __init__(
+        self,
+        pool_size: int | None = None,
+        timeout: float | None = None,
+        retries: int | None = None,
+        backoff_factor: float = 0.5,
+    ):
+        self.pool_size = pool_size if pool_size is not None else get_http_pool_size()
+        self.timeout = timeout if timeout is not None else get_http_timeout()
+        self.retries = retries if retries is not None else get_http_retries()
+        self.stats = RequestStats()
+
+        retry = Retry(
+            total=self.retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=self.pool_size, max_retries=retry
+        )
+
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": USER_AGENT})
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        session_token: str | None = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Send an authenticated request to Advent of Code and time it.
+
+        Args:
+            method (str): The HTTP method, e.g. "GET" or "POST".
+            path (str): The path below the Advent of Code base URL, e.g. "/2024/day/1/input".
+            session_token (str | None): Your session token. If not provided,
+                it will be retrieved from the environment variable 'AOC_SESSION_COOKIE'.
+            **kwargs: Extra arguments passed on to `requests.Session.request`.
+
+        Returns:
+            requests.Response: The response, after `raise_for_status` has been checked.
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails.
+        """
+        session_token = get_session_token(session_token)
+        kwargs.setdefault("timeout", self.timeout)
+
+        url = f"{AOC_BASE_URL}{path}"
+        start_time = time.perf_counter()
+        failed = True
+        try:
+            response = self.session.request(
+                method, url, headers={"Cookie": f"session={session_token}"}, **kwargs
+            )
+            response.raise_for_status()
+            failed = False
+            return response
+        finally:
+            elapsed = time.perf_counter() - start_time
+            self.stats.record(elapsed, failed)
+            logger.debug(f"{method} {url} took {elapsed:.3f}s (failed={failed})")
+
+    def get(
+        self, path: str, session_token: str | None = None, **kwargs
+    ) -> requests.Response:
+        """Send an authenticated GET request. See `AocClient.request`."""
+        return self.request("GET", path, session_token, **kwargs)
+
+    def post(
+        self, path: str, session_token: str | None = None, **kwargs
+    ) -> requests.Response:
+        """Send an authenticated POST request. See `AocClient.request`."""
+        return self.request("POST", path, session_token, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_client: AocClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> AocClient:
+    """Return the shared module-level `AocClient`, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = AocClient()
+    return _client
+
+
+def set_client(client: AocClient | None) -> None:
+    """Replace the shared `AocClient`, e.g. to change pool size or timeouts.
+
+    Passing `None` closes the current client; a fresh one is created on next use.
+    """
+    global _client
+    with _client_lock:
+        if _client is not None and _client is not client:
+            _client.close()
+        _client = client
@@ -82,3 +82,95 @@ def get_cache_input_file(year: int, day: int) -> Path:
     cache_dir = get_cache_dir()
     cache_file = cache_dir / f"{year:04d}" / f"{day:02d}" / "input.txt"
     return cache_file
+
+
+def get_http_timeout() -> float:
+    """Return the timeout in seconds for requests to Advent of Code.
+
+    Reads the 'ELF_HTTP_TIMEOUT' environment variable, defaulting to 30 seconds.
+
+    Returns:
+        float: The request timeout in seconds.
+    """
+    return float(os.getenv("ELF_HTTP_TIMEOUT", "30"))
+
+
+def get_http_retries() -> int:
+    """Return how many times idempotent requests are retried on failure.
+
+    Reads the 'ELF_HTTP_RETRIES' environment variable, defaulting to 3 retries.
+
+    Returns:
+        int: The number of retries.
+    """
+    return int(os.getenv("ELF_HTTP_RETRIES", "3"))
+
+
+def get_http_pool_size() -> int:
+    """Return the size of the keep-alive connection pool.
+
+    Reads the 'ELF_HTTP_POOL_SIZE' environment variable, defaulting to 10 connections.
+
+    Returns:
+        int: The maximum number of pooled connections.
+    """
+    return int(os.getenv("ELF_HTTP_POOL_SIZE", "10"))
+
+
+def get_cache_guess_db() -> Path:
+    """Get the path to the SQLite database for storing guesses.
+
+    Returns:
+        Path: The path to the guesses database.
+    """
+    return get_cache_dir() / "guesses.sqlite3"
+
+
+def get_guess_store_backend() -> str:
+    """Return the name of the backend used to store guesses.
+
+    Reads the 'ELF_GUESS_STORE' environment variable, which may be 'sqlite'
+    (the default) or 'csv'.
+
+    Returns:
+        str: The guess store backend name.
+    """
+    return os.getenv("ELF_GUESS_STORE", "sqlite").lower()
+
+
+def get_cache_bench_file() -> Path:
+    """Get the path to the JSON file holding the latest `elf bench` results.
+
+    Returns:
+        Path: The path to the benchmark results file.
+    """
+    return get_cache_dir() / "bench" / "latest.json"
+
+
+def get_cache_timings_file() -> Path:
+    """Get the path to the JSON file holding each day's last `elf run-all` time.
+
+    Returns:
+        Path: The path to the timings file.
+    """
+    return get_cache_dir() / "run_all" / "timings.json"
+
+
+def get_cache_results_dir() -> Path:
+    """Get the directory holding memoized solution results.
+
+    Returns:
+        Path: The path to the result cache directory.
+    """
+    return get_cache_dir() / "results"
+
+
+def get_result_cache_max_bytes() -> int:
+    """Return how large the result cache may grow before old entries are evicted.
+
+    Reads the 'ELF_RESULT_CACHE_MAX_BYTES' environment variable, defaulting to 16 MiB.
+
+    Returns:
+        int: The maximum total size of the result cache in bytes.
+    """
+    return int(os.getenv("ELF_RESULT_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
@@ -0,0 +1,101 @@
+import importlib.util
+import re
+import sys
+from pathlib import Path
+from types import ModuleType
+
+from elf.config import get_cache_input_file
+from elf.models import SolutionFile
+
+# 🔭 Elf Discovery: find and load the YYYY/dayNN/solution.py files 🔭 #
+
+_DAY_DIR_PATTERN = re.compile(r"day(\d{2})")
+
+
+def discover_solutions(
+    root: Path = Path("."), year: int | None = None, day: int | None = None
+) -> list[SolutionFile]:
+    """Finds every `YYYY/dayNN/solution.py` below the repository root.
+
+    🗺️ The elves check every chimney, in year and day order!
+
+    Args:
+        root (Path): The repository root containing the year folders.
+        year (Optional[int]): Only include solutions for this year.
+        day (Optional[int]): Only include solutions for this day.
+
+    Returns:
+        list[SolutionFile]: The solutions found, sorted by year and day.
+    """
+    solutions = []
+    for path in root.glob("[0-9][0-9][0-9][0-9]/day[0-9][0-9]/solution.py"):
+        match = _DAY_DIR_PATTERN.fullmatch(path.parent.name)
+        if match is None:
+            continue
+        solution = SolutionFile(
+            year=int(path.parent.parent.name), day=int(match.group(1)), path=path
+        )
+        if year is not None and solution.year != year:
+            continue
+        if day is not None and solution.day != day:
+            continue
+        solutions.append(solution)
+    return sorted(solutions, key=lambda s: (s.year, s.day))
+
+
+def load_solution(solution: SolutionFile) -> ModuleType:
+    """Imports a solution file as a module without running its `__main__` block.
+
+    Args:
+        solution (SolutionFile): The solution to load.
+
+    Returns:
+        ModuleType: The imported module, exposing `part1` and `part2`.
+    """
+    module_name = f"elf_solution_{solution.year}_day{solution.day:02d}"
+    spec = importlib.util.spec_from_file_location(module_name, solution.path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"❌ Cannot load solution file: {solution.path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def reload_solution(module: ModuleType) -> ModuleType:
+    """Re-runs an edited solution file inside its already loaded module.
+
+    Works like `importlib.reload`, which can't find solution modules again
+    because they aren't on `sys.path`. The source is compiled afresh rather
+    than read from `__pycache__`, whose timestamps can miss quick edits.
+
+    Args:
+        module (ModuleType): A module returned by `load_solution`.
+
+    Returns:
+        ModuleType: The same module, with its functions redefined.
+    """
+    path = Path(module.__file__)
+    code = compile(path.read_bytes(), str(path), "exec", dont_inherit=True)
+    exec(code, module.__dict__)
+    return module
+
+
+def find_input_file(solution: SolutionFile) -> Path | None:
+    """Finds the puzzle input for a solution without touching the network.
+
+    Looks for `input.txt` next to the solution first, then in the elf cache.
+
+    Args:
+        solution (SolutionFile): The solution whose input is needed.
+
+    Returns:
+        Optional[Path]: The input file, or None if it hasn't been fetched yet.
+    """
+    for candidate in (
+        solution.base_dir / "input.txt",
+        get_cache_input_file(solution.year, solution.day),
+    ):
+        if candidate.exists():
+            return candidate
+    return None
@@ -33,3 +33,15 @@ class MissingSessionTokenError(ValueError):
             f"🎅 Oh no! Santa's session cookie is missing. Please set the '{env_var}' "
             "environment variable or pass the session token explicitly. 🎄"
         )
+
+
+class TimeLimitExceeded(BaseException):
+    """Raised inside an isolated run when its time limit expires.
+
+    Like `KeyboardInterrupt`, it derives from `BaseException`, so a broad
+    `except Exception:` in a solution's search code cannot swallow it.
+    """
+
+    def __init__(self, seconds: float):
+        super().__init__(f"TIMEOUT after {seconds:g}s")
+        self.seconds = seconds
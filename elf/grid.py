@@ -0,0 +1,193 @@
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+
+from elf.parsers import char_grid
+
+# 🗺️ Elf Map Room: flat, bordered grids for the puzzles that live on a map 🗺️ #
+#
+# A `Grid` keeps every cell in one `bytearray`, row after row, surrounded by a
+# one-cell border of `SENTINEL` bytes. A neighbour is then just `index + offset`
+# with an offset from `offsets4`/`offsets8`, and walking off the map lands on a
+# sentinel instead of needing a bounds check:
+#
+#     grid = Grid.parse(data)
+#     for index in grid.find_all("@"):
+#         rolls = sum(grid.cells[index + d] == ord("@") for d in grid.offsets8)
+
+SENTINEL = 0
+
+
+@dataclass(slots=True)
+class Grid:
+    """A rectangular character grid stored as one bordered `bytearray`.
+
+    🗺️ Cell (row, col) lives at `index(row, col)`; the border cells hold
+    `SENTINEL`. `offsets4` is up, right, down, left and `offsets8` goes
+    clockwise from up, so turning right is one step (or two) along the tuple.
+    """
+
+    cells: bytearray
+    width: int
+    height: int
+    stride: int = field(init=False)
+    offsets4: tuple[int, int, int, int] = field(init=False)
+    offsets8: tuple[int, ...] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.stride = stride = self.width + 2
+        if len(self.cells) != stride * (self.height + 2):
+            raise ValueError(
+                f"❗ Expected {stride * (self.height + 2)} bordered cells, "
+                f"found {len(self.cells)}."
+            )
+        self.offsets4 = (-stride, 1, stride, -1)
+        self.offsets8 = (
+            -stride,
+            -stride + 1,
+            1,
+            stride + 1,
+            stride,
+            stride - 1,
+            -1,
+            -stride - 1,
+        )
+
+    @classmethod
+    def parse(cls, data: str | Sequence[str]) -> "Grid":
+        """Parses a rectangular grid of characters, adding the sentinel border.
+
+        Args:
+            data (str | Sequence[str]): The raw input text or its lines.
+
+        Returns:
+            Grid: The bordered grid.
+
+        Raises:
+            ValueError: If the lines do not all have the same width.
+        """
+        flat, width, height = char_grid(data)
+        stride = width + 2
+        cells = bytearray([SENTINEL]) * (stride * (height + 2))
+        for row in range(height):
+            start = (row + 1) * stride + 1
+            cells[start : start + width] = flat[row * width : (row + 1) * width]
+        return cls(cells, width, height)
+
+    def index(self, row: int, col: int) -> int:
+        """Returns the cell index of (row, col)."""
+        return (row + 1) * self.stride + col + 1
+
+    def position(self, index: int) -> tuple[int, int]:
+        """Returns the (row, col) of a cell index."""
+        row, col = divmod(index, self.stride)
+        return row - 1, col - 1
+
+    def __contains__(self, index: int) -> bool:
+        return 0 <= index < len(self.cells) and self.cells[index] != SENTINEL
+
+    def find(self, char: str) -> int:
+        """Returns the index of the first cell holding `char`, or -1."""
+        return self.cells.find(ord(char))
+
+    def find_all(self, char: str) -> list[int]:
+        """Returns the indices of every cell holding `char`, in reading order."""
+        value = ord(char)
+        found = []
+        index = self.cells.find(value)
+        while index != -1:
+            found.append(index)
+            index = self.cells.find(value, index + 1)
+        return found
+
+    def ray(self, index: int, offset: int) -> Iterator[int]:
+        """Yields the cells from `index` (exclusive) in one direction to the border.
+
+        Args:
+            index (int): The starting cell.
+            offset (int): The direction, usually from `offsets4` or `offsets8`.
+
+        Yields:
+            int: The index of each cell along the ray.
+        """
+        cells = self.cells
+        index += offset
+        while cells[index] != SENTINEL:
+            yield index
+            index += offset
+
+    def line(self, index: int, offset: int, length: int) -> bytes:
+        """Reads up to `length` cells from `index` (inclusive) in one direction.
+
+        🔍 `grid.line(i, grid.offsets8[2], 4) == b"XMAS"` checks a word without
+        building a string per cell. The result is shorter when the border is
+        reached first.
+
+        Args:
+            index (int): The starting cell.
+            offset (int): The direction, usually from `offsets4` or `offsets8`.
+            length (int): The number of cells to read.
+
+        Returns:
+            bytes: The cells' characters.
+        """
+        end = index + offset * length
+        segment = bytes(self.cells[index : end if end >= 0 else None : offset])
+        cut = segment.find(SENTINEL)
+        return segment if cut == -1 else segment[:cut]
+
+    def rows(self) -> Iterator[bytes]:
+        """Yields each row's characters, without the border."""
+        for row in range(self.height):
+            start = self.index(row, 0)
+            yield bytes(self.cells[start : start + self.width])
+
+    def copy(self) -> "Grid":
+        return Grid(self.cells.copy(), self.width, self.height)
+
+    def bitmap(self) -> "Bitmap":
+        """Returns an empty `Bitmap` with one bit per cell, for visited sets."""
+        return Bitmap(len(self.cells))
+
+    def __str__(self) -> str:
+        return "\n".join(row.decode() for row in self.rows())
+
+
+class Bitmap:
+    """A set of cell indices stored as one bit per cell.
+
+    🧮 A 130x130 map needs about 2 KB instead of the hundreds of kilobytes a
+    `set` of ints takes, and it can be copied or cleared in one go.
+    """
+
+    __slots__ = ("bits", "size")
+
+    def __init__(self, size: int):
+        self.size = size
+        self.bits = bytearray((size + 7) >> 3)
+
+    def add(self, index: int) -> None:
+        self.bits[index >> 3] |= 1 << (index & 7)
+
+    def discard(self, index: int) -> None:
+        self.bits[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def __contains__(self, index: int) -> bool:
+        return bool(self.bits[index >> 3] >> (index & 7) & 1)
+
+    def __len__(self) -> int:
+        return int.from_bytes(self.bits, "little").bit_count()
+
+    def __iter__(self) -> Iterator[int]:
+        for byte_index, byte in enumerate(self.bits):
+            while byte:
+                lowest = byte & -byte
+                yield (byte_index << 3) + lowest.bit_length() - 1
+                byte ^= lowest
+
+    def clear(self) -> None:
+        self.bits[:] = bytes(len(self.bits))
+
+    def copy(self) -> "Bitmap":
+        bitmap = Bitmap(self.size)
+        bitmap.bits[:] = self.bits
+        return bitmap
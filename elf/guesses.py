@@ -0,0 +1,547 @@
+import csv
+import logging
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+
+from elf.config import (
+    get_cache_dir,
+    get_cache_guess_db,
+    get_cache_guess_file,
+    get_guess_store_backend,
+)
+from elf.messages import (
+    get_cached_duplicate_message,
+    get_cached_high_message,
+    get_cached_low_message,
+)
+from elf.models import CachedGuessCheck, Guess, SubmissionStatus
+
+logger = logging.getLogger(__name__)
+
+# 📜 Santa's List of Guesses 📜 #
+
+_SQLITE_INT_MIN = -(2**63)
+_SQLITE_INT_MAX = 2**63 - 1
+
+
+def _parse_guess_value(value: str) -> int | str:
+    # Try to convert to int if possible, keep as str otherwise
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+class GuessStore(ABC):
+    """Where the elves keep every answer you've submitted."""
+
+    @abstractmethod
+    def add(self, year: int, day: int, guess: Guess) -> None:
+        """Record a guess."""
+
+    @abstractmethod
+    def read(self, year: int, day: int) -> list[Guess]:
+        """Return every guess for a day, oldest first."""
+
+    @abstractmethod
+    def find_correct(
+        self, year: int, day: int, part: int, answer: int | str
+    ) -> Guess | None:
+        """Return the CORRECT guess equal to `answer`, if there is one."""
+
+    @abstractmethod
+    def highest_too_low(self, year: int, day: int, part: int) -> Guess | None:
+        """Return the highest integer guess that was TOO_LOW, if there is one."""
+
+    @abstractmethod
+    def lowest_too_high(self, year: int, day: int, part: int) -> Guess | None:
+        """Return the lowest integer guess that was TOO_HIGH, if there is one."""
+
+
+class CsvGuessStore(GuessStore):
+    """Stores guesses in one `guesses.csv` file per day, as elf always has."""
+
+    fieldnames = ("timestamp", "part", "guess", "status")
+
+    def add(self, year: int, day: int, guess: Guess) -> None:
+        cache_file = get_cache_guess_file(year, day)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            # Determine if the file exists to decide on writing the header
+            file_exists = cache_file.exists()
+
+            # Open the CSV file in append mode using pathlib
+            with cache_file.open("a", newline="") as csvfile:
+                writer = csv.DictWriter(csvfile, fieldnames=self.fieldnames)
+
+                # Write the header if the file is new
+                if not file_exists:
+                    writer.writeheader()
+
+                # Write the guess data as a new row
+                writer.writerow(
+                    {
+                        "timestamp": guess.timestamp.isoformat(),
+                        "part": guess.part,
+                        "guess": str(guess.guess),
+                        "status": guess.status.name,
+                    }
+                )
+        except OSError as e:
+            logger.error(f"OS error while writing to {cache_file}: {e}")
+        except Exception as e:
+            logger.exception(f"Unexpected error while writing to {cache_file}: {e}")
+
+    def read(self, year: int, day: int) -> list[Guess]:
+        return read_csv_guesses(get_cache_guess_file(year, day))
+
+    def _guesses_for_part(self, year: int, day: int, part: int) -> list[Guess]:
+        return [guess for guess in self.read(year, day) if guess.part == part]
+
+    def find_correct(
+        self, year: int, day: int, part: int, answer: int | str
+    ) -> Guess | None:
+        for guess in self._guesses_for_part(year, day, part):
+            if guess.status == SubmissionStatus.CORRECT and str(guess.guess) == str(
+                answer
+            ):
+                return guess
+        return None
+
+    def highest_too_low(self, year: int, day: int, part: int) -> Guess | None:
+        too_low = [
+            guess
+            for guess in self._guesses_for_part(year, day, part)
+            if guess.status == SubmissionStatus.TOO_LOW and isinstance(guess.guess, int)
+        ]
+        return max(too_low, key=lambda guess: guess.guess, default=None)
+
+    def lowest_too_high(self, year: int, day: int, part: int) -> Guess | None:
+        too_high = [
+            guess
+            for guess in self._guesses_for_part(year, day, part)
+            if guess.status == SubmissionStatus.TOO_HIGH
+            and isinstance(guess.guess, int)
+        ]
+        return min(too_high, key=lambda guess: guess.guess, default=None)
+
+
+class SqliteGuessStore(GuessStore):
+    """
+    Stores guesses in one SQLite database indexed on (year, day, part, status).
+
+    🗂️ Bound checks are single indexed queries instead of a full file rescan.
+    Guesses from existing `guesses.csv` files are imported the first time a
+    day is looked at, so no history is lost when switching backends.
+
+    Args:
+        path (Path | None): The database file. Defaults to `get_cache_guess_db()`.
+    """
+
+    _schema = """
+        CREATE TABLE IF NOT EXISTS guesses (
+            id INTEGER PRIMARY KEY,
+            year INTEGER NOT NULL,
+            day INTEGER NOT NULL,
+            part INTEGER NOT NULL,
+            status TEXT NOT NULL,
+            guess TEXT NOT NULL,
+            guess_int INTEGER,
+            timestamp TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS guesses_lookup
+            ON guesses (year, day, part, status, guess_int);
+        CREATE TABLE IF NOT EXISTS csv_imports (
+            year INTEGER NOT NULL,
+            day INTEGER NOT NULL,
+            PRIMARY KEY (year, day)
+        );
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or get_cache_guess_db()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._imported: set[tuple[int, int]] = set()
+        self._connection = sqlite3.connect(
+            self.path, timeout=30, check_same_thread=False
+        )
+        with self._lock, self._connection:
+            self._connection.executescript(self._schema)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    @staticmethod
+    def _row_to_guess(row: tuple) -> Guess:
+        timestamp, part, guess, guess_int, status = row
+        try:
+            parsed_status = SubmissionStatus[status]
+        except KeyError:
+            logger.warning(f"Unknown status '{status}' in cache.")
+            parsed_status = SubmissionStatus.UNKNOWN
+        return Guess(
+            timestamp=datetime.fromisoformat(timestamp),
+            part=part,
+            guess=guess_int if guess_int is not None else guess,
+            status=parsed_status,
+        )
+
+    def _insert(self, year: int, day: int, guess: Guess) -> None:
+        guess_int = guess.guess if isinstance(guess.guess, int) else None
+        if guess_int is not None and not (
+            _SQLITE_INT_MIN <= guess_int <= _SQLITE_INT_MAX
+        ):
+            guess_int = None
+        self._connection.execute(
+            "INSERT INTO guesses (year, day, part, status, guess, guess_int, timestamp) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                year,
+                day,
+                guess.part,
+                guess.status.name,
+                str(guess.guess),
+                guess_int,
+                guess.timestamp.isoformat(),
+            ),
+        )
+
+    def import_csv(self, year: int, day: int) -> int:
+        """
+        Import a day's `guesses.csv` into the database, once.
+
+        Returns:
+            int: The number of guesses imported (0 if already imported or no file).
+        """
+        with self._lock:
+            if (year, day) in self._imported:
+                return 0
+            with self._connection:
+                already_imported = self._connection.execute(
+                    "SELECT 1 FROM csv_imports WHERE year = ? AND day = ?",
+                    (year, day),
+                ).fetchone()
+                guesses = []
+                if not already_imported:
+                    guesses = read_csv_guesses(get_cache_guess_file(year, day))
+                    for guess in guesses:
+                        self._insert(year, day, guess)
+                    self._connection.execute(
+                        "INSERT INTO csv_imports (year, day) VALUES (?, ?)",
+                        (year, day),
+                    )
+            self._imported.add((year, day))
+            return len(guesses)
+
+    def _query_one(self, year: int, day: int, sql: str, params: tuple) -> Guess | None:
+        self.import_csv(year, day)
+        with self._lock:
+            row = self._connection.execute(sql, params).fetchone()
+        return self._row_to_guess(row) if row else None
+
+    def add(self, year: int, day: int, guess: Guess) -> None:
+        self.import_csv(year, day)
+        try:
+            with self._lock, self._connection:
+                self._insert(year, day, guess)
+        except sqlite3.Error as e:
+            logger.error(f"SQLite error while writing to {self.path}: {e}")
+
+    def read(self, year: int, day: int) -> list[Guess]:
+        self.import_csv(year, day)
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT timestamp, part, guess, guess_int, status FROM guesses "
+                "WHERE year = ? AND day = ? ORDER BY id",
+                (year, day),
+            ).fetchall()
+        return [self._row_to_guess(row) for row in rows]
+
+    def find_correct(
+        self, year: int, day: int, part: int, answer: int | str
+    ) -> Guess | None:
+        return self._query_one(
+            year,
+            day,
+            "SELECT timestamp, part, guess, guess_int, status FROM guesses "
+            "WHERE year = ? AND day = ? AND part = ? AND status = ? AND guess = ? "
+            "LIMIT 1",
+            (year, day, part, SubmissionStatus.CORRECT.name, str(answer)),
+        )
+
+    def highest_too_low(self, year: int, day: int, part: int) -> Guess | None:
+        return self._query_one(
+            year,
+            day,
+            "SELECT timestamp, part, guess, guess_int, status FROM guesses "
+            "WHERE year = ? AND day = ? AND part = ? AND status = ? "
+            "AND guess_int IS NOT NULL ORDER BY guess_int DESC LIMIT 1",
+            (year, day, part, SubmissionStatus.TOO_LOW.name),
+        )
+
+    def lowest_too_high(self, year: int, day: int, part: int) -> Guess | None:
+        return self._query_one(
+            year,
+            day,
+            "SELECT timestamp, part, guess, guess_int, status FROM guesses "
+            "WHERE year = ? AND day = ? AND part = ? AND status = ? "
+            "AND guess_int IS NOT NULL ORDER BY guess_int ASC LIMIT 1",
+            (year, day, part, SubmissionStatus.TOO_HIGH.name),
+        )
+
+
+def read_csv_guesses(cache_file: Path) -> list[Guess]:
+    """Read every guess from a `guesses.csv` file."""
+    guesses = []
+
+    if not cache_file.exists():
+        return guesses
+
+    try:
+        with cache_file.open("r", newline="") as csvfile:
+            reader = csv.DictReader(csvfile)
+            for row in reader:
+                try:
+                    status = SubmissionStatus[row["status"]]
+                except KeyError:
+                    logger.warning(f"Unknown status '{row['status']}' in cache.")
+                    status = SubmissionStatus.UNKNOWN
+
+                try:
+                    timestamp = datetime.fromisoformat(row["timestamp"])
+                except ValueError:
+                    logger.warning(f"Invalid timestamp format: {row['timestamp']}")
+                    timestamp = datetime.utcnow()
+
+                guess = Guess(
+                    timestamp=timestamp,
+                    part=int(row["part"]),
+                    guess=_parse_guess_value(row["guess"]),
+                    status=status,
+                )
+                guesses.append(guess)
+    except OSError as e:
+        logger.error(f"OS error while reading {cache_file}: {e}")
+    except Exception as e:
+        logger.exception(f"Unexpected error while reading {cache_file}: {e}")
+
+    return guesses
+
+
+class GuessIndex:
+    """
+    In-memory bounds of every guess for one (year, day, part).
+
+    🧮 Keeps the tightest TOO_LOW/TOO_HIGH bounds, the set of rejected answers
+    and the known CORRECT answer, so candidate answers can be checked without
+    touching the guess store. Use `get_guess_index` to get one that stays up to
+    date as `write_guess_cache` records new guesses.
+
+    Args:
+        part (int): The part the index covers.
+        guesses (Iterable[Guess]): Guesses to start from; other parts are ignored.
+    """
+
+    def __init__(self, part: int, guesses: Iterable[Guess] = ()):
+        self.part = part
+        self.highest_low: Guess | None = None
+        self.lowest_high: Guess | None = None
+        self.correct: Guess | None = None
+        self.rejected: dict[str, Guess] = {}
+        for guess in guesses:
+            self.add(guess)
+
+    def add(self, guess: Guess) -> None:
+        """Fold one more guess into the index."""
+        if guess.part != self.part:
+            return
+
+        value = guess.guess
+        match guess.status:
+            case SubmissionStatus.CORRECT:
+                self.correct = guess
+                return
+            case SubmissionStatus.TOO_LOW if isinstance(value, int):
+                if self.highest_low is None or value > self.highest_low.guess:
+                    self.highest_low = guess
+            case SubmissionStatus.TOO_HIGH if isinstance(value, int):
+                if self.lowest_high is None or value < self.lowest_high.guess:
+                    self.lowest_high = guess
+            case (
+                SubmissionStatus.TOO_LOW
+                | SubmissionStatus.TOO_HIGH
+                | SubmissionStatus.INCORRECT
+            ):
+                pass
+            case _:
+                return
+        self.rejected.setdefault(str(value), guess)
+
+    def is_possible(self, answer: int | str) -> bool:
+        """Return False if the guesses so far already rule `answer` out."""
+        if self.correct is not None:
+            return str(answer) == str(self.correct.guess)
+        if str(answer) in self.rejected:
+            return False
+        if isinstance(answer, int):
+            if self.highest_low is not None and answer <= self.highest_low.guess:
+                return False
+            if self.lowest_high is not None and answer >= self.lowest_high.guess:
+                return False
+        return True
+
+    def filter(self, candidates: Iterable[int | str]) -> list[int | str]:
+        """Return the candidates that are still worth submitting, in order."""
+        return [candidate for candidate in candidates if self.is_possible(candidate)]
+
+    def check(self, answer: int | str) -> CachedGuessCheck:
+        """
+        Check an answer against the index, like `check_cached_guesses`.
+
+        Answers that were already rejected come back with their previous status.
+        """
+        if self.correct is not None and str(answer) == str(self.correct.guess):
+            return self._cached_check(
+                answer,
+                self.correct,
+                SubmissionStatus.CORRECT,
+                get_cached_duplicate_message(
+                    answer=answer, previous_guess=self.correct
+                ),
+            )
+
+        if isinstance(answer, int):
+            h_low = self.highest_low
+            if h_low is not None and answer <= h_low.guess:
+                return self._cached_check(
+                    answer,
+                    h_low,
+                    SubmissionStatus.TOO_LOW,
+                    get_cached_low_message(answer=answer, highest_low_guess=h_low),
+                )
+            l_high = self.lowest_high
+            if l_high is not None and answer >= l_high.guess:
+                return self._cached_check(
+                    answer,
+                    l_high,
+                    SubmissionStatus.TOO_HIGH,
+                    get_cached_high_message(answer=answer, lowest_high_guess=l_high),
+                )
+
+        if rejected := self.rejected.get(str(answer)):
+            return self._cached_check(
+                answer,
+                rejected,
+                rejected.status,
+                get_cached_duplicate_message(answer=answer, previous_guess=rejected),
+            )
+
+        return CachedGuessCheck(
+            guess=answer,
+            previous_guess=None,
+            previous_timestamp=None,
+            status=SubmissionStatus.UNKNOWN,
+            message="This is a unique guess.",
+        )
+
+    @staticmethod
+    def _cached_check(
+        answer: int | str, previous: Guess, status: SubmissionStatus, message: str
+    ) -> CachedGuessCheck:
+        return CachedGuessCheck(
+            guess=answer,
+            previous_guess=previous.guess,
+            previous_timestamp=previous.timestamp,
+            status=status,
+            message=message,
+        )
+
+
+def migrate_csv_guesses(store: SqliteGuessStore | None = None) -> int:
+    """
+    Import every `guesses.csv` in the cache directory into the SQLite store.
+
+    Days are only imported once, so this is safe to run repeatedly.
+
+    Args:
+        store (SqliteGuessStore | None): The store to import into. Defaults to a
+            store at `get_cache_guess_db()`.
+
+    Returns:
+        int: The number of guesses imported.
+    """
+    store = store or SqliteGuessStore()
+    imported = 0
+    for cache_file in sorted(get_cache_dir().glob("*/*/guesses.csv")):
+        try:
+            year, day = int(cache_file.parent.parent.name), int(cache_file.parent.name)
+        except ValueError:
+            continue
+        imported += store.import_csv(year, day)
+    return imported
+
+
+_store: GuessStore | None = None
+_store_lock = threading.Lock()
+_indexes: dict[tuple[int, int, int], GuessIndex] = {}
+
+
+def get_guess_store() -> GuessStore:
+    """
+    Return the shared guess store selected by the 'ELF_GUESS_STORE' environment variable.
+
+    Raises:
+        ValueError: If the configured backend is unknown.
+    """
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                backend = get_guess_store_backend()
+                if backend == "sqlite":
+                    _store = SqliteGuessStore()
+                elif backend == "csv":
+                    _store = CsvGuessStore()
+                else:
+                    raise ValueError(
+                        f"🎅 Unknown guess store '{backend}'. "
+                        "Set 'ELF_GUESS_STORE' to 'sqlite' or 'csv'. 🎄"
+                    )
+    return _store
+
+
+def set_guess_store(store: GuessStore | None) -> None:
+    """Replace the shared guess store. Passing `None` resets it to the configured one."""
+    global _store
+    with _store_lock:
+        _store = store
+        _indexes.clear()
+
+
+def get_guess_index(year: int, day: int, part: int) -> GuessIndex:
+    """
+    Return the shared `GuessIndex` for a puzzle part, loading it from the store once.
+
+    The index is kept up to date with every guess recorded by `record_guess`.
+    """
+    key = (year, day, part)
+    index = _indexes.get(key)
+    if index is None:
+        guesses = get_guess_store().read(year, day)
+        with _store_lock:
+            index = _indexes.setdefault(key, GuessIndex(part, guesses))
+    return index
+
+
+def record_guess(year: int, day: int, guess: Guess) -> None:
+    """Add a guess to the guess store and to any loaded `GuessIndex`."""
+    get_guess_store().add(year, day, guess)
+    if index := _indexes.get((year, day, guess.part)):
+        with _store_lock:
+            index.add(guess)
@@ -1,12 +1,16 @@
-from collections.abc import Callable
+import mmap
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
-
-import requests
+from typing import TYPE_CHECKING, Any
 
 from elf.config import get_cache_input_file, get_session_token
 from elf.exceptions import InputFetchError
-from elf.utils import parse_input
+from elf.utils import atomic_write_text, parse_input
+
+if TYPE_CHECKING:
+    from elf.models import PrefetchResult
 
 # 🎁 Elf Magic Input Fetcher 🎁 #
 
@@ -37,22 +41,17 @@ def get_input(year: int, day: int, session_token: str | None = None) -> str:
     if cache_file.exists():
         return cache_file.read_text(encoding="utf-8").rstrip()
 
-    url = f"https://adventofcode.com/{year}/day/{day}/input"
-    headers = {
-        "Cookie": f"session={session_token}",
-        "User-Agent": "cak (+https://github.com/cak)",
-    }
+    # Network dependencies are only imported when a download is needed
+    import requests
+
+    from elf.client import get_client
 
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
+        response = get_client().get(f"/{year}/day/{day}/input", session_token)
         input_data = response.text.rstrip()
 
-        # Ensure the cache directory exists
-        cache_file.parent.mkdir(parents=True, exist_ok=True)
-
         # Save the input data to cache
-        cache_file.write_text(input_data, encoding="utf-8")
+        atomic_write_text(cache_file, input_data)
 
         return input_data
     except requests.exceptions.RequestException as e:
@@ -61,6 +60,65 @@ def get_input(year: int, day: int, session_token: str | None = None) -> str:
         ) from e
 
 
+def prefetch_inputs(
+    puzzles: Iterable[tuple[int, int]],
+    max_workers: int = 4,
+    rate: float = 2.0,
+    session_token: str | None = None,
+) -> list["PrefetchResult"]:
+    """
+    Fetch many puzzle inputs into the cache concurrently.
+
+    🛷 A whole team of elves fetches the inputs, but they take turns knocking on
+    Santa's door so the server isn't flooded.
+
+    Args:
+        puzzles (Iterable[tuple[int, int]]): The (year, day) pairs to fetch.
+        max_workers (int): Maximum number of concurrent downloads.
+        rate (float): Maximum number of requests per second across all workers.
+            A rate of 0 or less disables limiting.
+        session_token (Optional[str]): Your Advent of Code session token. If not provided,
+            it will be retrieved from the environment variable 'AOC_SESSION_COOKIE'.
+
+    Returns:
+        list[PrefetchResult]: One result per puzzle, in the order they were given.
+
+    Raises:
+        ValueError: If the session token is not provided and not found in the environment.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from elf.client import RateLimiter
+    from elf.models import FetchStatus, PrefetchResult
+
+    session_token = get_session_token(session_token)
+    limiter = RateLimiter(rate)
+
+    def fetch(puzzle: tuple[int, int]) -> PrefetchResult:
+        year, day = puzzle
+        cache_file = get_cache_input_file(year, day)
+        if cache_file.exists():
+            return PrefetchResult(
+                year, day, FetchStatus.CACHED, cache_file.stat().st_size, 0.0
+            )
+
+        limiter.wait()
+        start_time = time.perf_counter()
+        try:
+            input_data = get_input(year, day, session_token)
+        except (InputFetchError, OSError) as e:
+            # A failed cache write loses only this puzzle, not the whole batch
+            elapsed = time.perf_counter() - start_time
+            return PrefetchResult(year, day, FetchStatus.FAILED, 0, elapsed, str(e))
+        elapsed = time.perf_counter() - start_time
+        return PrefetchResult(
+            year, day, FetchStatus.FETCHED, len(input_data.encode()), elapsed
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(fetch, puzzles))
+
+
 def read_input_file(
     filename: str | Path, parser: Callable[[str], Any] = parse_input
 ) -> Any:
@@ -85,3 +143,56 @@ def read_input_file(
             f"❗ {filepath} not found. 🎄 The elves must have misplaced it! 🎁"
         )
     return parser(filepath.read_text())
+
+
+@contextmanager
+def open_input_buffer(filename: str | Path) -> Iterator[mmap.mmap | bytes]:
+    """Memory-map an input file for zero-copy reading.
+
+    🎁 Peeking at the puzzle input without unwrapping a single copy! 🎄
+
+    The buffer supports slicing, `find`, `re` searches and `hashlib` directly.
+    Any `memoryview` taken from it must be released before the block exits.
+
+    Args:
+        filename (Union[str, Path]): The path to the input file.
+
+    Yields:
+        mmap.mmap | bytes: A read-only buffer over the file contents
+            (an empty `bytes` object for an empty file, which cannot be mapped).
+
+    Raises:
+        FileNotFoundError: If the input file does not exist.
+    """
+    filepath = Path(filename)
+    if not filepath.exists():
+        raise FileNotFoundError(
+            f"❗ {filepath} not found. 🎄 The elves must have misplaced it! 🎁"
+        )
+    with filepath.open("rb") as file:
+        if filepath.stat().st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
+
+
+def read_input_bytes(
+    filename: str | Path, parser: Callable[[mmap.mmap | bytes], Any] = bytes
+) -> Any:
+    """Reads and parses the input file as bytes, without decoding it.
+
+    Args:
+        filename (Union[str, Path]): The path to the input file.
+        parser (Callable[[mmap.mmap | bytes], Any]): A function that takes the
+            memory-mapped file and returns the parsed data. It must not keep
+            views into the buffer. Defaults to `bytes`, which returns a copy.
+
+    Returns:
+        Any: The parsed data as returned by the parser function.
+
+    Raises:
+        FileNotFoundError: If the input file does not exist.
+    """
+    with open_input_buffer(filename) as buffer:
+        return parser(buffer)
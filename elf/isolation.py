@@ -0,0 +1,219 @@
+import signal
+import time
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from multiprocessing.process import BaseProcess
+from typing import Any
+
+from elf.exceptions import TimeLimitExceeded
+from elf.models import IsolatedOutcome, RunStatus
+from elf.parallel import fork_context
+
+try:
+    import resource
+except ImportError:  # resource is Unix-only
+    resource = None
+
+# 🧪 Elf Isolation Ward: run each task in its own process, with a stopwatch 🧪 #
+#
+# Limits are enforced twice. Inside the child, an interval timer raises
+# `TimeLimitExceeded` and `RLIMIT_AS` turns runaway allocations into a
+# `MemoryError`, so the task can report what happened. Outside, the parent
+# kills any child still running shortly after its deadline, which also catches
+# loops stuck in C code where the timer's signal handler never gets to run.
+
+IsolatedTask = tuple[Hashable, Callable[..., Any], tuple[Any, ...]]
+
+# Extra time the child gets to report its own timeout before it is killed
+KILL_GRACE_SECONDS = 1.0
+
+
+def timeout_message(seconds: float) -> str:
+    return f"TIMEOUT after {seconds:g}s"
+
+
+def memory_limit_message(max_memory_mb: int) -> str:
+    return f"MEMORY LIMIT at {max_memory_mb} MB"
+
+
+def _apply_limits(timeout: float | None, max_memory_mb: int | None) -> None:
+    if max_memory_mb is not None and resource is not None:
+        limit = max_memory_mb * 1024 * 1024
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    if timeout is not None and hasattr(signal, "setitimer"):
+
+        def raise_timeout(signum: int, frame: Any) -> None:
+            raise TimeLimitExceeded(timeout)
+
+        signal.signal(signal.SIGALRM, raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+
+def _cancel_timer(timeout: float | None) -> None:
+    if timeout is not None and hasattr(signal, "setitimer"):
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def _child_main(
+    connection: Connection,
+    target: Callable[..., Any],
+    args: tuple[Any, ...],
+    timeout: float | None,
+    max_memory_mb: int | None,
+) -> None:
+    try:
+        _apply_limits(timeout, max_memory_mb)
+        try:
+            value = target(*args)
+        finally:
+            _cancel_timer(timeout)
+        message = (RunStatus.OK, value, "")
+    except TimeLimitExceeded as e:
+        message = (RunStatus.TIMEOUT, None, timeout_message(e.seconds))
+    except MemoryError:
+        message = (
+            RunStatus.MEMORY_LIMIT,
+            None,
+            memory_limit_message(max_memory_mb)
+            if max_memory_mb is not None
+            else "MemoryError",
+        )
+    except BaseException as e:
+        message = (RunStatus.ERROR, None, f"{type(e).__name__}: {e}")
+
+    try:
+        connection.send(message)
+    except Exception as e:  # e.g. an unpicklable result
+        connection.send((RunStatus.ERROR, None, f"{type(e).__name__}: {e}"))
+    finally:
+        connection.close()
+
+
+@dataclass(slots=True)
+class _RunningTask:
+    key: Hashable
+    process: BaseProcess
+    connection: Connection
+    start_time: float
+
+
+def run_isolated_many(
+    tasks: Iterable[IsolatedTask],
+    max_workers: int = 1,
+    timeout: float | None = None,
+    max_memory_mb: int | None = None,
+) -> Iterator[tuple[Hashable, IsolatedOutcome]]:
+    """Runs each task in a fresh child process, yielding outcomes as they finish.
+
+    🧪 A task that raises, crashes the interpreter, runs past `timeout` or
+    allocates more than `max_memory_mb` is reported instead of taking the other
+    tasks down with it. Children that ignore their time limit are killed.
+
+    Args:
+        tasks (Iterable[IsolatedTask]): (key, function, arguments) triples. The
+            function's return value must be picklable.
+        max_workers (int): Maximum number of children running at once.
+        timeout (Optional[float]): Wall-clock seconds each task may run.
+        max_memory_mb (Optional[int]): Address space limit for each task, in MB.
+            Only enforced on platforms with the `resource` module.
+
+    Yields:
+        tuple[Hashable, IsolatedOutcome]: The task key and its outcome, in completion order.
+    """
+    context = fork_context()
+    pending = deque(tasks)
+    running: list[_RunningTask] = []
+
+    while pending or running:
+        while pending and len(running) < max(1, max_workers):
+            key, target, args = pending.popleft()
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(
+                target=_child_main,
+                args=(sender, target, args, timeout, max_memory_mb),
+                daemon=True,
+            )
+            process.start()
+            sender.close()
+            running.append(_RunningTask(key, process, receiver, time.perf_counter()))
+
+        wait_for = None
+        if timeout is not None:
+            now = time.perf_counter()
+            deadline = min(task.start_time for task in running) + timeout
+            wait_for = max(0.0, deadline + KILL_GRACE_SECONDS - now)
+        wait(
+            [task.connection for task in running]
+            + [task.process.sentinel for task in running],
+            timeout=wait_for,
+        )
+
+        still_running = []
+        for task in running:
+            outcome = _collect(task, timeout)
+            if outcome is None:
+                still_running.append(task)
+            else:
+                yield task.key, outcome
+        running = still_running
+
+
+def _collect(task: _RunningTask, timeout: float | None) -> IsolatedOutcome | None:
+    elapsed = time.perf_counter() - task.start_time
+
+    if task.connection.poll():
+        try:
+            status, value, error = task.connection.recv()
+        except EOFError:
+            status, value, error = RunStatus.CRASHED, None, "no result was sent"
+        task.process.join()
+        task.connection.close()
+        return IsolatedOutcome(status, value, error, elapsed)
+
+    if not task.process.is_alive():
+        task.process.join()
+        task.connection.close()
+        return IsolatedOutcome(
+            RunStatus.CRASHED,
+            None,
+            f"exited with code {task.process.exitcode}",
+            elapsed,
+        )
+
+    if timeout is not None and elapsed >= timeout + KILL_GRACE_SECONDS:
+        task.process.kill()
+        task.process.join()
+        task.connection.close()
+        return IsolatedOutcome(
+            RunStatus.TIMEOUT, None, timeout_message(timeout), elapsed
+        )
+
+    return None
+
+
+def run_isolated(
+    target: Callable[..., Any],
+    *args: Any,
+    timeout: float | None = None,
+    max_memory_mb: int | None = None,
+) -> IsolatedOutcome:
+    """Runs a single function in a child process under the given limits.
+
+    Args:
+        target (Callable[..., Any]): The function to run. Its result must be picklable.
+        *args (Any): Arguments for the function.
+        timeout (Optional[float]): Wall-clock seconds the function may run.
+        max_memory_mb (Optional[int]): Address space limit for the child, in MB.
+
+    Returns:
+        IsolatedOutcome: The function's result, or why it didn't produce one.
+    """
+    ((_, outcome),) = run_isolated_many(
+        [(None, target, args)], timeout=timeout, max_memory_mb=max_memory_mb
+    )
+    return outcome
@@ -1,6 +1,9 @@
-from dataclasses import dataclass
+import math
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum, auto
+from pathlib import Path
+from typing import Any
 
 # 🎁 Elf Models 🎁 #
 
@@ -12,12 +15,15 @@ class TestResult:
     expected: str
     actual: str
     message: str
+    # Set when there is no expected answer yet, so the part was not run
+    skipped: bool = False
 
     def __repr__(self):
         return (
             f"TestResult(\n"
             f"  part={self.part},\n"
             f"  passed={self.passed},\n"
+            f"  skipped={self.skipped},\n"
             f"  expected='{self.expected}',\n"
             f"  actual='{self.actual}',\n"
             f"  message='{self.message}'\n"
@@ -80,3 +86,141 @@ class CachedGuessCheck:
     previous_timestamp: datetime | None
     status: SubmissionStatus
     message: str
+
+
+class FetchStatus(StrEnum):
+    FETCHED = auto()
+    CACHED = auto()
+    FAILED = auto()
+
+
+@dataclass(frozen=True, slots=True)
+class PrefetchResult:
+    year: int
+    day: int
+    status: FetchStatus
+    size: int
+    elapsed: float
+    message: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class MemoryUsage:
+    peak_bytes: int
+    allocated_blocks: int
+    max_rss_delta_bytes: int | None
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    name: str
+    warmup: int
+    times_ns: tuple[int, ...]
+    memory: MemoryUsage | None = None
+    result: Any = field(default=None, repr=False, compare=False)
+
+    @property
+    def repeat(self) -> int:
+        return len(self.times_ns)
+
+    @property
+    def min_ns(self) -> int:
+        return min(self.times_ns)
+
+    @property
+    def median_ns(self) -> float:
+        ordered = sorted(self.times_ns)
+        middle = len(ordered) // 2
+        if len(ordered) % 2:
+            return ordered[middle]
+        return (ordered[middle - 1] + ordered[middle]) / 2
+
+    @property
+    def p95_ns(self) -> int:
+        ordered = sorted(self.times_ns)
+        return ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+
+    @property
+    def mean_ns(self) -> float:
+        return math.fsum(self.times_ns) / len(self.times_ns)
+
+    @property
+    def stddev_ns(self) -> float:
+        if len(self.times_ns) < 2:
+            return 0.0
+        mean = self.mean_ns
+        variance = math.fsum((t - mean) ** 2 for t in self.times_ns)
+        return math.sqrt(variance / (len(self.times_ns) - 1))
+
+
+@dataclass(frozen=True, slots=True)
+class SolutionFile:
+    year: int
+    day: int
+    path: Path
+
+    @property
+    def base_dir(self) -> Path:
+        return self.path.parent
+
+    @property
+    def label(self) -> str:
+        return f"{self.year} Day {self.day:02d}"
+
+
+@dataclass(frozen=True, slots=True)
+class SolutionRun:
+    year: int
+    day: int
+    part1: str
+    part2: str
+    elapsed: float
+    error: str = ""
+    part_times: tuple[float, float] = (0.0, 0.0)
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return not self.error
+
+
+class RunStatus(StrEnum):
+    OK = auto()
+    ERROR = auto()
+    TIMEOUT = auto()
+    MEMORY_LIMIT = auto()
+    CRASHED = auto()
+
+
+@dataclass(frozen=True, slots=True)
+class IsolatedOutcome:
+    status: RunStatus
+    value: Any
+    error: str
+    elapsed: float
+
+
+@dataclass(frozen=True, slots=True)
+class DayTestResult:
+    year: int
+    day: int
+    result: TestResult
+    status: RunStatus
+    elapsed: float
+
+    @property
+    def passed(self) -> bool:
+        return self.status == RunStatus.OK and self.result.passed
+
+    @property
+    def skipped(self) -> bool:
+        return self.status == RunStatus.OK and self.result.skipped
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResult:
+    year: int
+    day: int
+    part: int
+    answer: str
+    elapsed: float
@@ -0,0 +1,129 @@
+from collections.abc import Iterable, Sequence
+from functools import partial
+
+from elf.parallel import map_in_processes
+
+# ➕ Elf Operator Workshop: which operators between the numbers hit the target? ✖️ #
+#
+# For "insert operators" puzzles such as 2024 day 7: the numbers are combined
+# strictly left to right (no precedence), and we ask whether some choice of
+# operators produces the target. Instead of trying every combination forwards,
+# the search starts from the target and undoes the last number: subtract it,
+# divide by it when that's exact, or strip it as a decimal suffix. Most of
+# these undo steps are impossible, so whole subtrees are cut at once.
+
+ADD = "+"
+MULTIPLY = "*"
+CONCATENATE = "||"
+OPERATORS = (ADD, MULTIPLY, CONCATENATE)
+
+# Below this many equations, starting a process pool costs more than it saves
+PARALLEL_THRESHOLD = 5000
+
+Equation = tuple[int, Sequence[int]]
+
+
+def _suffix_divisor(number: int) -> int:
+    """Returns the power of ten that `a || number` multiplies `a` by."""
+    divisor = 10
+    while divisor <= number:
+        divisor *= 10
+    return divisor
+
+
+def find_operators(
+    target: int, numbers: Sequence[int], operators: Iterable[str] = (ADD, MULTIPLY)
+) -> list[str] | None:
+    """Finds operators that make `numbers`, evaluated left to right, equal `target`.
+
+    🧮 "190: 10 19" is solved by ["*"], and "156: 15 6" by ["||"].
+
+    Args:
+        target (int): The value the equation must produce.
+        numbers (Sequence[int]): The non-negative numbers, in order.
+        operators (Iterable[str]): The allowed operators, from `OPERATORS`.
+
+    Returns:
+        Optional[list[str]]: One operator between each pair of numbers, or None
+            if no combination works.
+
+    Raises:
+        ValueError: If an operator is unknown or there are no numbers.
+    """
+    allowed = set(operators)
+    if not allowed <= set(OPERATORS):
+        raise ValueError(f"❗ Unknown operators: {sorted(allowed - set(OPERATORS))}")
+    if not numbers:
+        raise ValueError("❗ An equation needs at least one number.")
+
+    # Divisions and suffixes rule out the most branches, so they go first
+    ordered = [op for op in (CONCATENATE, MULTIPLY, ADD) if op in allowed]
+    divisors = (
+        [_suffix_divisor(number) for number in numbers]
+        if CONCATENATE in allowed
+        else []
+    )
+
+    def undo(value: int, index: int) -> list[str] | None:
+        number = numbers[index]
+        if index == 0:
+            return [] if value == number else None
+        for operator in ordered:
+            if operator == CONCATENATE:
+                if value % divisors[index] != number:
+                    continue
+                previous = value // divisors[index]
+            elif operator == MULTIPLY:
+                if number == 0:
+                    if value != 0:
+                        continue
+                    # Anything times zero is zero, so any prefix will do
+                    return [ordered[-1]] * (index - 1) + [MULTIPLY]
+                if value % number:
+                    continue
+                previous = value // number
+            else:
+                if value < number:
+                    continue
+                previous = value - number
+            found = undo(previous, index - 1)
+            if found is not None:
+                found.append(operator)
+                return found
+        return None
+
+    return undo(target, len(numbers) - 1)
+
+
+def can_make(
+    target: int, numbers: Sequence[int], operators: Iterable[str] = (ADD, MULTIPLY)
+) -> bool:
+    """Checks whether some choice of operators makes the equation true.
+
+    See `find_operators` for the arguments.
+    """
+    return find_operators(target, numbers, operators) is not None
+
+
+def _can_make_equation(operators: tuple[str, ...], equation: Equation) -> bool:
+    return can_make(equation[0], equation[1], operators)
+
+
+def solvable(
+    equations: Sequence[Equation],
+    operators: Iterable[str] = (ADD, MULTIPLY),
+    workers: int | None = None,
+) -> list[bool]:
+    """Checks many equations, spreading large batches over worker processes.
+
+    Args:
+        equations (Sequence[Equation]): (target, numbers) pairs.
+        operators (Iterable[str]): The allowed operators, from `OPERATORS`.
+        workers (Optional[int]): Maximum number of worker processes (see
+            `elf.parallel.map_in_processes`).
+
+    Returns:
+        list[bool]: Whether each equation can be made true, in order.
+    """
+    check = partial(_can_make_equation, tuple(operators))
+    return map_in_processes(check, equations, PARALLEL_THRESHOLD, workers=workers)
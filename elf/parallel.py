@@ -0,0 +1,77 @@
+import multiprocessing
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any
+
+# 🛷 Elf Sleigh Team: spread a solution's independent checks over processes 🛷 #
+#
+# Worker processes are forked where possible, so they start quickly and
+# inherit everything the parent has already loaded. Batches too small to pay
+# for starting a pool, single-CPU machines and calls from inside a daemonic
+# worker (such as those of `elf run-all`, which may not start their own
+# children) all run in-process instead.
+
+
+def fork_context() -> multiprocessing.context.BaseContext:
+    """Returns the "fork" start method where available, else the default one."""
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def _map_chunk(func: Callable[[Any], Any], chunk: Sequence[Any]) -> list[Any]:
+    return [func(item) for item in chunk]
+
+
+def map_in_processes(
+    func: Callable[[Any], Any],
+    items: Sequence[Any],
+    threshold: int,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple[Any, ...] = (),
+    workers: int | None = None,
+) -> list[Any]:
+    """Applies `func` to every item, in a process pool when the batch is large.
+
+    Items are dealt out in interleaved chunks, so runs of expensive neighbours
+    are shared evenly between the workers.
+
+    Args:
+        func (Callable[[Any], Any]): A module-level function, so it can be pickled.
+        items (Sequence[Any]): The items to map over.
+        threshold (int): Below this many items, everything runs in-process.
+        initializer (Optional[Callable[..., None]]): Run once in each worker
+            (or once in-process) before any items, e.g. to set shared state.
+        initargs (tuple[Any, ...]): Arguments for the initializer.
+        workers (Optional[int]): Maximum number of worker processes (default:
+            CPU count).
+
+    Returns:
+        list[Any]: The results, in the order of `items`.
+    """
+    workers = workers or os.cpu_count() or 1
+    if (
+        workers == 1
+        or len(items) < threshold
+        or multiprocessing.current_process().daemon
+    ):
+        if initializer is not None:
+            initializer(*initargs)
+        return [func(item) for item in items]
+
+    chunk_count = min(len(items), workers * 4)
+    chunks = [items[i::chunk_count] for i in range(chunk_count)]
+    results: list[Any] = [None] * len(items)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=fork_context(),
+        initializer=initializer,
+        initargs=initargs,
+    ) as executor:
+        for i, chunk_results in enumerate(
+            executor.map(partial(_map_chunk, func), chunks)
+        ):
+            results[i::chunk_count] = chunk_results
+    return results
@@ -0,0 +1,136 @@
+import re
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+# 🧩 Elf Parsing Workshop: fast loaders for common puzzle input shapes 🧩 #
+#
+# Every parser takes either the raw input text (so it plugs straight into
+# `read_input_file(path, parser=...)`) or the list of lines that `args()`
+# hands to `part1`/`part2`.
+
+_SIGNED_INT_PATTERN = re.compile(r"-?\d+")
+_UNSIGNED_INT_PATTERN = re.compile(r"\d+")
+
+
+def _as_lines(data: str | Sequence[str]) -> Sequence[str]:
+    return data.strip().splitlines() if isinstance(data, str) else data
+
+
+def _as_text(data: str | Sequence[str]) -> str:
+    return data if isinstance(data, str) else "\n".join(data)
+
+
+def ints_per_line(data: str | Sequence[str]) -> list[list[int]]:
+    """Parses whitespace-separated integers on each line.
+
+    🔢 "7 6 4 2 1" becomes [7, 6, 4, 2, 1], one list per line.
+
+    Args:
+        data (str | Sequence[str]): The raw input text or its lines.
+
+    Returns:
+        list[list[int]]: The integers of each line. Lines may differ in length.
+    """
+    return [list(map(int, line.split())) for line in _as_lines(data)]
+
+
+@dataclass(frozen=True, slots=True)
+class IntMatrix:
+    """A fixed-width matrix of integers stored row-major in one `array('q')`."""
+
+    values: array
+    rows: int
+    cols: int
+
+    def row(self, index: int) -> array:
+        start = index * self.cols
+        return self.values[start : start + self.cols]
+
+    def column(self, index: int) -> array:
+        return self.values[index :: self.cols]
+
+    def __getitem__(self, position: tuple[int, int]) -> int:
+        row, col = position
+        return self.values[row * self.cols + col]
+
+
+def int_matrix(data: str | Sequence[str], numpy: bool = False) -> Any:
+    """Parses a block of whitespace-separated integers with the same count per line.
+
+    🎁 Every number is converted in a single pass into one contiguous
+    `array('q')`, instead of a list of lists of Python ints.
+
+    Args:
+        data (str | Sequence[str]): The raw input text or its lines.
+        numpy (bool): Return a 2D `numpy.ndarray` of int64 instead of an `IntMatrix`.
+
+    Returns:
+        IntMatrix | numpy.ndarray: The parsed matrix.
+
+    Raises:
+        ValueError: If the lines do not all have the same number of integers.
+        ImportError: If `numpy=True` but NumPy is not installed.
+    """
+    lines = _as_lines(data)
+    rows = len(lines)
+    cols = len(lines[0].split()) if rows else 0
+    values = array("q", map(int, _as_text(lines).split()))
+    if len(values) != rows * cols:
+        raise ValueError(
+            f"❗ Expected {rows} lines of {cols} integers, found {len(values)} integers."
+        )
+
+    if numpy:
+        # Imported here, since loading NumPy costs more than most puzzles
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(
+                "🎄 NumPy is not installed; use numpy=False instead."
+            ) from None
+        return np.frombuffer(values, dtype=np.int64).reshape(rows, cols)
+    return IntMatrix(values=values, rows=rows, cols=cols)
+
+
+def char_grid(data: str | Sequence[str]) -> tuple[bytearray, int, int]:
+    """Parses a rectangular grid of characters into one flat `bytearray`.
+
+    🗺️ Cell (row, col) lives at index `row * width + col`.
+
+    Args:
+        data (str | Sequence[str]): The raw input text or its lines.
+
+    Returns:
+        tuple[bytearray, int, int]: The cells, the grid width and the grid height.
+
+    Raises:
+        ValueError: If the lines do not all have the same width.
+    """
+    lines = _as_lines(data)
+    height = len(lines)
+    width = len(lines[0]) if height else 0
+    cells = bytearray("".join(lines), "utf-8")
+    if len(cells) != width * height:
+        raise ValueError(
+            f"❗ Expected {height} lines of width {width}, found {len(cells)} cells."
+        )
+    return cells, width, height
+
+
+def all_ints(data: str | Sequence[str], signed: bool = True) -> list[int]:
+    """Extracts every integer from the text, ignoring everything around it.
+
+    🔍 "mul(12,-3) at x=7" becomes [12, -3, 7]. With `signed=False` a leading
+    "-" is treated as a separator, so "1-3" becomes [1, 3] instead of [1, -3].
+
+    Args:
+        data (str | Sequence[str]): The raw input text or its lines.
+        signed (bool): Whether a "-" directly before digits makes them negative.
+
+    Returns:
+        list[int]: The integers in the order they appear.
+    """
+    pattern = _SIGNED_INT_PATTERN if signed else _UNSIGNED_INT_PATTERN
+    return list(map(int, pattern.findall(_as_text(data))))
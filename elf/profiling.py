@@ -0,0 +1,196 @@
+import sys
+import threading
+from collections import Counter
+from collections.abc import Callable
+from functools import wraps
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+# 🔬 Elf Profiling Workshop: find out where the sleigh time goes 🔬 #
+
+PROFILE_MODES = ("cprofile", "sample")
+DEFAULT_TOP = 15
+SAMPLE_INTERVAL = 0.001
+
+
+def profile_output_path(
+    base_dir: Path, part: int, mode: str, label: str | None = None
+) -> Path:
+    """Returns where a part's profile is saved, e.g. `day06/part1.pstats`.
+
+    Args:
+        base_dir (Path): The solution directory.
+        part (int): The part being profiled.
+        mode (str): "cprofile" (saves `.pstats`) or "sample" (saves `.folded` stacks).
+        label (Optional[str]): Extra name component, e.g. "test" gives `part1.test.pstats`.
+
+    Returns:
+        Path: The profile output file.
+    """
+    suffix = ".pstats" if mode == "cprofile" else ".folded"
+    name = f"part{part}.{label}" if label else f"part{part}"
+    return base_dir / f"{name}{suffix}"
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """Samples one thread's Python stack at a fixed interval from a background thread.
+
+    🎯 Unlike cProfile it adds no per-call overhead, so tight loops keep their
+    real proportions. The sampler only sees the target thread when it releases
+    the GIL, so very short runs may collect few samples.
+    """
+
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[tuple[str, ...]] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            if stack:
+                self.stacks[tuple(reversed(stack))] += 1
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    @property
+    def total(self) -> int:
+        return sum(self.stacks.values())
+
+    def cumulative(self) -> Counter[str]:
+        """Counts the samples in which each function was anywhere on the stack."""
+        counts: Counter[str] = Counter()
+        for stack, samples in self.stacks.items():
+            for label in set(stack):
+                counts[label] += samples
+        return counts
+
+    def own(self) -> Counter[str]:
+        """Counts the samples in which each function was the one running."""
+        counts: Counter[str] = Counter()
+        for stack, samples in self.stacks.items():
+            counts[stack[-1]] += samples
+        return counts
+
+    def write_folded(self, path: Path) -> None:
+        """Writes the stacks in the folded format used by flame graph tools."""
+        lines = [
+            f"{';'.join(stack)} {samples}" for stack, samples in self.stacks.items()
+        ]
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    def print_stats(self, top: int = DEFAULT_TOP) -> None:
+        total = self.total
+        if not total:
+            print("🔬 No samples collected; the part finished too quickly to sample.")
+            return
+        own = self.own()
+        print(f"🔬 {total} samples, top {top} by cumulative time:")
+        print(f"{'cumulative':>12}{'own':>9}  function")
+        for label, samples in self.cumulative().most_common(top):
+            print(f"{samples / total:>11.1%}{own[label] / total:>9.1%}  {label}")
+
+
+def profile_call(
+    func: Callable[..., Any],
+    *args: Any,
+    mode: str = "cprofile",
+    output: Path | None = None,
+    top: int = DEFAULT_TOP,
+    **kwargs: Any,
+) -> Any:
+    """Runs a function under a profiler, saves the profile and prints the hotspots.
+
+    🔬 "cprofile" records every call and saves a `.pstats` file that
+    `python -m pstats` or snakeviz can open. "sample" periodically snapshots
+    the stack instead and saves folded stacks for flame graphs.
+
+    Args:
+        func (Callable[..., Any]): The function to profile.
+        *args (Any): Positional arguments for the function.
+        mode (str): "cprofile" or "sample".
+        output (Optional[Path]): Where to save the profile. Nothing is saved if None.
+        top (int): How many functions to print, sorted by cumulative time.
+        **kwargs (Any): Keyword arguments for the function.
+
+    Returns:
+        Any: The function's result.
+
+    Raises:
+        ValueError: If the mode is not one of `PROFILE_MODES`.
+    """
+    if mode not in PROFILE_MODES:
+        raise ValueError(
+            f"❗ Unknown profile mode {mode!r}; use one of {PROFILE_MODES}."
+        )
+
+    if mode == "cprofile":
+        import cProfile
+        import pstats
+
+        profiler = cProfile.Profile()
+        result = profiler.runcall(func, *args, **kwargs)
+        stats = pstats.Stats(profiler)
+        if output is not None:
+            stats.dump_stats(output)
+        stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    else:
+        sampler = StackSampler(threading.get_ident())
+        sampler.start()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            sampler.stop()
+        if output is not None:
+            sampler.write_folded(output)
+        sampler.print_stats(top)
+
+    if output is not None:
+        print(f"💾 Profile saved to {output}")
+    return result
+
+
+def profiled(
+    func: Callable[..., Any],
+    mode: str | None,
+    output: Path | None = None,
+    top: int = DEFAULT_TOP,
+) -> Callable[..., Any]:
+    """Wraps a part so every call is run through `profile_call`.
+
+    This is the one hook shared by `args()` (run and test) and `elf bench`.
+
+    Args:
+        func (Callable[..., Any]): The part to wrap.
+        mode (Optional[str]): "cprofile", "sample", or None to return `func` unchanged.
+        output (Optional[Path]): Where to save the profile.
+        top (int): How many functions to print.
+
+    Returns:
+        Callable[..., Any]: The wrapped part.
+    """
+    if mode is None:
+        return func
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return profile_call(func, *args, mode=mode, output=output, top=top, **kwargs)
+
+    return wrapper
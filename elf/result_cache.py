@@ -0,0 +1,152 @@
+import hashlib
+import json
+import os
+from functools import cache
+from pathlib import Path
+
+from elf.config import get_cache_results_dir, get_result_cache_max_bytes
+from elf.models import CachedResult
+from elf.utils import atomic_write_text
+
+# 🗃️ Elf Answer Archive: remembers answers so unchanged days never rerun 🗃️ #
+#
+# An answer is stored under a hash of everything that can change it: the
+# solution's source, the source of the elf package it builds on, the puzzle
+# input and the part. Editing a
+# solution or its input simply produces a new key; stale entries are never
+# looked up again and age out through the LRU eviction below.
+
+
+@cache
+def elf_source_digest() -> bytes:
+    """Hashes the source of every module in the elf package, once per process.
+
+    Solutions lean on helpers such as `elf.grid` and `elf.parsers`, so fixing a
+    bug in one of them must invalidate the answers computed with it.
+    """
+    package_dir = Path(__file__).parent
+    digest = hashlib.sha256()
+    for path in sorted(package_dir.rglob("*.py")):
+        name = path.relative_to(package_dir).as_posix().encode()
+        data = path.read_bytes()
+        for chunk in (name, data):
+            digest.update(len(chunk).to_bytes(8, "little"))
+            digest.update(chunk)
+    return digest.digest()
+
+
+def input_digest(path: Path) -> bytes:
+    """Hashes an input file in chunks, without reading it all into memory.
+
+    Args:
+        path (Path): The puzzle input file.
+
+    Returns:
+        bytes: The SHA-256 digest of the file's bytes.
+    """
+    with path.open("rb") as file:
+        return hashlib.file_digest(file, "sha256").digest()
+
+
+def result_key(source: bytes, input_hash: bytes, part: int) -> str:
+    """Builds the cache key for one part of a solution.
+
+    Args:
+        source (bytes): The solution file's source code.
+        input_hash (bytes): The SHA-256 digest of the raw puzzle input, from
+            `input_digest` or `hashlib.sha256(data).digest()`.
+        part (int): The part number (1 or 2).
+
+    Returns:
+        str: A hex SHA-256 digest identifying this exact run.
+    """
+    digest = hashlib.sha256()
+    for chunk in (source, elf_source_digest(), input_hash, str(part).encode()):
+        # Length-prefix each chunk so no two different runs share a key
+        digest.update(len(chunk).to_bytes(8, "little"))
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def result_keys(solution_path: Path, input_hash: bytes) -> dict[int, str]:
+    """Builds the cache keys for both parts of a solution file and its input digest."""
+    source = solution_path.read_bytes()
+    return {part: result_key(source, input_hash, part) for part in (1, 2)}
+
+
+class ResultCache:
+    """A size-bounded, least-recently-used store of solution answers.
+
+    🗃️ Each answer is a small JSON file named after its key. Reading an entry
+    refreshes its modification time, and whenever the cache grows past its
+    size limit the entries used longest ago are removed first.
+    """
+
+    def __init__(self, directory: Path | None = None, max_bytes: int | None = None):
+        self.directory = directory or get_cache_results_dir()
+        self.max_bytes = (
+            max_bytes if max_bytes is not None else get_result_cache_max_bytes()
+        )
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> CachedResult | None:
+        """Looks up an answer, marking it as recently used.
+
+        Args:
+            key (str): A key from `result_key`.
+
+        Returns:
+            Optional[CachedResult]: The stored answer, or None on a miss.
+        """
+        path = self._entry_path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return CachedResult(**entry)
+
+    def put(self, key: str, result: CachedResult) -> None:
+        """Stores an answer, evicting old entries if the cache is over its limit.
+
+        Args:
+            key (str): A key from `result_key`.
+            result (CachedResult): The answer and how long it took to compute.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "year": result.year,
+            "day": result.day,
+            "part": result.part,
+            "answer": result.answer,
+            "elapsed": result.elapsed,
+        }
+        atomic_write_text(self._entry_path(key), json.dumps(entry))
+        self.evict()
+
+    def evict(self) -> int:
+        """Removes least recently used entries until the cache fits its limit.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        entries = []
+        total_bytes = 0
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+            total_bytes += stat.st_size
+
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_bytes -= size
+            removed += 1
+        return removed
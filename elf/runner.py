@@ -0,0 +1,214 @@
+import inspect
+import time
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+from elf.input import read_input_bytes, read_input_file
+from elf.utils import accepts_bytes
+
+if TYPE_CHECKING:
+    from elf.models import IsolatedOutcome, SolutionFile
+
+# 🏃 Elf Runner: the solution module contract shared by args(), the CLI and bench 🏃 #
+#
+# A solution module defines `part1(data)` and `part2(data)`, and optionally
+# `parse(data)`. When `parse` exists it runs once and both parts receive its
+# result instead of the raw lines. A part that declares a `context` parameter
+# also receives a dict shared by both parts of the same run, so part 1 can
+# publish intermediate results (e.g. a guard's path) for part 2. Part 2 must
+# still work when the key is missing, since `--part 2` runs it alone.
+
+
+def accepts_context(func: Callable[..., Any]) -> bool:
+    """Checks whether a part declares a `context` parameter.
+
+    Args:
+        func (Callable[..., Any]): The part, possibly wrapped by `elf.timer`.
+
+    Returns:
+        bool: True if the part should receive the shared context dict.
+    """
+    try:
+        parameters = inspect.signature(inspect.unwrap(func)).parameters
+    except (TypeError, ValueError):
+        return False
+    return "context" in parameters
+
+
+def call_part(
+    func: Callable[..., Any], data: Any, context: dict[str, Any] | None = None
+) -> Any:
+    """Calls a part with its input, passing the shared context if it asks for it.
+
+    Args:
+        func (Callable[..., Any]): The part to run.
+        data (Any): The input lines, or the result of `parse`.
+        context (Optional[dict[str, Any]]): The context shared between the parts.
+
+    Returns:
+        Any: The part's answer.
+    """
+    if context is not None and accepts_context(func):
+        return func(data, context=context)
+    return func(data)
+
+
+def apply_parse(parse: Callable[[Any], Any] | None, data: Any) -> Any:
+    """Runs the optional parse hook, returning the data unchanged without one.
+
+    A hook that reads bytes (see `elf.utils.accepts_bytes`) is given the lines
+    joined and encoded.
+    """
+    if parse is None:
+        return data
+    if isinstance(data, list) and accepts_bytes(parse):
+        return parse("\n".join(data).encode())
+    return parse(data)
+
+
+def parse_input_file(parse: Callable[[Any], Any] | None, input_file: Path) -> Any:
+    """Reads an input file in the form the parse hook asks for, then parses it.
+
+    A hook that reads bytes is run directly on the memory-mapped file; anything
+    else gets the lines from `elf.read_input_file`.
+    """
+    if parse is not None and accepts_bytes(parse):
+        return read_input_bytes(input_file, parse)
+    return apply_parse(parse, read_input_file(input_file))
+
+
+def get_solution_functions(
+    module: ModuleType,
+) -> tuple[Callable[..., Any] | None, Callable[..., Any], Callable[..., Any]]:
+    """Looks up `parse`, `part1` and `part2` in a loaded solution module.
+
+    Args:
+        module (ModuleType): The solution module.
+
+    Returns:
+        tuple: The parse hook (or None), part 1 and part 2.
+
+    Raises:
+        AttributeError: If the module does not define both parts.
+    """
+    part1 = getattr(module, "part1", None)
+    part2 = getattr(module, "part2", None)
+    if part1 is None or part2 is None:
+        raise AttributeError("❌ Solution functions part1 or part2 not found.")
+    return getattr(module, "parse", None), part1, part2
+
+
+def _call_part_returning_context(
+    func: Callable[..., Any], data: Any, context: dict[str, Any] | None
+) -> tuple[Any, dict[str, Any] | None]:
+    return call_part(func, data, context), context
+
+
+def call_part_isolated(
+    func: Callable[..., Any],
+    data: Any,
+    context: dict[str, Any] | None = None,
+    timeout: float | None = None,
+    max_memory_mb: int | None = None,
+) -> "IsolatedOutcome":
+    """Calls a part in a child process under a time and memory limit.
+
+    🚧 A part that runs away is stopped and reported instead of hanging the
+    caller. Whatever the part adds to the shared context is copied back, so a
+    following part still sees it.
+
+    Args:
+        func (Callable[..., Any]): The part to run.
+        data (Any): The input lines, or the result of `parse`.
+        context (Optional[dict[str, Any]]): The context shared between the parts.
+        timeout (Optional[float]): Wall-clock seconds the part may run.
+        max_memory_mb (Optional[int]): Address space limit for the part, in MB.
+
+    Returns:
+        IsolatedOutcome: The part's answer as `value`, or why it has none.
+    """
+    import dataclasses
+
+    from elf.isolation import run_isolated
+    from elf.models import RunStatus
+
+    outcome = run_isolated(
+        _call_part_returning_context,
+        func,
+        data,
+        context,
+        timeout=timeout,
+        max_memory_mb=max_memory_mb,
+    )
+    if outcome.status != RunStatus.OK:
+        return outcome
+    result, child_context = outcome.value
+    if context is not None and child_context is not None:
+        context.update(child_context)
+    return dataclasses.replace(outcome, value=result)
+
+
+# Set in each worker process by `_init_worker`, so the input is shipped once per worker
+_worker_state: dict[str, Any] = {}
+
+
+def _init_worker(solution: "SolutionFile", data: Any) -> None:
+    from elf.discovery import load_solution
+
+    _, part1, part2 = get_solution_functions(load_solution(solution))
+    _worker_state.update(parts={1: part1, 2: part2}, data=data)
+
+
+def _run_worker_part(number: int) -> tuple[int, Any, float]:
+    func = _worker_state["parts"][number]
+    start_time = time.perf_counter()
+    result = func(_worker_state["data"])
+    return number, result, time.perf_counter() - start_time
+
+
+def can_run_in_parallel(*parts: Callable[..., Any]) -> bool:
+    """Parts sharing a context depend on each other and must run one after another."""
+    return not any(accepts_context(func) for func in parts)
+
+
+def run_parts_parallel(
+    solution: "SolutionFile", numbers: Iterable[int], data: Any, jobs: int = 2
+) -> Iterator[tuple[int, Any, float]]:
+    """Runs parts in separate worker processes, yielding each as it finishes.
+
+    🛷 Each worker loads the solution from its file, so this works for parts
+    defined in a script's `__main__`. The (parsed) input is sent to each worker
+    once, when it starts.
+
+    Args:
+        solution (SolutionFile): The solution file the parts live in.
+        numbers (Iterable[int]): The parts to run (1 and/or 2).
+        data (Any): The input lines, or the result of `parse`. Must be picklable.
+        jobs (int): Maximum number of worker processes.
+
+    Yields:
+        tuple[int, Any, float]: The part number, its answer and its run time in seconds,
+            in completion order.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    numbers = list(numbers)
+    with ProcessPoolExecutor(
+        max_workers=max(1, min(jobs, len(numbers))),
+        initializer=_init_worker,
+        initargs=(solution, data),
+    ) as executor:
+        futures = [executor.submit(_run_worker_part, number) for number in numbers]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def solution_file_for(func: Callable[..., Any], year: int, day: int) -> "SolutionFile":
+    """Finds the file a part was defined in, so worker processes can load it."""
+    from elf.models import SolutionFile
+
+    return SolutionFile(
+        year=year, day=day, path=Path(inspect.getfile(inspect.unwrap(func)))
+    )
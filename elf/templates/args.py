@@ -1,11 +1,37 @@
 import argparse
+import logging
 import sys
+import time
 from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import elf
-from elf.models import TestResult
-from elf.utils import read_expected_output, read_test_input
+from elf.profiling import (
+    DEFAULT_TOP,
+    PROFILE_MODES,
+    profile_output_path,
+    profiled,
+)
+from elf.runner import (
+    apply_parse,
+    call_part,
+    call_part_isolated,
+    can_run_in_parallel,
+    parse_input_file,
+    run_parts_parallel,
+    solution_file_for,
+)
+from elf.utils import (
+    accepts_bytes,
+    accepts_stream,
+    iter_input_lines,
+    read_expected_output,
+    read_test_input,
+)
+
+if TYPE_CHECKING:
+    from elf.models import TestResult
 
 
 # 🎅 Festive Argument Handling for Advent of Code 🎅 #
@@ -13,14 +39,23 @@ def args(
     part1: Callable[[list[str]], int | str],
     part2: Callable[[list[str]], int | str],
     base_dir: Path,
+    parse: Callable[[list[str]], Any] | None = None,
 ) -> None:
     """
     Handles command-line arguments for Advent of Code solutions.
 
+    A part whose first parameter is annotated as `Iterable[str]` is fed a lazy
+    line iterator instead of a list, so it can run on inputs larger than memory.
+
+    With a `parse` hook, the input is parsed once and both parts receive the
+    parsed result; parts with a `context` parameter also share a dict (see
+    `elf.runner`). A `parse` annotated with `Iterable[str]` is streamed instead.
+
     Parameters:
         part1 (Callable[[list[str]], int | str]): Function to solve Part 1 of the puzzle.
         part2 (Callable[[list[str]], int | str]): Function to solve Part 2 of the puzzle.
         base_dir (Path): Path to the directory containing puzzle input and output files.
+        parse (Optional[Callable[[list[str]], Any]]): Function to parse the input once for both parts.
     """
     parser = argparse.ArgumentParser(
         description="Advent of Code Solution Runner",
@@ -42,7 +77,75 @@ def args(
         action="store_true",
         help="Run tests using test_input.txt and expected_output.txt. 🎁",
     )
+    parser.add_argument(
+        "--input",
+        metavar="PATH",
+        help="Read the puzzle input from PATH instead of input.txt ('-' for stdin).",
+    )
+    parser.add_argument(
+        "--mem",
+        action="store_true",
+        help="Report peak memory, allocated blocks and max RSS growth per part. 🧠",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="cprofile",
+        choices=PROFILE_MODES,
+        help="Profile each part (default: cprofile) and save the profile next to "
+        "the solution. 🔬",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=DEFAULT_TOP,
+        metavar="N",
+        help=f"Number of hotspots to print when profiling (default: {DEFAULT_TOP}).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Run the parts in up to N worker processes at the same time.",
+    )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run both parts at the same time (same as --jobs 2). 🛷",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rerun the parts even if their answers are cached (the cache is "
+        "still refreshed).",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        metavar="SECONDS",
+        help="Stop a part that runs longer than this and report a TIMEOUT. ⏰",
+    )
+    parser.add_argument(
+        "--max-memory",
+        type=int,
+        metavar="MB",
+        help="Stop a part that allocates more than this and report a MEMORY LIMIT.",
+    )
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    # Limited parts run in a child process, so a runaway one can be stopped
+    limited = args.timeout is not None or args.max_memory is not None
+    if limited:
+        from elf.isolation import run_isolated
+        from elf.models import RunStatus
+        from elf.testing import check_solution_isolated
+
+    def with_profile(func: Callable, number: int, label: str | None = None):
+        if args.profile is None:
+            return func
+        output = profile_output_path(base_dir, number, args.profile, label)
+        return profiled(func, args.profile, output, args.profile_top)
 
     # Extract day and year from the directory structure
     day = int(base_dir.name.strip("day"))
@@ -58,26 +161,55 @@ def args(
         try:
             test_input = read_test_input(base_dir)
             expected_output = read_expected_output(base_dir)
+            context: dict[str, Any] = {}
 
             if args.part in ("1", "both"):
-                part1_result: TestResult = elf.check_part1_solution(
-                    part1_func=part1,
-                    test_input=test_input,
-                    expected_output=expected_output,
-                )
+                if limited:
+                    part1_result: TestResult = check_solution_isolated(
+                        1,
+                        with_profile(part1, 1, "test"),
+                        test_input,
+                        expected_output,
+                        parse=parse,
+                        context=context,
+                        timeout=args.timeout,
+                        max_memory_mb=args.max_memory,
+                    )
+                else:
+                    part1_result = elf.check_part1_solution(
+                        part1_func=with_profile(part1, 1, "test"),
+                        test_input=test_input,
+                        expected_output=expected_output,
+                        parse=parse,
+                        context=context,
+                    )
                 print(part1_result.message)
-                if not part1_result.passed:
+                if not (part1_result.passed or part1_result.skipped):
                     print("❌ Part 1 Test Failed.")
                     sys.exit(1)
 
             if args.part in ("2", "both"):
-                part2_result: TestResult = elf.check_part2_solution(
-                    part2_func=part2,
-                    test_input=test_input,
-                    expected_output=expected_output,
-                )
+                if limited:
+                    part2_result: TestResult = check_solution_isolated(
+                        2,
+                        with_profile(part2, 2, "test"),
+                        test_input,
+                        expected_output,
+                        parse=parse,
+                        context=context,
+                        timeout=args.timeout,
+                        max_memory_mb=args.max_memory,
+                    )
+                else:
+                    part2_result = elf.check_part2_solution(
+                        part2_func=with_profile(part2, 2, "test"),
+                        test_input=test_input,
+                        expected_output=expected_output,
+                        parse=parse,
+                        context=context,
+                    )
                 print(part2_result.message)
-                if not part2_result.passed:
+                if not (part2_result.passed or part2_result.skipped):
                     print("❌ Part 2 Test Failed.")
                     sys.exit(1)
 
@@ -88,51 +220,200 @@ def args(
             sys.exit(1)
 
     else:
-        # Read or fetch input data
-        if input_file.exists():
-            data = elf.read_input_file(input_file)
-            print("🎁 Input data found and ready for use!")
+
+        def report(number: int, result: Any, note: str = "") -> None:
+            print(f"🎄 Part {number} Result: {result}{note}")
+            if args.submit:
+                try:
+                    print(f"📤 Submitting Part {number} answer to Santa’s server...")
+                    submission_result = elf.submit_answer(year, day, number, result)
+                    print(submission_result.message)
+                except elf.SubmissionError as e:
+                    print(f"❌ Submission failed: {e}")
+
+        parts = [
+            (number, func)
+            for number, func in ((1, part1), (2, part2))
+            if args.part in (str(number), "both")
+        ]
+        # With a parse hook only the hook sees the raw input, so only it may stream
+        stream_parse = parse is not None and accepts_stream(parse)
+        bytes_parse = parse is not None and accepts_bytes(parse)
+        streaming = (
+            set()
+            if parse is not None
+            else {number for number, func in parts if accepts_stream(func)}
+        )
+
+        # Pick the input source: --input file, stdin, or the day's input.txt
+        if args.input == "-":
+            source = sys.stdin
+            if streaming and len(parts) > 1:
+                print(
+                    "❌ Streaming from stdin can only feed one part. "
+                    "Use --part 1 or --part 2."
+                )
+                sys.exit(1)
+        elif args.input:
+            source = Path(args.input)
+            if not source.exists():
+                print(
+                    f"❌ Error: {source} not found. 🎄 The elves must have misplaced it! 🎁"
+                )
+                source = None
         else:
-            # Try to fetch the input
-            print("📥 Input file not found. The elves are fetching it for you...")
-            try:
-                input_text = elf.get_input(year, day)
-                input_file.write_text(input_text)
-                data = elf.parse_input(input_text)
-                print("✅ Input fetched, saved, and ready to use!")
-            except elf.InputFetchError as e:
-                print(f"❌ Failed to fetch input: {e}")
-                data = []
-            except Exception as e:
-                print(f"❌ An unexpected error occurred: {e}")
-                data = []
-
-        if data:
-            # Run the specified parts
-            if args.part in ("1", "both"):
-                result_part1 = part1(data)
-                print(f"🎄 Part 1 Result: {result_part1}")
-                if args.submit:
-                    try:
-                        print("📤 Submitting Part 1 answer to Santa’s server...")
-                        submission_result = elf.submit_answer(
-                            year, day, 1, result_part1
+            source = input_file
+            if not input_file.exists():
+                # Try to fetch the input
+                print("📥 Input file not found. The elves are fetching it for you...")
+                try:
+                    input_text = elf.get_input(year, day)
+                    input_file.write_text(input_text)
+                    print("✅ Input fetched, saved, and ready to use!")
+                except elf.InputFetchError as e:
+                    print(f"❌ Failed to fetch input: {e}")
+                    source = None
+                except Exception as e:
+                    print(f"❌ An unexpected error occurred: {e}")
+                    source = None
+
+        # Answer parts whose solution and input are unchanged straight from the cache
+        cache = None
+        cache_keys: dict[int, str] = {}
+        if isinstance(source, Path) and not (args.mem or args.profile):
+            from elf.models import CachedResult
+            from elf.result_cache import ResultCache, input_digest, result_keys
+
+            cache = ResultCache()
+            cache_keys = result_keys(
+                solution_file_for(part1, year, day).path, input_digest(source)
+            )
+            if not args.no_cache:
+                for number, func in list(parts):
+                    cached = cache.get(cache_keys[number])
+                    if cached is not None:
+                        note = f" (cached, originally took {cached.elapsed:.6f}s)"
+                        report(number, cached.answer, note)
+                        parts.remove((number, func))
+            if not parts:
+                return
+            streaming &= {number for number, _ in parts}
+
+        def remember(number: int, result: Any, elapsed: float) -> None:
+            if cache is not None and result is not None:
+                cache.put(
+                    cache_keys[number],
+                    CachedResult(year, day, number, str(result), elapsed),
+                )
+
+        # Read the whole input once for the parts that want a list of lines
+        data: list[str] = []
+        mapped = bytes_parse and isinstance(source, Path)
+        needs_lines = not (stream_parse or mapped) and len(streaming) < len(parts)
+        if source is not None and needs_lines:
+            if source is sys.stdin:
+                data = elf.parse_input(sys.stdin.read())
+            else:
+                data = elf.read_input_file(source)
+            print("🎁 Input data found and ready for use!")
+        elif mapped:
+            print("🗺️ Input data mapped and ready for use!")
+        elif source is not None:
+            print("🌊 Streaming input data line by line!")
+
+        if source is not None and (data or not needs_lines):
+            context: dict[str, Any] = {}
+            parsed = None
+            if parse is not None:
+                if mapped:
+                    read, raw = parse_input_file, source
+                else:
+                    read = apply_parse
+                    raw = iter_input_lines(source) if stream_parse else data
+                if limited:
+                    # The parse hook is held to the same limits as the parts
+                    outcome = run_isolated(
+                        read,
+                        parse,
+                        raw,
+                        timeout=args.timeout,
+                        max_memory_mb=args.max_memory,
+                    )
+                    if outcome.status != RunStatus.OK:
+                        print(f"❌ Parse: {outcome.error}")
+                        sys.exit(1)
+                    parsed = outcome.value
+                else:
+                    parsed = read(parse, raw)
+
+            jobs = max(args.jobs, 2 if args.parallel else 1)
+            parallel = jobs > 1 and len(parts) > 1
+            if parallel and (args.mem or args.profile or streaming or limited):
+                print(
+                    "⚠️ --mem, --profile, limits and streaming parts run one at a time."
+                )
+                parallel = False
+            if limited and args.mem:
+                print("⚠️ --mem is not measured for parts run under a limit.")
+            if parallel and not can_run_in_parallel(*(func for _, func in parts)):
+                print("⚠️ The parts share a context, so they run one after another.")
+                parallel = False
+
+            if parallel:
+                print(f"🛷 Running {len(parts)} parts in {jobs} worker processes...")
+                start_time = time.perf_counter()
+                part_seconds = 0.0
+                for number, result, elapsed in run_parts_parallel(
+                    solution_file_for(part1, year, day),
+                    (number for number, _ in parts),
+                    parsed if parse is not None else data,
+                    jobs,
+                ):
+                    part_seconds += elapsed
+                    remember(number, result, elapsed)
+                    report(number, result)
+                wall_seconds = time.perf_counter() - start_time
+                print(
+                    f"⏱️ Parts took {part_seconds:.6f}s in total, "
+                    f"finished in {wall_seconds:.6f}s wall time 🎅."
+                )
+            else:
+                # Run the specified parts
+                stopped = False
+                for number, func in parts:
+                    if parse is not None:
+                        part_data = parsed
+                    elif number in streaming:
+                        part_data = iter_input_lines(source)
+                    else:
+                        part_data = data
+                    func = with_profile(func, number)
+                    start_time = time.perf_counter()
+                    if limited:
+                        outcome = call_part_isolated(
+                            func,
+                            part_data,
+                            context,
+                            timeout=args.timeout,
+                            max_memory_mb=args.max_memory,
                         )
-                        print(submission_result.message)
-                    except elf.SubmissionError as e:
-                        print(f"❌ Submission failed: {e}")
+                        if outcome.status != RunStatus.OK:
+                            print(f"❌ Part {number}: {outcome.error}")
+                            stopped = True
+                            continue
+                        result = outcome.value
+                    elif args.mem:
+                        from elf.bench import format_memory, measure_memory
 
-            if args.part in ("2", "both"):
-                result_part2 = part2(data)
-                print(f"🎄 Part 2 Result: {result_part2}")
-                if args.submit:
-                    try:
-                        print("📤 Submitting Part 2 answer to Santa’s server...")
-                        submission_result = elf.submit_answer(
-                            year, day, 2, result_part2
+                        result, usage = measure_memory(
+                            call_part, func, part_data, context
                         )
-                        print(submission_result.message)
-                    except elf.SubmissionError as e:
-                        print(f"❌ Submission failed: {e}")
+                        print(format_memory(func.__name__, usage))
+                    else:
+                        result = call_part(func, part_data, context)
+                    remember(number, result, time.perf_counter() - start_time)
+                    report(number, result)
+                if stopped:
+                    sys.exit(1)
         else:
             print("🛑 No input data available. Please check the setup and try again.")
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Any
 
 import elf
 from elf.templates.args import args
@@ -8,14 +9,22 @@ from elf.templates.args import args
 
 
 @elf.timer()
-def part1(data: list[str]) -> int | str:
+def parse(data: list[str]) -> Any:
+    """🎁 Parse the puzzle input once for both parts 🎁"""
+    # TODO: Turn the input lines into whatever both parts need
+    return data
+
+
+@elf.timer()
+def part1(data: Any) -> int | str:
     """🎅 Solve Part 1 of the puzzle 🎅"""
     # TODO: Implement the solution for Part 1
+    # Add a `context: dict[str, Any]` parameter to share results with Part 2
     return len(data)
 
 
 @elf.timer()
-def part2(data: list[str]) -> int | str:
+def part2(data: Any) -> int | str:
     """🎅 Solve Part 2 of the puzzle 🎅"""
     # TODO: Implement the solution for Part 2
     return len(data)
@@ -25,4 +34,4 @@ if __name__ == "__main__":
     base_dir = Path(__file__).parent
 
     # Run the arguments handler to test, fetch input, and/or submit answers
-    args(part1=part1, part2=part2, base_dir=base_dir)
+    args(part1=part1, part2=part2, base_dir=base_dir, parse=parse)
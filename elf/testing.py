@@ -4,7 +4,8 @@ from typing import Any
 
 from elf.input import parse_input, read_input_file
 from elf.messages import get_negative_message, get_positive_message
-from elf.models import TestResult  # Import the TestResult dataclass
+from elf.models import IsolatedOutcome, RunStatus, TestResult
+from elf.runner import apply_parse, call_part
 
 # 🎄 Elf Testing Laboratory 🎄 #
 
@@ -26,8 +27,16 @@ def check_part1_solution(
     part1_func: Callable[[list[str]], Any],
     test_input: str | Path,
     expected_output: str | Path,
+    parse: Callable[[list[str]], Any] | None = None,
+    context: dict[str, Any] | None = None,
 ) -> TestResult:
-    """Checks the test input against the expected output for Part 1."""
+    """Checks the test input against the expected output for Part 1.
+
+    The optional `parse` hook and shared `context` work as in `elf.runner`;
+    without a `context`, a part that asks for one gets a fresh dict.
+    """
+    if context is None:
+        context = {}
     test_data = (
         parse_input(test_input)
         if isinstance(test_input, str)
@@ -39,9 +48,11 @@ def check_part1_solution(
         message = (
             "🎄 Part 1 expected output is missing. Please check the expected output."
         )
-        return TestResult(part=1, passed=False, expected="", actual="", message=message)
+        return TestResult(
+            part=1, passed=False, expected="", actual="", message=message, skipped=True
+        )
 
-    result = part1_func(test_data)
+    result = call_part(part1_func, apply_parse(parse, test_data), context)
     actual_result = str(result)
     expected_result = expected_output_lines[0]
 
@@ -68,8 +79,16 @@ def check_part2_solution(
     part2_func: Callable[[list[str]], Any],
     test_input: str | Path,
     expected_output: str | Path,
+    parse: Callable[[list[str]], Any] | None = None,
+    context: dict[str, Any] | None = None,
 ) -> TestResult:
-    """Checks the test input against the expected output for Part 2."""
+    """Checks the test input against the expected output for Part 2.
+
+    The optional `parse` hook and shared `context` work as in `elf.runner`;
+    without a `context`, a part that asks for one gets a fresh dict.
+    """
+    if context is None:
+        context = {}
     test_data = (
         parse_input(test_input)
         if isinstance(test_input, str)
@@ -79,9 +98,11 @@ def check_part2_solution(
 
     if len(expected_output_lines) < 2 or not expected_output_lines[1]:
         message = "🎄 Part 2 expected output is missing or empty. Skipping Part 2 test."
-        return TestResult(part=2, passed=False, expected="", actual="", message=message)
+        return TestResult(
+            part=2, passed=False, expected="", actual="", message=message, skipped=True
+        )
 
-    result = part2_func(test_data)
+    result = call_part(part2_func, apply_parse(parse, test_data), context)
     actual_result = str(result)
     expected_result = expected_output_lines[1]
 
@@ -104,23 +125,59 @@ def check_part2_solution(
     )
 
 
-def run_tests(
-    part1_func, part2_func, base_dir: Path, test_input: str, expected_output: str
-) -> None:
-    # Use test_input and expected_output in your test cases
-    part1_result = part1_func(test_input.splitlines())
-    part2_result = part2_func(test_input.splitlines())
+def outcome_test_result(part: int, outcome: IsolatedOutcome) -> TestResult:
+    """Turns an isolated run into a TestResult, reporting timeouts and errors as failures."""
+    if outcome.status == RunStatus.OK:
+        return outcome.value
+    return TestResult(
+        part=part, passed=False, expected="", actual="", message=f"❌ {outcome.error}"
+    )
 
-    expected_output_lines = expected_output.splitlines()
-    expected_part1 = expected_output_lines[0] if len(expected_output_lines) > 0 else ""
-    expected_part2 = expected_output_lines[1] if len(expected_output_lines) > 1 else ""
 
-    if str(part1_result) == expected_part1:
-        print("✅ Part 1 test passed!")
-    else:
-        print(f"❌ Part 1 test failed: Expected {expected_part1}, got {part1_result}")
+def _check_returning_context(
+    check: Callable[..., TestResult],
+    part_func: Callable[..., Any],
+    test_input: str | Path,
+    expected_output: str | Path,
+    parse: Callable[[list[str]], Any] | None,
+    context: dict[str, Any] | None,
+) -> tuple[TestResult, dict[str, Any] | None]:
+    result = check(part_func, test_input, expected_output, parse=parse, context=context)
+    return result, context
 
-    if str(part2_result) == expected_part2:
-        print("✅ Part 2 test passed!")
-    else:
-        print(f"❌ Part 2 test failed: Expected {expected_part2}, got {part2_result}")
+
+def check_solution_isolated(
+    part: int,
+    part_func: Callable[..., Any],
+    test_input: str | Path,
+    expected_output: str | Path,
+    parse: Callable[[list[str]], Any] | None = None,
+    context: dict[str, Any] | None = None,
+    timeout: float | None = None,
+    max_memory_mb: int | None = None,
+) -> TestResult:
+    """Checks a part like `check_part1_solution`/`check_part2_solution`, in a child process.
+
+    A part that runs past `timeout` or allocates more than `max_memory_mb` fails
+    with "TIMEOUT after Xs" or "MEMORY LIMIT at Y MB" instead of hanging the run.
+    """
+    from elf.isolation import run_isolated
+
+    check = check_part1_solution if part == 1 else check_part2_solution
+    outcome = run_isolated(
+        _check_returning_context,
+        check,
+        part_func,
+        test_input,
+        expected_output,
+        parse,
+        context,
+        timeout=timeout,
+        max_memory_mb=max_memory_mb,
+    )
+    if outcome.status != RunStatus.OK:
+        return outcome_test_result(part, outcome)
+    result, child_context = outcome.value
+    if context is not None and child_context is not None:
+        context.update(child_context)
+    return result
@@ -1,11 +1,18 @@
+import inspect
+import mmap
+import os
+import tempfile
 import time
-from collections.abc import Callable
-from functools import wraps
+from collections.abc import Callable, Iterable, Iterator
+from functools import cache, wraps
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO, get_args, get_origin, get_type_hints
 
 # 🎁 Elf Utility Functions 🎁 #
 
+# Set on `timer` wrappers so `elf.bench` can strip them before repeated runs
+TIMER_MARKER = "__elf_timer__"
+
 
 def parse_input(input_str: str) -> list[str]:
     """Parses the input string into a list of lines.
@@ -21,15 +28,34 @@ def parse_input(input_str: str) -> list[str]:
     return input_str.strip().splitlines()
 
 
-def timer(enabled: bool = True, logger: Callable[[str], None] | None = None):
+def timer(
+    enabled: bool = True,
+    logger: Callable[[str], None] | None = None,
+    repeat: int = 1,
+    warmup: int = 0,
+    disable_gc: bool = False,
+    memory: bool = False,
+):
     """Decorator to measure the execution time of functions.
 
     🕒 Timing the magic of your functions! ✨
 
+    With `repeat` above 1 or any `warmup`, the function is benchmarked with
+    `elf.bench.benchmark` instead: every run gets a fresh copy of the
+    arguments, and min/median/p95/stddev are reported.
+
+    With `memory=True`, the tracemalloc peak, net allocated blocks and max RSS
+    growth are reported too. A single timed run then includes tracemalloc's
+    overhead; benchmarked runs measure memory in one extra run instead.
+
     Args:
         enabled (bool): Whether to enable timing.
         logger (Optional[Callable[[str], None]]): A logging function to output the timing message.
             If `None`, the message will be printed to the console.
+        repeat (int): Number of measured runs.
+        warmup (int): Number of untimed runs before measuring.
+        disable_gc (bool): Turn off the garbage collector during measured runs.
+        memory (bool): Whether to also report memory usage.
 
     Returns:
         Callable[[Callable[..., Any]], Callable[..., Any]]: The decorator that wraps the function.
@@ -38,11 +64,39 @@ def timer(enabled: bool = True, logger: Callable[[str], None] | None = None):
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if enabled and (repeat > 1 or warmup > 0 or memory):
+                # Imported here to keep `import elf` light for plain timing
+                from elf.bench import (
+                    benchmark,
+                    format_benchmark,
+                    format_memory,
+                    measure_memory,
+                )
+
+            if enabled and (repeat > 1 or warmup > 0):
+                stats = benchmark(
+                    func,
+                    *args,
+                    warmup=warmup,
+                    repeat=repeat,
+                    disable_gc=disable_gc,
+                    memory=memory,
+                    **kwargs,
+                )
+                (logger or print)(format_benchmark(stats))
+                if stats.memory is not None:
+                    (logger or print)(format_memory(func.__name__, stats.memory))
+                return stats.result
+
             if enabled:
                 start_time = time.perf_counter()
             else:
                 start_time = None  # Ensure start_time is always defined
-            result = func(*args, **kwargs)
+            usage = None
+            if enabled and memory:
+                result, usage = measure_memory(func, *args, **kwargs)
+            else:
+                result = func(*args, **kwargs)
             if enabled:
                 end_time = time.perf_counter()
                 duration = end_time - start_time if start_time is not None else 0
@@ -53,8 +107,11 @@ def timer(enabled: bool = True, logger: Callable[[str], None] | None = None):
                     logger(message)
                 else:
                     print(message)
+                if usage is not None:
+                    (logger or print)(format_memory(func.__name__, usage))
             return result
 
+        setattr(wrapper, TIMER_MARKER, True)
         return wrapper
 
     return decorator
@@ -87,3 +144,175 @@ def read_expected_output(base_dir: Path) -> str:
         raise FileNotFoundError(
             "🛑 No expected_output.txt found. Please add expected output data."
         )
+
+
+@cache
+def _get_umask() -> int:
+    """Returns the process umask, looked up once on first use."""
+    # Linux reports it without changing it; os.umask can only query by setting
+    try:
+        with open("/proc/self/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except OSError:
+        pass
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+def atomic_write_text(path: Path, text: str, encoding: str = "utf-8") -> None:
+    """Write text to a file atomically.
+
+    The text is written to a temporary file in the same directory and then
+    moved into place, so readers never see a half-written file. 🎁
+
+    Args:
+        path (Path): The destination file.
+        text (str): The text to write.
+        encoding (str): The text encoding. Defaults to "utf-8".
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w", encoding=encoding) as tmp_file:
+            tmp_file.write(text)
+        # mkstemp creates private files; give it the permissions open() would
+        os.chmod(tmp_name, 0o666 & ~_get_umask())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def iter_line_spans(buffer: bytes | bytearray | mmap.mmap) -> Iterator[tuple[int, int]]:
+    """Yields the (start, end) offsets of each line in a bytes-like buffer.
+
+    🎄 Walking the input line by line without copying a single one! 🎁
+
+    Line endings (`\\n` or `\\r\\n`) are excluded from the spans, and a trailing
+    newline does not produce an empty last line.
+
+    Args:
+        buffer (bytes | bytearray | mmap.mmap): The buffer to scan.
+
+    Yields:
+        tuple[int, int]: Offsets such that `buffer[start:end]` is the line.
+    """
+    find = buffer.find
+    size = len(buffer)
+    start = 0
+    while start < size:
+        newline = find(b"\n", start)
+        if newline == -1:
+            newline = size
+        end = newline
+        if end > start and buffer[end - 1] == 13:  # b"\r"
+            end -= 1
+        yield start, end
+        start = newline + 1
+
+
+def iter_lines_bytes(buffer: bytes | bytearray | mmap.mmap) -> Iterator[bytes]:
+    """Yields each line of a bytes-like buffer as `bytes`, without decoding it.
+
+    Each line is copied on its own, so nothing keeps the buffer exported: a
+    loop may stop early inside `open_input_buffer` and the mmap still closes.
+    Use `iter_line_spans` to avoid even the per-line copies.
+
+    Args:
+        buffer (bytes | bytearray | mmap.mmap): The buffer to scan.
+
+    Yields:
+        bytes: Each line, without its line ending.
+    """
+    for start, end in iter_line_spans(buffer):
+        yield buffer[start:end]
+
+
+def accepts_stream(func: Callable[..., Any]) -> bool:
+    """Checks whether a solution part declares that it accepts a stream of lines.
+
+    A part opts in to streaming by annotating its first parameter as
+    `Iterable[str]` or `Iterator[str]` instead of `list[str]`.
+
+    Args:
+        func (Callable[..., Any]): The solution part, optionally wrapped by `timer`.
+
+    Returns:
+        bool: True if the part can be fed a lazy line iterator.
+    """
+    target = inspect.unwrap(func)
+    try:
+        hints = get_type_hints(target)
+        parameters = list(inspect.signature(target).parameters)
+    except (NameError, TypeError, ValueError):
+        return False
+    if not parameters:
+        return False
+    return get_origin(hints.get(parameters[0])) in (Iterable, Iterator)
+
+
+def accepts_bytes(func: Callable[..., Any]) -> bool:
+    """Checks whether a parse hook declares that it reads the raw input bytes.
+
+    A hook opts in by annotating its first parameter as `bytes`. It is then
+    given the memory-mapped input file (see `elf.input.open_input_buffer`),
+    or the joined lines encoded as UTF-8 when only lines are at hand, such as
+    for test inputs.
+
+    Args:
+        func (Callable[..., Any]): The parse hook, optionally wrapped by `timer`.
+
+    Returns:
+        bool: True if the hook should be fed bytes instead of lines.
+    """
+    target = inspect.unwrap(func)
+    try:
+        hints = get_type_hints(target)
+        parameters = list(inspect.signature(target).parameters)
+    except (NameError, TypeError, ValueError):
+        return False
+    if not parameters:
+        return False
+    hint = hints.get(parameters[0])
+    return hint is bytes or bytes in get_args(hint)
+
+
+def iter_input_lines(
+    source: str | Path | TextIO, chunk_size: int = 1 << 16
+) -> Iterator[str]:
+    """Lazily yields the lines of an input file or stream.
+
+    🎄 Unwrapping the input one line at a time, so even giant inputs fit! 🎁
+
+    Like `parse_input`, blank lines at the start and end of the input are
+    skipped and line endings are removed, but nothing is held in memory
+    beyond the current chunk.
+
+    Args:
+        source (str | Path | TextIO): A file path, or an open text stream such as `sys.stdin`.
+        chunk_size (int): The read buffer size in bytes when opening a file path.
+
+    Yields:
+        str: Each line of the input.
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, encoding="utf-8", buffering=chunk_size) as file:
+            yield from iter_input_lines(file)
+        return
+
+    started = False
+    pending_blank_lines = 0
+    for raw_line in source:
+        line = raw_line.rstrip("\r\n")
+        if not line.strip():
+            if started:
+                pending_blank_lines += 1
+            continue
+        started = True
+        for _ in range(pending_blank_lines):
+            yield ""
+        pending_blank_lines = 0
+        yield line
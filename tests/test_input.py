@@ -0,0 +1,53 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from elf.input import open_input_buffer, read_input_bytes
+from elf.runner import apply_parse
+from elf.utils import accepts_bytes, iter_lines_bytes
+
+
+class InputBufferTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "input.txt"
+        self.path.write_bytes(b"a\r\nbb\r\nccc\r\n")
+
+    def test_lines_without_endings(self):
+        with open_input_buffer(self.path) as buffer:
+            self.assertEqual(list(iter_lines_bytes(buffer)), [b"a", b"bb", b"ccc"])
+
+    def test_break_out_of_loop(self):
+        # The mmap must still close while the line and the generator are alive
+        with open_input_buffer(self.path) as buffer:
+            lines = iter_lines_bytes(buffer)
+            for line in lines:
+                break
+        self.assertEqual(line, b"a")
+
+    def test_empty_file(self):
+        self.path.write_bytes(b"")
+        self.assertEqual(read_input_bytes(self.path), b"")
+
+
+class BytesParseTest(unittest.TestCase):
+    def test_accepts_bytes(self):
+        def parse_bytes(data: bytes) -> int:
+            return len(data)
+
+        def parse_lines(data: list[str]) -> int:
+            return len(data)
+
+        self.assertTrue(accepts_bytes(parse_bytes))
+        self.assertFalse(accepts_bytes(parse_lines))
+
+    def test_lines_are_joined_for_bytes_parse(self):
+        def parse(data: bytes) -> bytes:
+            return data
+
+        self.assertEqual(apply_parse(parse, ["ab", "c"]), b"ab\nc")
+
+
+if __name__ == "__main__":
+    unittest.main()